@@ -1,9 +1,10 @@
 from datetime import datetime, timedelta, timezone
-from typing import List
+from typing import List, Sequence
 from infrastructure.eds_requests import EdsRequests
 from infrastructure.postgres_database import PostgresDatabase
+from infrastructure.time_series import TimeSeries, TimeSeriesPoints
 from application.use_cases.use_Case import UseCase
-from domain import Co2EmissionPoint, CO2EmissionsRepository
+from domain import Co2EmissionPoint, CO2EmissionsRepository, EmissionRecord
 from pydantic.dataclasses import dataclass
 
 
@@ -24,6 +25,29 @@ class GetCarbonEmissionIntensityResponse:
     def __init__(self, emission_points: List[Co2EmissionPoint], latest_available_emission: datetime) -> None:
         self.emission_points = emission_points
         self.latest_available_emission = latest_available_emission
+        self.emission_series = TimeSeries.from_pairs([])
+
+    @staticmethod
+    def from_series(emission_series: TimeSeries, latest_available_emission: datetime) -> 'GetCarbonEmissionIntensityResponse':
+        """Creates the response without emission points, as the series is used for scheduling
+        and the validated emission points are only created by the API with "with_emission_points".
+        """
+        response = GetCarbonEmissionIntensityResponse([], latest_available_emission)
+        response.emission_series = emission_series
+        return response
+
+    @staticmethod
+    def from_records(emission_records: List[EmissionRecord], latest_available_emission: datetime) -> 'GetCarbonEmissionIntensityResponse':
+        return GetCarbonEmissionIntensityResponse.from_series(TimeSeries.from_pairs(emission_records), latest_available_emission)
+
+    @property
+    def emission_records(self) -> Sequence[EmissionRecord]:
+        return TimeSeriesPoints(self.emission_series, EmissionRecord)
+
+    def with_emission_points(self) -> 'GetCarbonEmissionIntensityResponse':
+        """Creates the validated emission points of the series, which are serialized by the API."""
+        self.emission_points = [emission_record.to_point() for emission_record in self.emission_records]
+        return self
 
 class GetCarbonEmissionIntensityUseCase(UseCase[GetCarbonEmissionIntensityRequest, GetCarbonEmissionIntensityResponse]):
     def __init__(self, fallback: CO2EmissionsRepository) -> None:
@@ -89,6 +113,6 @@ class GetCarbonEmissionIntensityUseCase(UseCase[GetCarbonEmissionIntensityReques
             emissions = EdsRequests().get_co2_emission_prognosis(latest_emission_point_time)
             self.db.insert_emissions(emissions)
 
-        emission_points = self.db.get_emissions(request.start_time, request.ascending)
-        print(f'Found {len(emission_points)} emissions after {request.start_time}')
-        return GetCarbonEmissionIntensityResponse(emission_points, datetime.utcnow())
\ No newline at end of file
+        emission_series = self.db.get_emission_series(request.start_time, request.ascending)
+        print(f'Found {len(emission_series)} emissions after {request.start_time}')
+        return GetCarbonEmissionIntensityResponse.from_series(emission_series, datetime.utcnow())
\ No newline at end of file
@@ -1,9 +1,10 @@
-from typing import List
+from typing import List, Sequence
 from application.use_cases.use_Case import UseCase
 from infrastructure.eds_requests import EdsRequests
-from infrastructure.eds_requests import PricePoint
+from domain import PricePoint, PriceRecord
 from datetime import datetime, timedelta, timezone
 from infrastructure.postgres_database import PostgresDatabase
+from infrastructure.time_series import TimeSeries, TimeSeriesPoints
 from pydantic.dataclasses import dataclass
 
 from opentelemetry import trace
@@ -30,6 +31,29 @@ class GetSpotPricesResponse:
     ):
         self.price_points = price_points
         self.latest_available_spot_price = latest_available_spot_price
+        self.price_series = TimeSeries.from_pairs([])
+
+    @staticmethod
+    def from_series(price_series: TimeSeries, latest_available_spot_price: datetime) -> 'GetSpotPricesResponse':
+        """Creates the response without price points, as the series is used for scheduling
+        and the validated price points are only created by the API with "with_price_points".
+        """
+        response = GetSpotPricesResponse([], latest_available_spot_price)
+        response.price_series = price_series
+        return response
+
+    @staticmethod
+    def from_records(price_records: List[PriceRecord], latest_available_spot_price: datetime) -> 'GetSpotPricesResponse':
+        return GetSpotPricesResponse.from_series(TimeSeries.from_pairs(price_records), latest_available_spot_price)
+
+    @property
+    def price_records(self) -> Sequence[PriceRecord]:
+        return TimeSeriesPoints(self.price_series, PriceRecord)
+
+    def with_price_points(self) -> 'GetSpotPricesResponse':
+        """Creates the validated price points of the series, which are serialized by the API."""
+        self.price_points = [price_record.to_point() for price_record in self.price_records]
+        return self
 
 class GetSpotPricesUseCase(UseCase[GetSpotPricesRequest, GetSpotPricesResponse]):
     def __init__(self) -> None:
@@ -96,8 +120,8 @@ class GetSpotPricesUseCase(UseCase[GetSpotPricesRequest, GetSpotPricesResponse])
                 price_points = EdsRequests().get_prices(latest_price_point_time)
                 self.db.insert_prices(price_points)
 
-            price_points = self.db.get_prices(request.start_time, request.ascending)
-            print(f'Found {len(price_points)} price points after {request.start_time}')
-            return GetSpotPricesResponse(
-                price_points, latest_available_spot_price
+            price_series = self.db.get_price_series(request.start_time, request.ascending)
+            print(f'Found {len(price_series)} price points after {request.start_time}')
+            return GetSpotPricesResponse.from_series(
+                price_series, latest_available_spot_price
             )
@@ -27,7 +27,7 @@ class ScheduleTaskUseCase:
     def do(self, request: ScheduleTaskRequest) -> ScheduleTaskResponse:
         with tracer.start_as_current_span("ScheduleTask"):
             getSpotPricesUseCase = GetSpotPricesUseCase()
-            price_points = getSpotPricesUseCase.do(GetSpotPricesRequest(datetime.now())).price_points
+            price_points = list(getSpotPricesUseCase.do(GetSpotPricesRequest(datetime.now())).price_records)
             optimal_time_calculator = OptimalTimeCalculator()
             optimal_time = optimal_time_calculator.calculate_optimal_time(price_points, timedelta(seconds=request.duration))
             return ScheduleTaskResponse(optimal_time)
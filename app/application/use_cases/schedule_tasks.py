@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import os
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional
+from typing import Dict, List, Literal, Optional
+from pydantic import PositiveFloat, PositiveInt
 from pydantic.dataclasses import dataclass
 
 from application.use_cases.get_spot_price_task import GetSpotPricesRequest, GetSpotPricesResponse
@@ -17,14 +19,22 @@ from infrastructure import (
     Schedule as ModelSchedule,
     DatetimeInterval as ModelDatetimeInterval,
     Scheduler, SpotPriceFunction,
+    SearchScheduler,
+    BranchAndBoundScheduler,
+    BeamSearchScheduler,
+    CoarseToFineScheduler,
+    GreedyScheduler,
+    LocalSearchImprover,
+    SearchBudget,
+    SearchStatistics as ModelSearchStatistics,
     LowestPriceRecommender,
     TaskValidatorDisjunction, TaskValidatorConjunction,
     TaskValidator,
     TaskValidatorSplitter,
-    TaskValidatorSplit,
-    Co2EmissionPoint
+    TaskValidatorSplit
 )
 from infrastructure.co2_emission_function import Co2EmissionFunction
+from infrastructure.cost_curve_cache import CostCurveCache, cost_curve_cache
 
 from opentelemetry import trace
 tracer = trace.get_tracer(__name__)
@@ -206,10 +216,23 @@ class Schedule:
             maximum_power_consumption = None
         )
 
+Solver = Literal["exhaustive", "branch_and_bound", "beam_search", "coarse_to_fine", "greedy"]
+
 @dataclass
 class ScheduleTasksRequest:
     tasks: List[Task]
     schedule: Optional[Schedule] = None
+    # Defaults to "exhaustive", or "greedy" for more tasks than the GREEDY_TASK_THRESHOLD environment variable.
+    # Any other solver is rejected when the request is validated.
+    solver: Optional[Solver] = None
+    # The number of partial schedules kept by the beam search, defaults to the BEAM_WIDTH environment variable.
+    beam_width: Optional[PositiveInt] = None
+    # The seconds the search may run, defaults to the SCHEDULE_TIME_LIMIT environment variable.
+    time_limit: Optional[PositiveFloat] = None
+    # The candidate schedules the search may create, defaults to the SCHEDULE_MAXIMUM_CANDIDATES environment variable.
+    maximum_candidates: Optional[PositiveInt] = None
+    # The seconds the start times are snapped to, e.g. 300 for 5 minutes, defaults to the SCHEDULE_RESOLUTION environment variable.
+    resolution: Optional[PositiveInt] = None
 
     @property
     def task_models(self) -> List[ModelTask]:
@@ -221,20 +244,73 @@ class ScheduleTasksRequest:
             return None
         return self.schedule.to_model
 
+    @property
+    def start_time_resolution(self) -> Optional[timedelta]:
+        # The resolution of the request is validated to be positive, so only the environment variable is checked here.
+        if self.resolution is not None:
+            return timedelta(seconds=self.resolution)
+        if "SCHEDULE_RESOLUTION" not in os.environ:
+            return None
+
+        resolution = int(os.environ["SCHEDULE_RESOLUTION"])
+        if resolution <= 0:
+            raise ValueError(f'The SCHEDULE_RESOLUTION environment variable must be positive, but was {resolution}')
+        return timedelta(seconds=resolution)
+
+    @property
+    def budget(self) -> SearchBudget:
+        time_limit = self.time_limit
+        if time_limit is None and "SCHEDULE_TIME_LIMIT" in os.environ:
+            time_limit = float(os.environ["SCHEDULE_TIME_LIMIT"])
+
+        maximum_candidates = self.maximum_candidates
+        if maximum_candidates is None and "SCHEDULE_MAXIMUM_CANDIDATES" in os.environ:
+            maximum_candidates = int(os.environ["SCHEDULE_MAXIMUM_CANDIDATES"])
+
+        return SearchBudget(
+            None if time_limit is None else timedelta(seconds=time_limit),
+            maximum_candidates
+        )
+
+@dataclass
+class SearchStatistics:
+    candidates: int
+    schedules: int
+    elapsed: float
+    budget_exhausted: bool
+    # How much the total price may be above the lowest total price, only reported by the "coarse_to_fine" solver.
+    tolerance: Optional[float] = None
+
+    @staticmethod
+    def from_model(model: ModelSearchStatistics) -> SearchStatistics:
+        return SearchStatistics(
+            candidates = model.candidates,
+            schedules = model.schedules,
+            elapsed = model.elapsed.total_seconds(),
+            budget_exhausted = model.budget_exhausted,
+            tolerance = model.tolerance
+        )
+
 @dataclass
 class ScheduleTasksResponse:
     tasks: List[Task]
     schedule: Optional[Schedule] = None
+    # Whether the schedule is proven to have the lowest price, it is not if e.g. the search budget was exhausted.
+    optimal: Optional[bool] = None
+    statistics: Optional[SearchStatistics] = None
 
 class ScheduleTasksUseCase(UseCase[ScheduleTasksRequest, ScheduleTasksResponse]):
     def __init__(
         self,
         get_spot_prices: UseCase[GetSpotPricesRequest, GetSpotPricesResponse],
-        get_emission_points: UseCase[GetCarbonEmissionIntensityRequest, GetCarbonEmissionIntensityResponse]
+        get_emission_points: UseCase[GetCarbonEmissionIntensityRequest, GetCarbonEmissionIntensityResponse],
+        cost_curves: CostCurveCache = cost_curve_cache
     ) -> None:
         with tracer.start_as_current_span("InitScheduleTasksUseCase"):
             self.get_spot_prices = get_spot_prices
             self.get_emission_points = get_emission_points
+            # The cost curves are shared by the schedulers of every request.
+            self.cost_curves = cost_curves
 
     def do(self, request: ScheduleTasksRequest) -> ScheduleTasksResponse:
         with tracer.start_as_current_span("ScheduleTask"):
@@ -243,9 +319,7 @@ class ScheduleTasksUseCase(UseCase[ScheduleTasksRequest, ScheduleTasksResponse])
                 price_response = self.get_spot_prices.do(
                     GetSpotPricesRequest(datetime.now(tz=timezone.utc), ascending=True)
                 )
-                price_points = price_response.price_points
-
-                for price_point in price_points:
+                for price_point in price_response.price_records:
                     print(f'Price at {price_point.time} is {price_point.price}')
 
             with tracer.start_as_current_span("GetEmissionPoints"):
@@ -253,42 +327,62 @@ class ScheduleTasksUseCase(UseCase[ScheduleTasksRequest, ScheduleTasksResponse])
                 emission_response = self.get_emission_points.do(
                     GetCarbonEmissionIntensityRequest(datetime.now(tz=timezone.utc), ascending=True)
                 )
-                emission_points: List[Co2EmissionPoint] = emission_response.emission_points
 
             with tracer.start_as_current_span("CreateSportPriceFunction"):
                 # Create spot price function.
-                spot_price_function = SpotPriceFunction(price_points)
+                spot_price_function = SpotPriceFunction.from_series(price_response.price_series)
                 print(f'spot_price_function, min: {spot_price_function.min_domain} max: {spot_price_function.max_domain}')
 
             with tracer.start_as_current_span("CreateEmissionFunction"):
                 # Create emission function
-                emission_function = Co2EmissionFunction(emission_points)
+                emission_function = Co2EmissionFunction.from_series(emission_response.emission_series)
                 print(f'emission_function, min: {emission_function.min_domain} max: {emission_function.max_domain}')
 
             with tracer.start_as_current_span("CreateScheduler"):
                 # Create scheduler and base schedule.
-                scheduler = Scheduler(spot_price_function)
+                scheduler = self.create_scheduler(
+                    request.solver, spot_price_function, request.beam_width, request.budget, len(request.tasks)
+                )
+                scheduler.resolution = request.start_time_resolution
                 base_schedule = request.schedule_model
                 if base_schedule is None:
                     base_schedule = ModelSchedule()
 
             with tracer.start_as_current_span("ScheduleNewScheduler"):
-                # Schedule new schedule.
-                new_schedules = scheduler.schedule_tasks(
+                # Schedule new schedule, the schedules are generated as they are consumed by the recommender.
+                new_schedules = scheduler.generate_schedules(
                     request.task_models, base_schedule
                 )
 
             with tracer.start_as_current_span("GetRecommendation"):
                 # Get the recommendation.
-                if len(new_schedules) == 0:
+                # TODO: Recommender can be abstracted away as a dependecy on the abstract reommender class as a ctor parameter.
+                lowest_price_recommender = LowestPriceRecommender(spot_price_function, emission_function)
+                lowest_price_schedule = lowest_price_recommender.recommend(new_schedules)
+                print(lowest_price_recommender.highest_scheduled_task_prices)
+
+                if lowest_price_schedule is None:
                     recommendation = None
                 else:
-                    # TODO: Recommender can be abstracted away as a dependecy on the abstract reommender class as a ctor parameter.
-                    lowest_price_recommender = LowestPriceRecommender(spot_price_function, emission_function)
-                    print(lowest_price_recommender.highest_scheduled_task_prices)
+                    # The search solvers only return the best schedule, so they keep track of the highest prices.
+                    highest_prices = lowest_price_recommender.highest_scheduled_task_prices
+                    if isinstance(scheduler, SearchScheduler):
+                        highest_prices = scheduler.highest_scheduled_task_prices
+
+                    # A schedule which is not proven optimal might be improved by moving its tasks.
+                    if not scheduler.is_optimal():
+                        with tracer.start_as_current_span("ImproveRecommendation"):
+                            lowest_price_schedule = self.create_improver(scheduler).improve(
+                                lowest_price_schedule, base_schedule
+                            )
+                            for scheduled_task in lowest_price_schedule.tasks:
+                                task_id = scheduled_task.task.id
+                                if task_id is not None and (task_id not in highest_prices or highest_prices[task_id] < scheduled_task.cost):
+                                    highest_prices[task_id] = scheduled_task.cost
+
                     recommendation = Schedule.from_model(
-                        lowest_price_recommender.recommend(new_schedules),
-                        lowest_price_recommender.highest_scheduled_task_prices,
+                        lowest_price_schedule,
+                        highest_prices,
                         emission_function,
                         lowest_price_recommender.highest_scheduled_emission
                     )
@@ -297,4 +391,39 @@ class ScheduleTasksUseCase(UseCase[ScheduleTasksRequest, ScheduleTasksResponse])
             return ScheduleTasksResponse(
                 tasks=[],
                 schedule=recommendation,
-            )
\ No newline at end of file
+                optimal=scheduler.is_optimal(),
+                statistics=SearchStatistics.from_model(scheduler.statistics),
+            )
+
+    def create_improver(self, scheduler: Scheduler) -> LocalSearchImprover:
+        time_limit = LocalSearchImprover.DEFAULT_TIME_LIMIT
+        if "LOCAL_SEARCH_TIME_LIMIT" in os.environ:
+            time_limit = timedelta(seconds=float(os.environ["LOCAL_SEARCH_TIME_LIMIT"]))
+        return LocalSearchImprover(scheduler, time_limit)
+
+    def create_scheduler(
+        self,
+        solver: Optional[Solver],
+        price_function: SpotPriceFunction,
+        beam_width: Optional[int] = None,
+        budget: Optional[SearchBudget] = None,
+        task_count: int = 0
+    ) -> Scheduler:
+        # Generating every schedule grows factorially, so many tasks are scheduled greedily unless another solver is asked for.
+        if solver is None:
+            task_threshold = int(os.environ.get("GREEDY_TASK_THRESHOLD", GreedyScheduler.DEFAULT_TASK_THRESHOLD))
+            solver = "greedy" if task_count > task_threshold else "exhaustive"
+
+        if solver == "exhaustive":
+            return Scheduler(price_function, budget, self.cost_curves)
+        if solver == "branch_and_bound":
+            return BranchAndBoundScheduler(price_function, budget, self.cost_curves)
+        if solver == "beam_search":
+            if beam_width is None:
+                beam_width = int(os.environ.get("BEAM_WIDTH", BeamSearchScheduler.DEFAULT_WIDTH))
+            return BeamSearchScheduler(price_function, beam_width, budget, self.cost_curves)
+        if solver == "coarse_to_fine":
+            return CoarseToFineScheduler(price_function, budget=budget, cost_curves=self.cost_curves)
+        if solver == "greedy":
+            return GreedyScheduler(price_function, budget, self.cost_curves)
+        raise ValueError(f'Unknown solver "{solver}"')
\ No newline at end of file
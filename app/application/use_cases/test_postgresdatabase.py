@@ -3,7 +3,7 @@ from typing import List
 import psycopg2 as psycopg2
 from psycopg2.errors import UniqueViolation
 import pytest
-from domain import PricePoint
+from domain import PriceRecord
 from application.use_cases.get_spot_price_task import PostgresDatabase
 
 
@@ -31,7 +31,7 @@ class TestPostgresDatabase:
         db = PostgresDatabase()
 
         # Act
-        price_points = [PricePoint(datetime(2022, 1, 1), 100.0), PricePoint(datetime(2022, 1, 2), 101.0)]
+        price_points = [PriceRecord(datetime(2022, 1, 1), 100.0), PriceRecord(datetime(2022, 1, 2), 101.0)]
         db.insert_prices(price_points)
         db.cursor.execute("SELECT COUNT(*) FROM pricepoint")
         pre_result = db.cursor.fetchone()
@@ -48,7 +48,7 @@ class TestPostgresDatabase:
     def test_get_prices_success(self):
         # Arrange
         db = PostgresDatabase()
-        price_points = [PricePoint(datetime(2022, 1, 1), 100.0), PricePoint(datetime(2022, 1, 2), 101.0)]
+        price_points = [PriceRecord(datetime(2022, 1, 1), 100.0), PriceRecord(datetime(2022, 1, 2), 101.0)]
         db.insert_prices(price_points)
 
         # Act
@@ -63,10 +63,26 @@ class TestPostgresDatabase:
         assert result[1].price == 100.0
 
 
+    def test_get_price_series_success(self):
+        # Arrange
+        db = PostgresDatabase()
+        price_points = [PriceRecord(datetime(2022, 1, 1), 100.0), PriceRecord(datetime(2022, 1, 2), 101.0)]
+        db.insert_prices(price_points)
+
+        # Act
+        start_time = datetime(2022, 1, 1)
+        result = db.get_price_series(start_time, ascending=True)
+
+        # Assert
+        assert len(result) == 2
+        assert result.value_at(0) == 100.0
+        assert result.value_at(1) == 101.0
+
+
     def test_get_prices_failure(self):
         # Arrange
         db = PostgresDatabase()
-        price_points = [PricePoint(datetime(2022, 1, 1), 100.0), PricePoint(datetime(2022, 1, 2), 101.0)]
+        price_points = [PriceRecord(datetime(2022, 1, 1), 100.0), PriceRecord(datetime(2022, 1, 2), 101.0)]
         db.insert_prices(price_points)
 
         # Act
@@ -84,7 +100,7 @@ class TestPostgresDatabase:
         db = PostgresDatabase()
 
         # Act
-        price_points: List[PricePoint] = []
+        price_points: List[PriceRecord] = []
         db.insert_prices(price_points)
         db.cursor.execute("SELECT COUNT(*) FROM pricepoint")
         pre_result = db.cursor.fetchone()
@@ -117,7 +133,7 @@ class TestPostgresDatabase:
         db = PostgresDatabase()
 
         # Act
-        price_point = PricePoint(datetime(2022, 1, 1), 100.0)
+        price_point = PriceRecord(datetime(2022, 1, 1), 100.0)
         db.insert_prices([price_point])
 
         # Assert
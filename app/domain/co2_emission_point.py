@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional
 from pydantic.dataclasses import dataclass
 
 
@@ -19,7 +19,15 @@ class Co2EmissionPoint:
             'CO2 emission (g/kWh)': self.emission
         }
 
+class EmissionRecord(NamedTuple):
+    """A co2 emission at a time, which unlike "Co2EmissionPoint" is not validated and therefore cheap to create."""
+    time: datetime
+    emission: float
+
+    def to_point(self) -> Co2EmissionPoint:
+        return Co2EmissionPoint(self.time, self.emission)
+
 class CO2EmissionsRepository(ABC):
     @abstractmethod
-    def get_co2_emission_prognosis(self, start: Optional[datetime] = None , end: Optional[datetime] = None) -> List[Co2EmissionPoint]:
+    def get_co2_emission_prognosis(self, start: Optional[datetime] = None , end: Optional[datetime] = None) -> List[EmissionRecord]:
         pass
\ No newline at end of file
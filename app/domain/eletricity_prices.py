@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from datetime import time, datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional
 from pydantic.dataclasses import dataclass
 
 @dataclass
@@ -18,7 +18,15 @@ class PricePoint:
             'price': self.price
         }
 
+class PriceRecord(NamedTuple):
+    """A spot price at a time, which unlike "PricePoint" is not validated and therefore cheap to create."""
+    time: datetime
+    price: float
+
+    def to_point(self) -> PricePoint:
+        return PricePoint(self.time, self.price)
+
 class ElectricityPrices(ABC):
     @abstractmethod
-    def get_prices(self, start: Optional[datetime] = None , end: Optional[datetime] = None) -> List[PricePoint]:
+    def get_prices(self, start: Optional[datetime] = None , end: Optional[datetime] = None) -> List[PriceRecord]:
         pass
\ No newline at end of file
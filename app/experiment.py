@@ -2,7 +2,7 @@ from datetime import datetime, timedelta, timezone
 import sys
 from typing import Dict, List, Optional, Tuple
 
-from domain import PricePoint
+from domain import PriceRecord
 from infrastructure.eds_requests import EdsRequests
 from infrastructure.task import Task
 from infrastructure.spot_price_function import SpotPriceFunction
@@ -28,7 +28,7 @@ for price_point in price_points:
     print(f'{price_point.time}, {price_point.price}')
 print("")
 
-def get_available_price_points_from(start: datetime, include_dayahead: bool = False, end: Optional[datetime] = None) -> List[PricePoint]:
+def get_available_price_points_from(start: datetime, include_dayahead: bool = False, end: Optional[datetime] = None) -> List[PriceRecord]:
     assert start <= price_points[-1].time
 
     last_available_spot_price_time = datetime(
@@ -61,7 +61,7 @@ def get_available_price_points_from(start: datetime, include_dayahead: bool = Fa
     assert start < last_available_spot_price_time
     assert last_available_spot_price_time <= price_points[-1].time
 
-    included_price_points: List[PricePoint] = []
+    included_price_points: List[PriceRecord] = []
     for price_point in price_points:
         if price_point.time >= start and price_point.time <= last_available_spot_price_time:
             included_price_points.append(price_point)
@@ -1,5 +1,6 @@
 from .eds_requests import *
 from .optimal_time_calculator import *
+from .start_interval_set import *
 from .task import *
 from .task_validator_conjunction import *
 from .task_validator_disjunction import *
@@ -7,8 +8,17 @@ from .must_end_between_validator import *
 from .must_start_between_validator import *
 from .maximum_power_consumption_validator import *
 from .power_usage_function_factory import *
+from .search_budget import *
+from .persistent_schedule import *
 from .scheduler import *
+from .search_scheduler import *
+from .branch_and_bound_scheduler import *
+from .beam_search_scheduler import *
+from .coarse_to_fine_scheduler import *
+from .greedy_scheduler import *
+from .local_search_improver import *
 from .spot_price_function import *
 from .lowest_price_recommender import *
 from .schedules_recommender import *
-from .task_validator_splitter import *
\ No newline at end of file
+from .task_validator_splitter import *
+from .task_fingerprinter import *
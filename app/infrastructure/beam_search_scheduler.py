@@ -0,0 +1,101 @@
+from __future__ import annotations
+from datetime import datetime
+from typing import FrozenSet, Iterator, List, Optional, Set, Tuple
+
+from infrastructure.cost_curve_cache import CostCurveCache
+from infrastructure.persistent_schedule import PersistentSchedule
+from infrastructure.schedule import Schedule
+from infrastructure.search_budget import SearchBudget
+from infrastructure.search_scheduler import SearchScheduler
+from infrastructure.spot_price_function import SpotPriceFunction
+from infrastructure.task import Task
+from infrastructure.task_fingerprinter import TaskFingerprinter
+
+from opentelemetry import trace
+tracer = trace.get_tracer(__name__)
+
+class BeamSearchScheduler(SearchScheduler):
+    """Finds a schedule with a low total cost by only expanding the most promising partial schedules.
+
+    After each task is placed only the best partial schedules are kept, ranked by their cost plus the cheapest standalone cost of each remaining task.
+    Partial schedules placing the same tasks at the same start times in another order are only kept once, such that the beam stays diverse.
+    The result is not guaranteed to be optimal, but the work grows linearly in the number of tasks for a fixed width.
+    """
+    DEFAULT_WIDTH = 64
+    width: int
+    truncated: bool
+
+    def __init__(
+        self,
+        price_function: SpotPriceFunction,
+        width: int = DEFAULT_WIDTH,
+        budget: Optional[SearchBudget] = None,
+        cost_curves: Optional[CostCurveCache] = None,
+    ) -> None:
+        super().__init__(price_function, budget, cost_curves)
+        if width < 1:
+            raise ValueError(f'The beam width must be positive, but was {width}')
+        self.width = width
+        self.truncated = False
+
+    def is_optimal(self) -> bool:
+        # The search is only exhaustive if no partial schedule was ever left out of the beam.
+        return super().is_optimal() and not self.truncated
+
+    def generate_schedules(
+        self,
+        tasks: List[Task],
+        s0: Schedule = Schedule()
+    ) -> Iterator[Schedule]:
+        """Generates the schedule of all the tasks with the lowest total cost found by the beam.
+
+        If the budget is exhausted only the most promising partial schedule is completed.
+
+        Returns:
+            Iterator[Schedule]: The best schedule found or no schedules if the beam did not schedule all the tasks.
+        """
+        with tracer.start_as_current_span("BeamSearchScheduleTasks"):
+            self.start_search()
+            self.truncated = False
+            classes = TaskFingerprinter().task_classes(tasks)
+            lower_bounds = self.lowest_standalone_costs(tasks, s0, classes)
+
+            # Each node is the lower bound, the partial schedule, the indices of the remaining tasks and the placements.
+            beam: List[Tuple[float, PersistentSchedule, Tuple[int, ...], FrozenSet[Tuple[int, datetime]]]] = [
+                (sum(lower_bounds), PersistentSchedule(s0, tasks), tuple(range(len(tasks))), frozenset())
+            ]
+            for _ in range(len(tasks)):
+                children: List[Tuple[float, PersistentSchedule, Tuple[int, ...], FrozenSet[Tuple[int, datetime]]]] = []
+                for (_, schedule, remaining, placements) in beam:
+                    for index in self.first_of_each_class(remaining, classes):
+                        child_remaining = tuple(i for i in remaining if not i == index)
+                        remaining_bound = sum(lower_bounds[i] for i in child_remaining)
+                        for child_schedule in self.place_task_for(index, schedule):
+                            # Every child places a task, so it always has a placement.
+                            placement = child_schedule.placement
+                            assert placement is not None
+                            self.record_highest_price(tasks[index], placement.cost)
+                            child_placements = placements | { (index, placement.start) }
+                            children.append((child_schedule.cost + remaining_bound, child_schedule, child_remaining, child_placements))
+
+                if len(children) == 0:
+                    return
+
+                # Keep the most promising distinct partial schedules.
+                # Ties are broken by the highest cost so far, as less of their bound relies on the optimistic standalone costs.
+                children.sort(key=lambda child: (round(child[0], 9), -child[1].cost))
+                width = 1 if self.is_budget_exhausted() else self.width
+                beam = []
+                seen: Set[FrozenSet[Tuple[int, datetime]]] = set()
+                for child in children:
+                    if child[3] in seen:
+                        continue
+                    if len(beam) == width:
+                        self.truncated = True
+                        break
+                    seen.add(child[3])
+                    beam.append(child)
+
+            # Every remaining task is placed, so the lower bound is the cost.
+            self.statistics.schedules += 1
+            yield beam[0][1].to_schedule()
@@ -0,0 +1,77 @@
+from __future__ import annotations
+from typing import Iterator, List, Optional, Tuple
+
+from infrastructure.persistent_schedule import PersistentSchedule
+from infrastructure.schedule import Schedule
+from infrastructure.search_scheduler import SearchScheduler
+from infrastructure.task import Task
+from infrastructure.task_fingerprinter import TaskFingerprinter
+
+from opentelemetry import trace
+tracer = trace.get_tracer(__name__)
+
+class BranchAndBoundScheduler(SearchScheduler):
+    """Finds the schedule with the lowest total cost without generating every schedule for every order of the tasks.
+
+    The partial schedules are searched depth first where the cheapest placements are tried first such that a good incumbent is found early.
+    A partial schedule is pruned if its cost plus the cheapest standalone cost of each remaining task is not lower than the incumbent.
+    """
+    def generate_schedules(
+        self,
+        tasks: List[Task],
+        s0: Schedule = Schedule()
+    ) -> Iterator[Schedule]:
+        """Generates the schedule of all the tasks with the lowest total cost.
+
+        If the budget is exhausted the search stops and the best schedule found so far is generated.
+        If no schedule has been found by then, only the most promising partial schedules are extended until one is.
+
+        Returns:
+            Iterator[Schedule]: The optimal schedule or no schedules if the tasks cannot all be scheduled.
+        """
+        with tracer.start_as_current_span("BranchAndBoundScheduleTasks"):
+            self.start_search()
+            classes = TaskFingerprinter().task_classes(tasks)
+            lower_bounds = self.lowest_standalone_costs(tasks, s0, classes)
+
+            best_cost = float("inf")
+            best_schedule: Optional[PersistentSchedule] = None
+
+            # Each node is the lower bound, the partial schedule and the indices of the remaining tasks.
+            stack: List[Tuple[float, PersistentSchedule, Tuple[int, ...]]] = [
+                (sum(lower_bounds), PersistentSchedule(s0, tasks), tuple(range(len(tasks))))
+            ]
+            while len(stack) > 0:
+                exhausted = self.is_budget_exhausted()
+                if exhausted and best_schedule is not None:
+                    break
+
+                (bound, schedule, remaining) = stack.pop()
+                if bound >= best_cost:
+                    continue
+
+                if len(remaining) == 0:
+                    best_cost = schedule.cost
+                    best_schedule = schedule
+                    continue
+
+                # Branch on every remaining task at each of its possible start times.
+                children: List[Tuple[float, PersistentSchedule, Tuple[int, ...]]] = []
+                for index in self.first_of_each_class(remaining, classes):
+                    child_remaining = tuple(i for i in remaining if not i == index)
+                    remaining_bound = sum(lower_bounds[i] for i in child_remaining)
+                    for child in self.place_task_for(index, schedule):
+                        # Every child places a task, so it always has a placement.
+                        assert child.placement is not None
+                        self.record_highest_price(tasks[index], child.placement.cost)
+                        child_bound = child.cost + remaining_bound
+                        if child_bound < best_cost:
+                            children.append((child_bound, child, child_remaining))
+
+                # The stack is last in first out, so the most promising child is pushed last.
+                children.sort(key=lambda child: child[0], reverse=True)
+                stack.extend(children[-1:] if exhausted else children)
+
+            if best_schedule is not None:
+                self.statistics.schedules += 1
+                yield best_schedule.to_schedule()
@@ -1,27 +1,27 @@
+from __future__ import annotations
 from datetime import datetime, timedelta
-from typing import List
+from typing import Sequence
 
-from infrastructure.discrete_function import DiscreteFunction
-from infrastructure import Co2EmissionPoint
+from infrastructure.time_series import TimeSeries, TimeSeriesPoints
+from infrastructure.time_series_function import TimeSeriesFunction
+from domain import EmissionRecord
 
-class Co2EmissionFunction(DiscreteFunction[datetime, float, float, Co2EmissionPoint]):
+class Co2EmissionFunction(TimeSeriesFunction[EmissionRecord]):
     def __init__(
             self,
-            emission_points: List[Co2EmissionPoint],
+            emission_points: Sequence[EmissionRecord],
             extend_by: timedelta = timedelta(minutes=5)
         ) -> None:
         super().__init__(emission_points)
+        self.validate_ascending("emission")
 
-        previous_time = emission_points[0].time
-        for emission_point in emission_points[1:]:
-            current_time = emission_point.time
-            if previous_time > current_time:
-                raise ValueError("The emission points are not in ascending order")
-            if previous_time == current_time:
-                raise ValueError("The emission point is exactly on the same time as the current")
-            previous_time = current_time
-    
         self.extend_by = extend_by
+        self.index_integrals()
+
+    @staticmethod
+    def from_series(series: TimeSeries, extend_by: timedelta = timedelta(minutes=5)) -> Co2EmissionFunction:
+        """Creates the function directly from the arrays of a series, e.g. the rows of the database."""
+        return Co2EmissionFunction(TimeSeriesPoints(series, EmissionRecord), extend_by)
 
     @property
     def max_domain(self) -> datetime:
@@ -39,10 +39,13 @@ class Co2EmissionFunction(DiscreteFunction[datetime, float, float, Co2EmissionPo
     def is_valid_argument(self, argument: datetime) -> bool:
         return argument >= self.min_domain and argument <= self.max_domain
 
-    def get_domain(self, point: Co2EmissionPoint) -> datetime:
+    def create_point(self, time: datetime, value: float) -> EmissionRecord:
+        return EmissionRecord(time, value)
+
+    def get_domain(self, point: EmissionRecord) -> datetime:
         return point.time
     
-    def get_codomain(self, point: Co2EmissionPoint) -> float:
+    def get_codomain(self, point: EmissionRecord) -> float:
         return point.emission
 
     def next_discrete_point_from(
@@ -50,7 +53,7 @@ class Co2EmissionFunction(DiscreteFunction[datetime, float, float, Co2EmissionPo
             min: datetime,
             argument: datetime,
             max: datetime
-        ) -> Co2EmissionPoint | None:
+        ) -> EmissionRecord | None:
         # Check if this argument exceeds the last price point's time.
         last_point = self.set[-1]
         last_time = self.get_domain(last_point)
@@ -58,11 +61,11 @@ class Co2EmissionFunction(DiscreteFunction[datetime, float, float, Co2EmissionPo
             # Check if delta is inside acceptable bounds.
             delta = argument - last_time
             if delta <= self.extend_by:
-                return Co2EmissionPoint(self.max_domain, self.get_codomain(last_point))
+                return EmissionRecord(self.max_domain, self.get_codomain(last_point))
 
         return super().next_discrete_point_from(min, argument, max)
 
-    def discrete_point_at(self, argument: datetime) -> Co2EmissionPoint:
+    def discrete_point_at(self, argument: datetime) -> EmissionRecord:
         if not self.is_valid_argument(argument):
             raise ValueError(f'The argument "{argument}" is outside the domain boundaries')
 
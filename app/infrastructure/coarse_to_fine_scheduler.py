@@ -0,0 +1,132 @@
+from __future__ import annotations
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from infrastructure.branch_and_bound_scheduler import BranchAndBoundScheduler
+from infrastructure.cost_curve_cache import CostCurveCache
+from infrastructure.schedule import Schedule
+from infrastructure.search_budget import SearchBudget
+from infrastructure.spot_price_function import SpotPriceFunction
+from infrastructure.task import Task
+from infrastructure.task_fingerprinter import TaskFingerprinter
+
+from opentelemetry import trace
+tracer = trace.get_tracer(__name__)
+
+class CoarseToFineScheduler(BranchAndBoundScheduler):
+    """Finds a schedule with a low total cost by first searching a coarse grid of start times and then refining around its solution.
+
+    The coarse search only uses the first start time in each step of the grid, which finds the promising regions for each task.
+    The fine search uses every start time, but only those within one step of where the coarse search placed the task.
+    The total cost is reported as being at most "tolerance" above the cheapest standalone cost of each task, which bounds the full search.
+    """
+    DEFAULT_COARSE_RESOLUTION = timedelta(hours=1)
+    coarse_resolution: timedelta
+    tolerance: Optional[float]
+
+    def __init__(
+        self,
+        price_function: SpotPriceFunction,
+        coarse_resolution: timedelta = DEFAULT_COARSE_RESOLUTION,
+        budget: Optional[SearchBudget] = None,
+        cost_curves: Optional[CostCurveCache] = None,
+    ) -> None:
+        super().__init__(price_function, budget, cost_curves)
+        if coarse_resolution <= timedelta():
+            raise ValueError(f'The coarse resolution must be positive, but was {coarse_resolution}')
+        self.coarse_resolution = coarse_resolution
+        self.tolerance = None
+        # The phase is either "full", "coarse" or "fine", and the windows are the start times each task is refined within.
+        self.phase = "full"
+        self.windows: Dict[int, List[Tuple[datetime, datetime]]] = {}
+
+    def is_optimal(self) -> bool:
+        return super().is_optimal() and self.tolerance is not None and self.tolerance <= 1e-9
+
+    def start_search(self) -> None:
+        # The searches after the coarse search continue its statistics and budget.
+        if not self.phase == "coarse": return
+        super().start_search()
+
+    def get_all_possible_start_times(
+        self,
+        task: Task,
+        schedule: Optional[Schedule] = None
+    ) -> List[datetime]:
+        start_times = super().get_all_possible_start_times(task, schedule)
+
+        if self.phase == "coarse":
+            # Keep the first start time in each step of the grid.
+            coarse_start_times: List[datetime] = []
+            last_step: Optional[int] = None
+            for start_time in start_times:
+                step = (start_time - start_times[0]) // self.coarse_resolution
+                if not step == last_step:
+                    coarse_start_times.append(start_time)
+                    last_step = step
+            return coarse_start_times
+
+        if self.phase == "fine":
+            windows = self.windows.get(id(task), [])
+            return [
+                start_time for start_time in start_times
+                if any(start <= start_time and start_time <= end for (start, end) in windows)
+            ]
+
+        return start_times
+
+    def refinement_windows(self, tasks: List[Task], schedule: Schedule) -> Dict[int, List[Tuple[datetime, datetime]]]:
+        """Finds the start times to refine each task within, one step of the grid around where the coarse search placed it.
+
+        Interchangeable tasks are refined within the windows of each other, as the search places them in the given order.
+        """
+        classes = TaskFingerprinter().task_classes(tasks)
+        windows_by_class: Dict[int, List[Tuple[datetime, datetime]]] = {}
+        for scheduled_task in schedule.tasks:
+            for (index, task) in enumerate(tasks):
+                if task is scheduled_task.task:
+                    start_time = scheduled_task.start_interval.start
+                    windows_by_class.setdefault(classes[index], []).append(
+                        (start_time - self.coarse_resolution, start_time + self.coarse_resolution)
+                    )
+        return { id(task): windows_by_class.get(classes[index], []) for (index, task) in enumerate(tasks) }
+
+    def generate_schedules(
+        self,
+        tasks: List[Task],
+        s0: Schedule = Schedule()
+    ) -> Iterator[Schedule]:
+        """Generates the schedule of all the tasks with the lowest total cost found by refining the coarse schedule.
+
+        If the coarse grid cannot schedule every task, every start time is searched instead.
+
+        Returns:
+            Iterator[Schedule]: The best schedule found or no schedules if the tasks cannot all be scheduled.
+        """
+        with tracer.start_as_current_span("CoarseToFineScheduleTasks"):
+            self.tolerance = None
+            try:
+                self.phase = "coarse"
+                coarse = list(super().generate_schedules(tasks, s0))
+
+                if len(coarse) == 0:
+                    self.phase = "full"
+                    schedules = list(super().generate_schedules(tasks, s0))
+                else:
+                    self.windows = self.refinement_windows(tasks, coarse[0])
+                    self.phase = "fine"
+                    # The fine search can only miss the coarse schedule if its budget is exhausted.
+                    schedules = list(super().generate_schedules(tasks, s0)) or coarse
+
+                # The cheapest standalone cost of each task is at most the total cost of the full search.
+                self.phase = "full"
+                if len(schedules) > 0:
+                    lower_bound = sum(self.lowest_standalone_costs(tasks, s0, TaskFingerprinter().task_classes(tasks)))
+                    total_cost = sum(scheduled_task.cost for scheduled_task in schedules[0].tasks[len(s0.tasks):])
+                    self.tolerance = max(total_cost - lower_bound, 0.0)
+                    self.statistics.tolerance = self.tolerance
+            finally:
+                self.phase = "full"
+                self.windows = {}
+
+            yield from schedules
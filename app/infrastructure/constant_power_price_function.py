@@ -0,0 +1,76 @@
+from __future__ import annotations
+from datetime import datetime, timedelta
+from typing import Optional, Sequence
+
+import numpy as np
+
+from infrastructure.power_usage_function import PowerUsageFunction
+from infrastructure.spot_price_function import SpotPriceFunction
+
+
+class ConstantPowerPriceFunction:
+    """Calculates the price of running a constant power, which is the power times the integral of the spot prices.
+
+    It gives the same integrals as "PowerPriceFunction" for power usage functions with a single power,
+    but uses the cumulative integrals of the spot prices instead of stepping through both functions.
+    """
+    power: float
+    max_duration: timedelta
+
+    def __init__(
+        self,
+        power: float,
+        max_duration: timedelta,
+        spot_price_function: SpotPriceFunction,
+    ) -> None:
+        """
+        Args:
+            power (float): The kw used during the whole runtime.
+            max_duration (timedelta): The longest runtime which can be integrated.
+            spot_price_function (SpotPriceFunction): The prices to integrate.
+        """
+        self.power = power
+        self.max_duration = max_duration
+        self.spot_price_function = spot_price_function
+
+    @staticmethod
+    def create(
+        power_usage_function: PowerUsageFunction,
+        spot_price_function: SpotPriceFunction,
+    ) -> Optional[ConstantPowerPriceFunction]:
+        """Creates the price function if the power usage function has the same power over its whole domain.
+
+        Returns:
+            Optional[ConstantPowerPriceFunction]: The price function or None if the power changes.
+        """
+        power = power_usage_function.constant_power()
+        if power is None:
+            return None
+        return ConstantPowerPriceFunction(power, power_usage_function.max_domain, spot_price_function)
+
+    def check_duration(self, duration: timedelta) -> None:
+        if duration < timedelta() or duration > self.max_duration:
+            raise ValueError("The argument is outside the domain boundaries")
+
+    def integrate_from_to(
+        self,
+        start: datetime,
+        duration: timedelta,
+    ) -> float:
+        self.check_duration(duration)
+        return self.power * self.spot_price_function.integrate(start, start + duration)
+
+    def integrate_many(self, starts: Sequence[datetime], duration: timedelta) -> np.ndarray:
+        """Calculates "integrate_from_to" for many start times in one vectorised pass,
+        as the power times the difference of the cumulative integrals at the end and start times.
+
+        Args:
+            starts (Sequence[datetime]): The start times.
+            duration (timedelta): The runtime from each start time.
+
+        Returns:
+            np.ndarray: The integral for each of the start times.
+        """
+        self.check_duration(duration)
+        epochs = self.spot_price_function.to_epochs(starts)
+        return self.power * self.spot_price_function.integrate_many(epochs, epochs + duration.total_seconds())
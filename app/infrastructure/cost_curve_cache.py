@@ -0,0 +1,123 @@
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+from infrastructure.spot_price_function import SpotPriceFunction
+from infrastructure.task import Task
+from infrastructure.task_fingerprinter import TaskFingerprinter
+
+
+class CostCurveCache:
+    """Caches the cost of power usage functions at each start time across requests, keyed by the snapshot of the prices and a fingerprint of the power usage function.
+
+    A cost only depends on the prices between its start time and the end of the task. When the prices of a new snapshot are used,
+    e.g. the window of prices has moved forward or the prices of a new day are released, its curves start from the costs of the latest snapshot
+    which do not cover changed prices. The curves of the previous snapshots are kept, such that requests using different snapshots do not evict each other.
+    The least recently used snapshot is evicted when there are more than "maximum_snapshots" snapshots,
+    and the least recently used curve is evicted when there are more than "maximum_curves" curves.
+    """
+    DEFAULT_MAXIMUM_CURVES = 128
+    DEFAULT_MAXIMUM_SNAPSHOTS = 4
+
+    curves: "OrderedDict[Tuple[int, Hashable, timedelta], Dict[datetime, float]]"
+    snapshots: "OrderedDict[int, SpotPriceFunction]"
+
+    def __init__(self, maximum_curves: int = DEFAULT_MAXIMUM_CURVES, maximum_snapshots: int = DEFAULT_MAXIMUM_SNAPSHOTS) -> None:
+        self.maximum_curves = maximum_curves
+        self.maximum_snapshots = maximum_snapshots
+        self.curves = OrderedDict()
+        self.snapshots = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._fingerprinter = TaskFingerprinter()
+        self._lock = Lock()
+
+    def clear(self) -> None:
+        with self._lock:
+            self.curves.clear()
+            self.snapshots.clear()
+
+    def costs_at(
+        self,
+        task: Task,
+        price_function: SpotPriceFunction,
+        start_times: List[datetime],
+        calculate: Callable[[List[datetime]], Sequence[float]]
+    ) -> List[float]:
+        """Gets the cost of the task at each of the start times, the missing costs are calculated at once and added to the curve.
+
+        Args:
+            task (Task): The task to get the costs of, only its power usage function is used.
+            price_function (SpotPriceFunction): The prices the costs are calculated from.
+            start_times (List[datetime]): The start times to get the costs of.
+            calculate (Callable[[List[datetime]], Sequence[float]]): Calculates the costs of the start times which are not cached.
+
+        Returns:
+            List[float]: The cost at each of the start times in the same order.
+        """
+        with self._lock:
+            version = self.use_snapshot(price_function)
+            curve = self.curve_for((version, self._fingerprinter.power_fingerprint(task), task.duration))
+            missing = [start_time for start_time in start_times if start_time not in curve]
+            self.hits += len(start_times) - len(missing)
+            self.misses += len(missing)
+
+        # The costs are calculated without the lock, such that other requests are not blocked by it.
+        if len(missing) > 0:
+            costs = calculate(missing)
+            with self._lock:
+                curve.update((start_time, float(cost)) for (start_time, cost) in zip(missing, costs))
+        return [curve[start_time] for start_time in start_times]
+
+    def use_snapshot(self, price_function: SpotPriceFunction) -> int:
+        """Adds the snapshot of the price function if it is new, its curves start from the costs of the latest snapshot which cover unchanged prices.
+
+        Args:
+            price_function (SpotPriceFunction): The prices of the snapshot.
+
+        Returns:
+            int: The version of the snapshot which the curves are keyed by.
+        """
+        version = price_function.snapshot_version
+        if version in self.snapshots:
+            self.snapshots.move_to_end(version)
+            return version
+
+        if len(self.snapshots) > 0:
+            (latest_version, latest) = next(reversed(self.snapshots.items()))
+            unchanged = price_function.unchanged_between(latest)
+            if unchanged is not None:
+                (start, end) = unchanged
+                for ((curve_version, fingerprint, duration), curve) in list(self.curves.items()):
+                    if curve_version == latest_version:
+                        self.curves[(version, fingerprint, duration)] = {
+                            start_time: cost for (start_time, cost) in curve.items()
+                            if start <= start_time and start_time + duration <= end
+                        }
+
+        self.snapshots[version] = price_function
+        if len(self.snapshots) > self.maximum_snapshots:
+            (evicted_version, _) = self.snapshots.popitem(last=False)
+            for key in [key for key in self.curves if key[0] == evicted_version]:
+                del self.curves[key]
+        self.evict_curves()
+        return version
+
+    def curve_for(self, key: Tuple[int, Hashable, timedelta]) -> Dict[datetime, float]:
+        if key in self.curves:
+            self.curves.move_to_end(key)
+            return self.curves[key]
+
+        curve: Dict[datetime, float] = {}
+        self.curves[key] = curve
+        self.evict_curves()
+        return curve
+
+    def evict_curves(self) -> None:
+        while len(self.curves) > self.maximum_curves:
+            self.curves.popitem(last=False)
+
+
+# The cache is shared by the requests of the process, it is passed to their schedulers by the use case.
+cost_curve_cache = CostCurveCache()
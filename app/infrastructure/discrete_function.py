@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Generic, List, Optional, TypeVar
+from bisect import bisect_right
+from typing import Any, Generic, List, Optional, Sequence, TypeVar, cast
 from infrastructure.function import Function, TCodomain, TDomain, TIntegral
 
 TDiscretePoint = TypeVar("TDiscretePoint")
@@ -8,12 +9,62 @@ class DiscreteFunction(
     ABC,
     Generic[TDomain, TCodomain, TIntegral, TDiscretePoint],
 ):
+    set: Sequence[TDiscretePoint]
+
     def __init__(
         self,
-        set: List[TDiscretePoint]
+        set: Sequence[TDiscretePoint]
     ) -> None:
         super().__init__()
         self.set = set
+        self.index_discrete_points()
+
+    def index_discrete_points(self) -> None:
+        """Builds the sorted domain index used to look up discrete points.
+
+        The index has to be rebuilt if the discrete points are changed after construction.
+        """
+        self._domains: List[TDomain] = [self.get_domain(point) for point in self.set]
+
+        # If the points are evenly spaced (e.g. hourly prices) we can use index arithmetic instead of bisection.
+        self._domain_step: Optional[Any] = None
+        domains = self.comparable_domains()
+        if len(domains) < 2:
+            return
+        try:
+            if not domains[0] < domains[1]:
+                return
+            step = domains[1] - domains[0]
+            for (previous, current) in zip(domains[1:], domains[2:]):
+                if not current - previous == step:
+                    return
+            self._domain_step = step
+        except (TypeError, ZeroDivisionError):
+            # The domain does not support arithmetic so we can only bisect.
+            pass
+
+    def discrete_point_index(self, argument: TDomain) -> int:
+        """Finds the index of the last discrete point whose domain is not greater than the argument.
+
+        Args:
+            argument (TDomain): The argument from the domain.
+
+        Returns:
+            int: The index of the discrete point or -1 if the argument is before the first point.
+        """
+        domains = self.comparable_domains()
+        if self._domain_step is not None:
+            index = int((argument - domains[0]) // self._domain_step)
+            if index < 0: return -1
+            return min(index, len(domains) - 1)
+
+        return bisect_right(domains, argument) - 1
+
+    def comparable_domains(self) -> List[Any]:
+        """Gets the sorted domains of the discrete points for the index lookups.
+        The domains must be ordered for bisection, the evenly spaced lookup also subtracts and floor divides them.
+        """
+        return cast(List[Any], self._domains)
 
     @abstractmethod
     def get_domain(self, point: TDiscretePoint) -> TDomain:
@@ -66,13 +117,12 @@ class DiscreteFunction(
         if not self.is_valid_argument(argument):
             raise ValueError("The argument is outside the domain boundaries")
 
-        previous: TDiscretePoint = self.set[0]
-        for point in self.set[1:]:
-            if self.domain_order(argument, self.get_domain(point)) < 0:
-                return previous
-            previous = point
+        # The argument must be strictly before the domain of the succeeding point.
+        index = max(self.discrete_point_index(argument), 0)
+        if index + 1 >= len(self.set):
+            raise Exception("Unknown error")
 
-        raise Exception("Unknown error")
+        return self.set[index]
 
     def get_all_discrete_points(
         self,
@@ -113,33 +163,41 @@ class DiscreteFunction(
         if self.domain_order(argument, max) > 0: return None
 
         point: TDiscretePoint = self.discrete_point_at(argument)
-        index = self.set.index(point) + 1
+        index = self.discrete_point_index(self.get_domain(point))
+        if index < 0 or not self.set[index] == point:
+            index = self.set.index(point)
+        index += 1
         if index >= len(self.set): return None
         return self.set[index]
 
     def apply(self, argument: TDomain) -> TCodomain:
         return self.get_codomain(self.discrete_point_at(argument))
 
-    def sum_helper(
-        self,
-        min: TDomain, argument: TDomain, max: TDomain,
-    ) -> TCodomain:
-        current_codomain: TCodomain = self.apply(argument)
+    def sum(self, start: TDomain, end: TDomain) -> TCodomain:
+        """Sums the codomains of the discrete points from start to end by walking them once.
 
-        # Max is exclusive
-        if argument == max: return current_codomain
+        Args:
+            start (TDomain): The argument to start summing from.
+            end (TDomain): The argument to sum to, the point stepped onto at or after it is included.
 
-        next_point: Optional[TDiscretePoint] = self.next_discrete_point_from(min, argument, max)
-        if next_point is None:
-            return current_codomain
+        Returns:
+            TCodomain: The combined codomains.
+        """
+        current_domain = start
+        total: TCodomain = self.apply(current_domain)
 
-        next_domain: TDomain = self.get_domain(next_point)
-        return self.combine_codomains(
-            current_codomain, self.sum_helper(min, next_domain, max)
-        )
+        while not current_domain == end:
+            next_point: Optional[TDiscretePoint] = self.next_discrete_point_from(start, current_domain, end)
+            if next_point is None: break
 
-    def sum(self, start: TDomain, end: TDomain) -> TCodomain:
-        return self.sum_helper(start, start, end)
+            # Stop if the next point does not move us forward, otherwise we would never terminate.
+            next_domain = self.get_domain(next_point)
+            if not self.domain_order(current_domain, next_domain) < 0: break
+
+            current_domain = next_domain
+            total = self.combine_codomains(total, self.apply(current_domain))
+
+        return total
 
     @abstractmethod
     def integral_over(
@@ -149,52 +207,35 @@ class DiscreteFunction(
     ) -> TIntegral:
         pass
 
-    def integrate_helper(
-        self,
-        min: TDomain, start: TDomain,
-        max: TDomain, end: TDomain
-    ) -> TIntegral:
-        next_to_first_point = self.next_discrete_point_from(min, start, max)
-
-        # We are in the same point, or
-        # we are not in the same point. But the "end" value is the domain value of the next from start.
-        #   This check is required because the minimum step from getting the enxt point
-        #   includes the next point time. This means that even though an an integral will be [a, b)
-        #   we get [a, b] intervals which means the same if the "end" is precisely the "end" domain.
-        #   Ultimately this hinders floating point erros happening.
-        if self.is_in_same_discrete_point(min, start, end, max) or \
-            not next_to_first_point is None and end == self.get_domain(next_to_first_point):
-            return self.integral_over(
-                min, start,
-                max, end
-            )
-
-        next_to_last_point: TDiscretePoint = self.discrete_point_at(end)
-        next_to_last_domain = self.get_domain(next_to_last_point)
-
-        # To keep the algorithm clear one can remove this check where the "start" and "middle" split can is condially computed.
-        # This means that if "next_point" is "None" then "start_integral" and "middle_integral" is always "0".
-        end_integral = self.integrate_helper(
-            min, next_to_last_domain,
-            max, end
-        )
-        integral = end_integral
-        if not next_to_first_point is None:
-            next_to_first_domain = self.get_domain(next_to_first_point)
-            start_integral = self.integrate_helper(
-                min, start,
-                max, next_to_first_domain
-            )
-            middle_integral = self.integrate_helper(
-                min, next_to_first_domain,
-                max, next_to_last_domain
-            )
-            integral = self.combine_integrals(
-                integral,
-                self.combine_integrals(start_integral, middle_integral)
-            )
-
-        return integral
-
     def integrate(self, start: TDomain, end: TDomain) -> TIntegral:
-        return self.integrate_helper(start, start, end, end)
\ No newline at end of file
+        """Integrates from start to end by walking the discrete points between them once.
+        Each step integrates the piece from the current argument to the next discrete point, or the end if that is first.
+
+        Args:
+            start (TDomain): The start (or minimum) argument to calculate the integral from.
+            end (TDomain): The end (or maximum) argument to calculate the integral to.
+
+        Returns:
+            TIntegral: The combined integrals of the pieces.
+        """
+        current_domain = start
+        integral: Optional[TIntegral] = None
+
+        while True:
+            next_point = self.next_discrete_point_from(start, current_domain, end)
+
+            # The piece ends at the next point, unless it is at or past the end or does not move us forward.
+            piece_end = end
+            reached_end = True
+            if not next_point is None:
+                next_domain = self.get_domain(next_point)
+                if self.domain_order(current_domain, next_domain) < 0 and \
+                    self.domain_order(next_domain, end) < 0:
+                    piece_end = next_domain
+                    reached_end = False
+
+            piece = self.integral_over(start, current_domain, end, piece_end)
+            integral = piece if integral is None else self.combine_integrals(integral, piece)
+
+            if reached_end: return integral
+            current_domain = piece_end
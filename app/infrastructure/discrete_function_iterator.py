@@ -1,11 +1,19 @@
-from typing import Generic, Iterator, List, Optional
+from heapq import heappop, heappush
+from typing import Generic, Iterator, List, Optional, Tuple
 from infrastructure.discrete_function import DiscreteFunction, TDiscretePoint
 
 from infrastructure.function import TCodomain, TDomain, TIntegral
 
 
 class DiscreteFunctionIterator(Iterator, Generic[TDomain, TCodomain, TIntegral, TDiscretePoint]):
+    """Iterates the union of the discrete points of the functions from start to end, both included.
+
+    Each function has a cursor holding its next discrete point, the cursors are merged with a heap.
+    Only the functions whose cursor is passed are asked for their next point again.
+    """
     current: Optional[TDomain]
+    cursors: List[Tuple[TDomain, int]]
+    dormant: List[Tuple[TDomain, int]]
 
     def __init__(
         self,
@@ -35,35 +43,53 @@ class DiscreteFunctionIterator(Iterator, Generic[TDomain, TCodomain, TIntegral,
         self.start = start
         self.end = end
 
-    def get_next_from(self, argument: Optional[TDomain]) -> Optional[TDomain]:
-        if argument is None: return None
-        if argument == self.end: return None
+        # Functions starting after the current argument are dormant until the iteration reaches them.
+        self.cursors = []
+        self.dormant = []
+        for (index, function) in enumerate(functions):
+            heappush(self.dormant, (function.min_domain, index))
+        self.wake_up(start)
+
+    def advance(self, index: int, argument: TDomain) -> None:
+        """Moves the cursor of a function to its next discrete point after the argument.
+        The function is dropped if it has no such point before the end.
+        """
+        function = self.functions[index]
+        next_point = function.next_discrete_point_from(
+            function.min_domain, argument, function.max_domain
+        )
+        if next_point is None: return
+
+        next_domain = function.get_domain(next_point)
+        if function.domain_order(next_domain, self.end) > 0: return
+        if not function.domain_order(argument, next_domain) < 0: return
 
-        smallest_domain: Optional[TDomain] = None
-        for function in self.functions:
-            # Get the next point and check if there was one.
-            next_point = function.next_discrete_point_from(
-                function.min_domain, argument, function.max_domain
-            )
-            if next_point is None: continue
+        heappush(self.cursors, (next_domain, index))
 
-            # Deconstruct the point and check if it is the first or smaller than the smallest.
-            next_domain = function.get_domain(next_point)
-            if function.domain_order(next_domain, self.end) > 0:
-                continue
+    def is_after(self, cursor: Tuple[TDomain, int], argument: TDomain) -> bool:
+        (domain, index) = cursor
+        return self.functions[index].domain_order(domain, argument) > 0
+
+    def wake_up(self, argument: TDomain) -> None:
+        while len(self.dormant) > 0 and not self.is_after(self.dormant[0], argument):
+            (_, index) = heappop(self.dormant)
+            self.advance(index, argument)
+
+    def next_from_cursors(self, argument: TDomain) -> Optional[TDomain]:
+        if argument == self.end: return None
 
-            if smallest_domain is None or \
-                function.domain_order(next_domain, smallest_domain) < 0:
-                smallest_domain = next_domain
-        
-        if smallest_domain is None:
-            smallest_domain = self.end
+        self.wake_up(argument)
+        while len(self.cursors) > 0 and not self.is_after(self.cursors[0], argument):
+            (_, index) = heappop(self.cursors)
+            self.advance(index, argument)
 
-        return smallest_domain
+        if len(self.cursors) == 0:
+            return self.end
+        return self.cursors[0][0]
 
     def __next__(self) -> Optional[TDomain]:
         temp = self.current
         if temp is None:
             raise StopIteration
-        self.current = self.get_next_from(self.current)
+        self.current = self.next_from_cursors(temp)
         return temp
\ No newline at end of file
@@ -0,0 +1,115 @@
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Any, Callable, Generic, List, Optional, Protocol, Tuple, TypeVar
+
+from infrastructure.discrete_function import TDiscretePoint
+
+
+class Comparable(Protocol):
+    def __lt__(self, other: Any) -> bool: ...
+
+TComparableDomain = TypeVar("TComparableDomain", bound=Comparable)
+
+class DiscreteTimeline(Generic[TComparableDomain, TDiscretePoint]):
+    """The discrete points succeeding a start, materialized by stepping through them only as far as they are queried."""
+
+    def __init__(
+        self,
+        start: TComparableDomain,
+        find_next: Callable[[TComparableDomain], Optional[TDiscretePoint]],
+        get_domain: Callable[[TDiscretePoint], TComparableDomain],
+    ) -> None:
+        self.start = start
+        self.find_next = find_next
+        self.get_domain = get_domain
+        self.domains: List[TComparableDomain] = []
+        self.points: List[TDiscretePoint] = []
+        self.is_complete = False
+
+    def extend_past(self, argument: TComparableDomain) -> None:
+        """Steps through the points until one is after the argument or there are no more points."""
+        current = self.start if len(self.domains) == 0 else self.domains[-1]
+        while not self.is_complete and not argument < current:
+            next_point = self.find_next(current)
+            if next_point is None:
+                self.is_complete = True
+                break
+
+            # Stop if we do not move forward, such arguments are not covered by the timeline.
+            next_domain = self.get_domain(next_point)
+            if not current < next_domain:
+                self.is_complete = True
+                break
+
+            self.domains.append(next_domain)
+            self.points.append(next_point)
+            current = next_domain
+
+    def index_after(self, argument: TComparableDomain) -> Optional[int]:
+        """Finds the index of the first point after the argument.
+
+        Args:
+            argument (TComparableDomain): The argument from the domain.
+
+        Returns:
+            Optional[int]: The index or None if the argument is not covered by the timeline.
+        """
+        if argument < self.start: return None
+        self.extend_past(argument)
+        if len(self.domains) == 0 or not argument < self.domains[-1]:
+            return None
+        return bisect_right(self.domains, argument)
+
+class DiscreteTimelineCache(Generic[TComparableDomain, TDiscretePoint]):
+    """Lazily materializes a timeline for each minimum and maximum the discrete points are stepped between.
+    Only the most recently used timelines are kept, as e.g. every start time of a task has its own minimum.
+    """
+    DEFAULT_MAXIMUM_TIMELINES = 32
+    timelines: "OrderedDict[Tuple[TComparableDomain, TComparableDomain], DiscreteTimeline[TComparableDomain, TDiscretePoint]]"
+
+    def __init__(
+        self,
+        find_next: Callable[[TComparableDomain, TComparableDomain, TComparableDomain], Optional[TDiscretePoint]],
+        get_domain: Callable[[TDiscretePoint], TComparableDomain],
+        maximum_timelines: int = DEFAULT_MAXIMUM_TIMELINES,
+    ) -> None:
+        if maximum_timelines < 1:
+            raise ValueError(f'The maximum number of timelines must be positive, but was {maximum_timelines}')
+        self.find_next = find_next
+        self.get_domain = get_domain
+        self.maximum_timelines = maximum_timelines
+        self.timelines = OrderedDict()
+
+    def timeline(
+        self,
+        global_min: TComparableDomain,
+        global_max: TComparableDomain
+    ) -> DiscreteTimeline[TComparableDomain, TDiscretePoint]:
+        key = (global_min, global_max)
+        timeline = self.timelines.get(key)
+        if timeline is None:
+            timeline = DiscreteTimeline(
+                global_min,
+                lambda argument: self.find_next(global_min, argument, global_max),
+                self.get_domain
+            )
+            self.timelines[key] = timeline
+            if len(self.timelines) > self.maximum_timelines:
+                self.timelines.popitem(last=False)
+        else:
+            self.timelines.move_to_end(key)
+        return timeline
+
+    def next_from(
+        self,
+        global_min: TComparableDomain,
+        argument: TComparableDomain,
+        global_max: TComparableDomain
+    ) -> Optional[TDiscretePoint]:
+        timeline = self.timeline(global_min, global_max)
+        index = timeline.index_after(argument)
+
+        # Arguments not covered by the timeline are stepped from directly.
+        if index is None:
+            return self.find_next(global_min, argument, global_max)
+        return timeline.points[index]
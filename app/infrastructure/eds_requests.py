@@ -2,8 +2,8 @@ import requests
 from typing import Any, Dict, List, Optional
 from datetime import datetime, timezone
 from requests import Response
-from domain import ElectricityPrices, PricePoint
-from domain import Co2EmissionPoint, CO2EmissionsRepository
+from domain import ElectricityPrices, PriceRecord
+from domain import CO2EmissionsRepository, EmissionRecord
 from .eds_url_builder import EdsUrlBuilder
 
 from opentelemetry import trace
@@ -13,7 +13,7 @@ class EdsRequests(ElectricityPrices, CO2EmissionsRepository):
     def __init__(self) -> None:
         pass
 
-    def get_co2_emission_prognosis(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> List[Co2EmissionPoint]:
+    def get_co2_emission_prognosis(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> List[EmissionRecord]:
         if start is not None:
             start = start.replace(
                 minute=0,
@@ -48,8 +48,8 @@ class EdsRequests(ElectricityPrices, CO2EmissionsRepository):
 
         return self.create_emission_points_from_json(records)[::-1]
 
-    def create_emission_points_from_json(self, json: List[Dict[str, Any]]) -> List[Co2EmissionPoint]:
-        emission_points: List[Co2EmissionPoint] = []
+    def create_emission_points_from_json(self, json: List[Dict[str, Any]]) -> List[EmissionRecord]:
+        emission_points: List[EmissionRecord] = []
         for record in json:
             try:
                 time: datetime = datetime.fromisoformat(record['Minutes5UTC']) \
@@ -66,13 +66,13 @@ class EdsRequests(ElectricityPrices, CO2EmissionsRepository):
             except ValueError as exc:
                 raise ValueError("'CO2Emission' is not a floating point number", record) from exc
 
-            emission_point = Co2EmissionPoint(time, emission)
+            emission_point = EmissionRecord(time, emission)
             emission_points.append(emission_point)
 
         return emission_points
 
 
-    def get_prices(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> List[PricePoint]:
+    def get_prices(self, start: Optional[datetime] = None, end: Optional[datetime] = None) -> List[PriceRecord]:
         with tracer.start_as_current_span("GetPrices"):
             if start is not None:
                 start = start.replace(
@@ -108,10 +108,10 @@ class EdsRequests(ElectricityPrices, CO2EmissionsRepository):
 
             return self.create_price_points_from_json(records)[::-1]
 
-    def create_price_points_from_json(self, json: List[Dict[str, Any]]) -> List[PricePoint]:
+    def create_price_points_from_json(self, json: List[Dict[str, Any]]) -> List[PriceRecord]:
         with tracer.start_as_current_span("CreatePricePointsFromJson"):
-            # For each record in records, create a PricePoint object and add it to the list
-            price_points: List[PricePoint] = []
+            # For each record in records, create a PriceRecord and add it to the list
+            price_points: List[PriceRecord] = []
             for record in json:
                 try:
                     time: datetime = datetime.fromisoformat(record['HourUTC'])
@@ -130,7 +130,7 @@ class EdsRequests(ElectricityPrices, CO2EmissionsRepository):
                 except ValueError as exc:
                     raise ValueError("'SpotPriceDKK' is not a floating point number", record) from exc
 
-                price_point = PricePoint(time, price)
+                price_point = PriceRecord(time, price)
                 price_points.append(price_point)
 
             return price_points
@@ -0,0 +1,92 @@
+from __future__ import annotations
+from typing import Iterator, List, Optional
+
+import numpy as np
+
+from infrastructure.cost_curve_cache import CostCurveCache
+from infrastructure.persistent_schedule import PersistentSchedule
+from infrastructure.schedule import Schedule
+from infrastructure.search_budget import SearchBudget
+from infrastructure.search_scheduler import SearchScheduler
+from infrastructure.spot_price_function import SpotPriceFunction
+from infrastructure.task import Task
+
+from opentelemetry import trace
+tracer = trace.get_tracer(__name__)
+
+class GreedyScheduler(SearchScheduler):
+    """Places the tasks one at a time at their cheapest feasible start time, without ever reconsidering a placement.
+
+    The tasks using the most energy in the fewest start times are placed first, as they are the hardest to place once the others are.
+    Each task is placed once, so the work grows linearly in the number of tasks, but the schedule is not guaranteed to be optimal.
+    """
+    DEFAULT_TASK_THRESHOLD = 6
+
+    task_count: int
+
+    def __init__(
+        self,
+        price_function: SpotPriceFunction,
+        budget: Optional[SearchBudget] = None,
+        cost_curves: Optional[CostCurveCache] = None,
+    ) -> None:
+        super().__init__(price_function, budget, cost_curves)
+        self.task_count = 0
+
+    def is_optimal(self) -> bool:
+        # The cheapest start time of a single task is the optimal schedule.
+        return super().is_optimal() and self.task_count <= 1
+
+    def energy(self, task: Task) -> float:
+        """Calculates the energy the task uses in kwh."""
+        (offsets, powers) = task.power_usage_function.power_segments(task.duration)
+        return float(np.sum(np.diff(offsets) * powers) / 3600)
+
+    def priorities(self, tasks: List[Task], s0: Schedule) -> List[float]:
+        """Calculates the priority of each task as its energy times the tightness of its window.
+
+        Returns:
+            List[float]: The priority of each task or infinity if it cannot be scheduled at all, such that it is found immediately.
+        """
+        priorities: List[float] = []
+        for (index, task) in enumerate(tasks):
+            start_count = len(self.placements_for(task, s0, index))
+            priorities.append(float("inf") if start_count == 0 else self.energy(task) / start_count)
+        return priorities
+
+    def generate_schedules(
+        self,
+        tasks: List[Task],
+        s0: Schedule = Schedule()
+    ) -> Iterator[Schedule]:
+        """Generates the schedule of all the tasks where each task is placed at its cheapest start time in order of priority.
+
+        Returns:
+            Iterator[Schedule]: The greedy schedule or no schedules if a task could not be placed.
+        """
+        with tracer.start_as_current_span("GreedyScheduleTasks"):
+            self.start_search()
+            self.task_count = len(tasks)
+            priorities = self.priorities(tasks, s0)
+            order = sorted(range(len(tasks)), key=lambda index: (-priorities[index], index))
+
+            schedule = PersistentSchedule(s0, tasks)
+            for index in order:
+                children = self.place_task_for(index, schedule)
+                if len(children) == 0:
+                    return
+
+                costs: List[float] = []
+                for child in children:
+                    # Every child places the task, so it always has a placement.
+                    assert child.placement is not None
+                    costs.append(child.placement.cost)
+                    self.record_highest_price(tasks[index], child.placement.cost)
+
+                # The start times are in ascending order, so ties are placed at the earliest start time.
+                schedule = children[int(np.argmin(costs))]
+
+            # Each task is only placed once, so the budget is not checked until the end where it updates the elapsed time.
+            self.is_budget_exhausted()
+            self.statistics.schedules += 1
+            yield schedule.to_schedule()
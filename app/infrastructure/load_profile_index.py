@@ -0,0 +1,180 @@
+from __future__ import annotations
+from datetime import datetime, timedelta
+from typing import Any, List, Optional, Tuple
+
+from infrastructure.schedule_task import ScheduledTask
+from infrastructure.task import Task
+
+
+def power_pieces(task: Task, start_time: datetime) -> List[Tuple[datetime, datetime, float]]:
+    """Gets the constant power pieces of a task started at the given time.
+
+    Args:
+        task (Task): The task to get the power pieces of.
+        start_time (datetime): The time the task starts at.
+
+    Returns:
+        List[Tuple[datetime, datetime, float]]: The start, exclusive end and kw of each piece.
+    """
+    power_usage_function = task.power_usage_function
+    end_time = start_time + task.duration
+
+    pieces: List[Tuple[datetime, datetime, float]] = []
+    for point in power_usage_function.set:
+        piece_start = start_time + power_usage_function.get_domain(point)
+        if piece_start >= end_time: break
+        if len(pieces) > 0:
+            (last_start, _, last_power) = pieces[-1]
+            pieces[-1] = (last_start, piece_start, last_power)
+        pieces.append((piece_start, end_time, power_usage_function.get_codomain(point)))
+    return pieces
+
+
+# A node of the segment tree is its greatest consumption, the consumption added to its whole range and its children.
+# Nodes are never changed, so indices can share them. An empty subtree is None and consumes nothing.
+Node = Optional[Tuple[float, float, Any, Any]]
+
+def node_maximum(node: Node) -> float:
+    return 0.0 if node is None else node[0]
+
+
+class LoadProfileIndex:
+    """The power consumption of scheduled tasks over a time grid as a persistent segment tree with range-add and range-max.
+
+    Each slot of the grid starts at "origin + k * resolution" and holds the consumption from its start until the next slot.
+    Adding a task and querying the greatest consumption between two times both take logarithmic time in the number of slots.
+    Adding only replaces the nodes on the paths it changes, so a copy shares the tree and is created in constant time.
+    The index is exact while every consumption change is on the grid, otherwise it is only an upper bound.
+    """
+    def __init__(self, resolution: timedelta = timedelta(minutes=1), origin: Optional[datetime] = None) -> None:
+        self.resolution = resolution
+        self.origin = origin
+        self.scheduled_tasks: List[ScheduledTask] = []
+        self.is_exact = True
+
+        self._first_slot = 0
+        self._size = 0
+        self._root: Node = None
+
+    @staticmethod
+    def from_tasks(tasks: List[ScheduledTask], resolution: timedelta = timedelta(minutes=1)) -> LoadProfileIndex:
+        index = LoadProfileIndex(resolution)
+        for scheduled_task in tasks:
+            index.add(scheduled_task)
+        return index
+
+    def copy(self) -> LoadProfileIndex:
+        index = LoadProfileIndex(self.resolution, self.origin)
+        index.scheduled_tasks = self.scheduled_tasks.copy()
+        index.is_exact = self.is_exact
+        index._first_slot = self._first_slot
+        index._size = self._size
+        index._root = self._root
+        return index
+
+    @property
+    def count(self) -> int:
+        return len(self.scheduled_tasks)
+
+    def indexes(self, tasks: List[ScheduledTask]) -> bool:
+        """Checks if the index holds exactly the scheduled tasks, which are compared by identity such that replaced tasks are noticed."""
+        return len(tasks) == len(self.scheduled_tasks) and all(
+            task is indexed_task for (task, indexed_task) in zip(tasks, self.scheduled_tasks)
+        )
+
+    def is_aligned(self, time: datetime) -> bool:
+        return self.origin is None or (time - self.origin) % self.resolution == timedelta()
+
+    def add(self, scheduled_task: ScheduledTask) -> None:
+        """Adds the greatest consumption of a scheduled task to the slots it might run in."""
+        self.scheduled_tasks.append(scheduled_task)
+        start_time = scheduled_task.start_interval.start
+
+        # A flexible start makes the greatest consumption depend on the whole start window.
+        #   It is covered by its greatest consumption over the window, which is only an upper bound.
+        if scheduled_task.start_interval.duration > timedelta():
+            end_time = start_time + scheduled_task.start_interval.duration + scheduled_task.task.duration
+            power = max(power for (_, _, power) in power_pieces(scheduled_task.task, start_time))
+            self.is_exact = False
+            self.add_load(start_time, end_time, power)
+            return
+
+        for (piece_start, piece_end, power) in power_pieces(scheduled_task.task, start_time):
+            self.add_load(piece_start, piece_end, power)
+
+    def add_load(self, start_time: datetime, end_time: datetime, power: float) -> None:
+        """Adds a constant consumption from the start time until the exclusive end time."""
+        if end_time <= start_time or power == 0:
+            return
+        if self.origin is None:
+            self.origin = start_time
+        if not self.is_aligned(start_time) or not self.is_aligned(end_time):
+            self.is_exact = False
+
+        (first, last) = self._slots_between(start_time, end_time)
+        self._grow(first, last)
+        self._root = self._add(self._root, 0, self._size - 1, first - self._first_slot, last - self._first_slot, power)
+
+    def maximum_between(self, start_time: datetime, end_time: datetime) -> float:
+        """Gets the greatest consumption from the start time until the exclusive end time.
+
+        Returns:
+            float: The greatest consumption, where slots without any tasks consume nothing.
+        """
+        if end_time <= start_time or self._size == 0:
+            return 0.0
+
+        (first, last) = self._slots_between(start_time, end_time)
+        last_slot = self._first_slot + self._size - 1
+        greatest = self._query(self._root, 0, self._size - 1, max(first, self._first_slot) - self._first_slot, min(last, last_slot) - self._first_slot)
+
+        # Slots outside the tree do not have any tasks.
+        if first < self._first_slot or last > last_slot:
+            greatest = max(greatest, 0.0)
+        return greatest
+
+    def _slots_between(self, start_time: datetime, end_time: datetime) -> Tuple[int, int]:
+        assert self.origin is not None
+        first = (start_time - self.origin) // self.resolution
+        last = -((self.origin - end_time) // self.resolution) - 1
+        return (first, last)
+
+    def _grow(self, first: int, last: int) -> None:
+        """Doubles the slots covered by the tree until it covers the first and last slot, the old tree becomes a child of the new root."""
+        if self._size == 0:
+            self._first_slot = first
+            self._size = 1
+        while first < self._first_slot or last >= self._first_slot + self._size:
+            if first < self._first_slot:
+                self._root = None if self._root is None else (max(self._root[0], 0.0), 0.0, None, self._root)
+                self._first_slot -= self._size
+            else:
+                self._root = None if self._root is None else (max(self._root[0], 0.0), 0.0, self._root, None)
+            self._size *= 2
+
+    def _add(self, node: Node, low: int, high: int, first: int, last: int, power: float) -> Node:
+        if last < low or high < first:
+            return node
+        (maximum, pending, left, right) = (0.0, 0.0, None, None) if node is None else node
+        if first <= low and high <= last:
+            return (maximum + power, pending + power, left, right)
+
+        middle = (low + high) // 2
+        left = self._add(left, low, middle, first, last, power)
+        right = self._add(right, middle + 1, high, first, last, power)
+        return (max(node_maximum(left), node_maximum(right)) + pending, pending, left, right)
+
+    def _query(self, node: Node, low: int, high: int, first: int, last: int) -> float:
+        if last < low or high < first:
+            return float("-inf")
+        if node is None:
+            return 0.0
+        if first <= low and high <= last:
+            return node[0]
+
+        (_, pending, left, right) = node
+        middle = (low + high) // 2
+        return max(
+            self._query(left, low, middle, first, last),
+            self._query(right, middle + 1, high, first, last)
+        ) + pending
@@ -0,0 +1,156 @@
+from __future__ import annotations
+from bisect import bisect_left
+from datetime import datetime, timedelta
+import time
+from typing import List, Optional, Tuple
+
+from infrastructure.datetime_interval import DatetimeInterval
+from infrastructure.schedule import Schedule
+from infrastructure.schedule_task import ScheduledTask
+from infrastructure.scheduler import Scheduler
+from infrastructure.task_fingerprinter import TaskFingerprinter
+
+from opentelemetry import trace
+tracer = trace.get_tracer(__name__)
+
+class LocalSearchImprover:
+    """Lowers the total cost of a schedule by moving one or two of its tasks at a time until no move lowers it.
+
+    A task is either shifted to a neighbouring start time or two tasks swap their start times.
+    Only the cost of the moved tasks are calculated for each move, as the cost of the other tasks does not change.
+    The tasks of the base schedule are never moved.
+    """
+    DEFAULT_TIME_LIMIT = timedelta(seconds=1)
+    moves: int
+
+    def __init__(
+        self,
+        scheduler: Scheduler,
+        time_limit: Optional[timedelta] = DEFAULT_TIME_LIMIT
+    ) -> None:
+        """
+        Args:
+            scheduler (Scheduler): Finds the start times and costs of the tasks.
+            time_limit (Optional[timedelta]): How long the improvement may run, or None if it runs until a local optimum.
+        """
+        self.scheduler = scheduler
+        self.time_limit = time_limit
+        self.moves = 0
+        self._fingerprinter = TaskFingerprinter()
+        self._deadline: Optional[float] = None
+
+    def is_expired(self) -> bool:
+        return self._deadline is not None and time.monotonic() >= self._deadline
+
+    def improve(self, schedule: Schedule, base: Schedule = Schedule()) -> Schedule:
+        """Improves the schedule until no move lowers the total cost or the time limit is reached.
+
+        Args:
+            schedule (Schedule): The schedule to improve, it is not changed.
+            base (Schedule): The schedule which the tasks were scheduled into, its tasks are kept where they are.
+
+        Returns:
+            Schedule: The improved schedule with the tasks in the same order.
+        """
+        with tracer.start_as_current_span("LocalSearchImprove"):
+            self.moves = 0
+            self._deadline = None if self.time_limit is None else time.monotonic() + self.time_limit.total_seconds()
+
+            tasks = list(schedule.tasks)
+            fixed = set(id(scheduled_task) for scheduled_task in base.tasks)
+            movable = [index for (index, scheduled_task) in enumerate(tasks) if id(scheduled_task) not in fixed]
+
+            improved = True
+            while improved and not self.is_expired():
+                improved = False
+                for index in movable:
+                    if self.is_expired(): break
+                    improved = self.try_shift(tasks, index, schedule) or improved
+
+                for (position, first) in enumerate(movable):
+                    for second in movable[position + 1:]:
+                        if self.is_expired(): break
+                        improved = self.try_swap(tasks, first, second, schedule) or improved
+
+            return Schedule(tasks, schedule.validator)
+
+    def without(self, tasks: List[ScheduledTask], indices: Tuple[int, ...], schedule: Schedule) -> Schedule:
+        return Schedule([scheduled_task for (index, scheduled_task) in enumerate(tasks) if index not in indices], schedule.validator)
+
+    def neighbouring_start_times(self, start_times: List[datetime], start_time: datetime) -> List[datetime]:
+        index = bisect_left(start_times, start_time)
+        neighbours = []
+        if index > 0:
+            neighbours.append(start_times[index - 1])
+        if index < len(start_times) and start_times[index] == start_time:
+            index += 1
+        if index < len(start_times):
+            neighbours.append(start_times[index])
+        return neighbours
+
+    def can_place_at(self, scheduled_task: ScheduledTask, start_time: datetime, schedule: Schedule) -> bool:
+        task = scheduled_task.task
+        return task.is_scheduleable_at(start_time) and schedule.can_schedule_task_at(task, start_time)
+
+    def cost_at(self, scheduled_task: ScheduledTask, start_time: datetime) -> Optional[float]:
+        """Calculates the cost of only the task at the start time.
+
+        Returns:
+            Optional[float]: The cost or None if there are no prices for the whole runtime.
+        """
+        task = scheduled_task.task
+        price_function = self.scheduler.price_function
+        if not price_function.is_valid_argument(start_time) or not price_function.is_valid_argument(start_time + task.duration):
+            return None
+        return self.scheduler.costs_for(task, [start_time])[0]
+
+    def try_shift(self, tasks: List[ScheduledTask], index: int, schedule: Schedule) -> bool:
+        """Shifts the task to the cheapest of its neighbouring start times if it is cheaper than where it is."""
+        scheduled_task = tasks[index]
+        others = self.without(tasks, (index,), schedule)
+        start_times = self.scheduler.get_all_possible_start_times(scheduled_task.task, others)
+
+        best: Optional[ScheduledTask] = None
+        for start_time in self.neighbouring_start_times(start_times, scheduled_task.start_interval.start):
+            cost = self.cost_at(scheduled_task, start_time)
+            if cost is None or not cost < (scheduled_task.cost if best is None else best.cost) - 1e-9:
+                continue
+            if self.can_place_at(scheduled_task, start_time, others):
+                best = ScheduledTask(DatetimeInterval(start_time, timedelta()), scheduled_task.task, cost)
+
+        if best is None:
+            return False
+
+        tasks[index] = best
+        self.moves += 1
+        return True
+
+    def try_swap(self, tasks: List[ScheduledTask], first: int, second: int, schedule: Schedule) -> bool:
+        """Swaps the start times of the two tasks if the total cost of them is lower afterwards."""
+        (first_task, second_task) = (tasks[first], tasks[second])
+
+        # Swapping interchangeable tasks does not change the costs.
+        if self._fingerprinter.power_fingerprint(first_task.task) == self._fingerprinter.power_fingerprint(second_task.task):
+            return False
+
+        (first_start, second_start) = (first_task.start_interval.start, second_task.start_interval.start)
+        first_cost = self.cost_at(first_task, second_start)
+        second_cost = self.cost_at(second_task, first_start)
+        if first_cost is None or second_cost is None or \
+            first_cost + second_cost >= first_task.cost + second_task.cost - 1e-9:
+            return False
+
+        # Only cheaper swaps are checked against the constraints.
+        others = self.without(tasks, (first, second), schedule)
+        if not self.can_place_at(first_task, second_start, others):
+            return False
+        moved_first = ScheduledTask(DatetimeInterval(second_start, timedelta()), first_task.task, first_cost)
+        others.add(moved_first)
+        if not self.can_place_at(second_task, first_start, others):
+            return False
+        moved_second = ScheduledTask(DatetimeInterval(first_start, timedelta()), second_task.task, second_cost)
+
+        tasks[first] = moved_first
+        tasks[second] = moved_second
+        self.moves += 1
+        return True
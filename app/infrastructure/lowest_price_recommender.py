@@ -1,4 +1,4 @@
-from typing import Dict, List
+from typing import Dict, Iterable, Optional
 from .schedule import Schedule
 from .schedules_recommender import SchedulesRecommender
 from .spot_price_function import SpotPriceFunction
@@ -7,7 +7,7 @@ from infrastructure.co2_emission_function import Co2EmissionFunction
 from opentelemetry import trace
 tracer = trace.get_tracer(__name__)
 
-class LowestPriceRecommender(SchedulesRecommender[Schedule]):
+class LowestPriceRecommender(SchedulesRecommender[Optional[Schedule]]):
     highest_scheduled_task_prices: Dict[str, float]
     highest_scheduled_emission: Dict[str, float]
 
@@ -22,13 +22,22 @@ class LowestPriceRecommender(SchedulesRecommender[Schedule]):
         self.highest_scheduled_task_prices = {}
         self.highest_scheduled_emission = {}
 
-    def recommend(self, schedules: List[Schedule]) -> Schedule:
+    def recommend(self, schedules: Iterable[Schedule]) -> Optional[Schedule]:
+        """Finds the schedule with the lowest total price while consuming the schedules one at a time.
+        Only the lowest schedule and the highest price of each task is kept, and the total price of each schedule is calculated once.
+
+        Returns:
+            Optional[Schedule]: The schedule with the lowest total price or None if there were no schedules.
+        """
         with tracer.start_as_current_span("RecommendLowestPrice"):
-            lowest = schedules[0]
+            lowest: Optional[Schedule] = None
+            lowest_price = 0.0
 
-            for schedule in schedules[1:]:
-                if schedule.get_total_price(self.price_function) < lowest.get_total_price(self.price_function):
+            for schedule in schedules:
+                total_price = schedule.get_total_price(self.price_function)
+                if lowest is None or total_price < lowest_price:
                     lowest = schedule
+                    lowest_price = total_price
 
                 # Go through and see if the task prices are new highs.
                 for scheduled_task in schedule.tasks:
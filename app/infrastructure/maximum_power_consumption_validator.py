@@ -1,14 +1,111 @@
+from __future__ import annotations
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+from infrastructure.load_profile_index import power_pieces
+from infrastructure.power_usage_function import PowerUsageFunction
 from infrastructure.schedule import Schedule, ScheduleValidator
 from infrastructure.schedule_task import ScheduledTask
 from infrastructure.task import Task
 
 
+class ScheduledPowerProfile:
+    """The power consumption of scheduled tasks as one sorted list of the times where it can change.
+
+    The consumption is constant from each time until the next, so it is only calculated once for each time and only when it is needed.
+    """
+    times: List[datetime]
+
+    def __init__(self, validator: MaximumPowerConsumptionValidator, tasks: List[ScheduledTask]) -> None:
+        self.validator = validator
+        self.tasks = tasks
+        self.length = len(tasks)
+        self.consumptions: Dict[int, float] = {}
+
+        times = set()
+        for scheduled_task in tasks:
+            start = scheduled_task.start_interval.start
+            flexibility = scheduled_task.start_interval.duration
+            # The end is exclusive, so the task stops consuming power at the end.
+            end = start + flexibility + scheduled_task.task.duration
+            times.add(start)
+            times.add(end)
+
+            # The greatest consumption changes when either end of the flexible runtime window passes a power point.
+            for offset in power_offsets(scheduled_task.task.power_usage_function):
+                for time in (start + offset, start + offset - flexibility):
+                    if time >= start and time <= end:
+                        times.add(time)
+        self.times = sorted(times)
+
+    def is_for(self, tasks: List[ScheduledTask]) -> bool:
+        return self.tasks is tasks and self.length == len(tasks)
+
+    def consumption_at(self, time: datetime) -> float:
+        index = bisect_right(self.times, time) - 1
+        if index < 0:
+            return 0.0
+
+        if index not in self.consumptions:
+            self.consumptions[index] = self.validator.power_consumption_at(self.tasks, self.times[index])
+        return self.consumptions[index]
+
+    def times_between(self, start: datetime, end: datetime) -> List[datetime]:
+        """Gets the times strictly after the start and before the end."""
+        return self.times[bisect_right(self.times, start):bisect_left(self.times, end)]
+
+
+def power_offsets(power_usage_function: PowerUsageFunction) -> List[timedelta]:
+    return [power_usage_function.get_domain(point) for point in power_usage_function.set]
+
+
 class MaximumPowerConsumptionValidator(ScheduleValidator):
-    def __init__(self, maximum_consumption: float) -> None:
+    def __init__(
+        self,
+        maximum_consumption: float,
+        maximum_consumption_points: List[Tuple[datetime, float]] = [],
+        resolution: timedelta = timedelta(minutes=1)
+    ) -> None:
+        """
+        Args:
+            maximum_consumption (float): The greatest total kw until the first maximum consumption point.
+            maximum_consumption_points (List[Tuple[datetime, float]]): The times the greatest total kw changes, e.g. for capacity tariffs.
+            resolution (timedelta): The length of each slot in the load profile of the schedules.
+        """
         super().__init__()
         self.maximum_consumption = maximum_consumption
+        self.maximum_consumption_points = sorted(maximum_consumption_points)
+        self.resolution = resolution
+        self._maximum_consumption_times = [time for (time, _) in self.maximum_consumption_points]
+        self._profile: Optional[ScheduledPowerProfile] = None
+
+    def maximum_consumption_at(self, time: datetime) -> float:
+        index = bisect_right(self._maximum_consumption_times, time) - 1
+        if index < 0:
+            return self.maximum_consumption
+        (_, maximum_consumption) = self.maximum_consumption_points[index]
+        return maximum_consumption
+
+    def maximum_consumption_segments(self, start_time: datetime, end_time: datetime) -> List[Tuple[datetime, datetime, float]]:
+        """Splits the time from the start until the exclusive end by where the greatest total kw changes.
+
+        Returns:
+            List[Tuple[datetime, datetime, float]]: The start, exclusive end and greatest total kw of each segment.
+        """
+        segments: List[Tuple[datetime, datetime, float]] = []
+        segment_start = start_time
+        for time in self._maximum_consumption_times[bisect_right(self._maximum_consumption_times, start_time):]:
+            if time >= end_time: break
+            segments.append((segment_start, time, self.maximum_consumption_at(segment_start)))
+            segment_start = time
+        segments.append((segment_start, end_time, self.maximum_consumption_at(segment_start)))
+        return segments
+
+    def profile_for(self, tasks: List[ScheduledTask]) -> ScheduledPowerProfile:
+        """Gets the power profile of the scheduled tasks, it is reused while the same tasks are validated against."""
+        if self._profile is None or not self._profile.is_for(tasks):
+            self._profile = ScheduledPowerProfile(self, tasks)
+        return self._profile
 
     def power_consumption_at(self, tasks: List[ScheduledTask], time: datetime) -> float:
         power_consumption = 0.0
@@ -53,49 +150,48 @@ class MaximumPowerConsumptionValidator(ScheduleValidator):
         return next
 
     def validate(self, schedule: Schedule, task: Task, start_time: datetime) -> bool:
-        current_time = start_time
-        while not current_time is None:
-            # Calculate runtime for task to schedule and check if it exceeds the task's duration.
-            runtime = current_time - start_time
-            if runtime >= task.duration:
-                break
-
-            # Get the task power consumption.
-            task_consumption = task.power_usage_function.apply(runtime)
-
-            # Get power consumption at the current time.
-            established_consumption = self.power_consumption_at(schedule.tasks, current_time)
-            total_consumption = established_consumption + task_consumption
+        """Checks the total power consumption while the task runs from the start time until its exclusive end.
+
+        The load profile of the schedule answers this with a range-max query for each constant power piece of the task.
+        When the load profile is not exact on its grid it falls back to a sweep over the changes of the consumption.
+        """
+        segments = [
+            (segment_start, segment_end, power, maximum_consumption)
+            for (piece_start, piece_end, power) in power_pieces(task, start_time)
+            for (segment_start, segment_end, maximum_consumption) in self.maximum_consumption_segments(piece_start, piece_end)
+        ]
+
+        load_profile = schedule.load_profile_index(self.resolution)
+        if load_profile.is_exact and all(
+            load_profile.is_aligned(segment_start) and load_profile.is_aligned(segment_end)
+            for (segment_start, segment_end, _, _) in segments
+        ):
+            for (segment_start, segment_end, power, maximum_consumption) in segments:
+                if load_profile.maximum_between(segment_start, segment_end) + power > maximum_consumption:
+                    return False
+            return True
+
+        return self.validate_by_sweep(schedule, task, start_time, [segment_start for (segment_start, _, _, _) in segments])
+
+    def validate_by_sweep(self, schedule: Schedule, task: Task, start_time: datetime, times: List[datetime]) -> bool:
+        """Checks the total power consumption in a single sweep over the times where it can change while the task runs.
+
+        The consumption is constant between the changes, so the changes of the task itself are given as the times.
+        """
+        profile = self.profile_for(schedule.tasks)
+        end_time = start_time + task.duration
+
+        # Merge the changes of the scheduled tasks with the changes of the task itself.
+        merged_times = set(profile.times_between(start_time, end_time))
+        merged_times.update(times)
+
+        for time in sorted(merged_times):
+            # Get the task power consumption and the power consumption of the schedule.
+            task_consumption = task.power_usage_function.apply(time - start_time)
+            total_consumption = profile.consumption_at(time) + task_consumption
 
             # Check if we exceed the limit.
-            if total_consumption > self.maximum_consumption:
+            if total_consumption > self.maximum_consumption_at(time):
                 return False
 
-            # The next point might be the next power usage point and not schedule power usage point.
-            next_power_consumption_point = task.power_usage_function.next_discrete_point_from(
-                timedelta(), runtime, task.duration
-            )
-
-            # We did not exceed the power consumption limit so we proceed to the next point.
-            next_time = self.next_power_consumption_from(
-                schedule.tasks, current_time
-            )
-
-            # If we have a succeeding power consumption point then we should consider it
-            if next_power_consumption_point is not None:
-                next_runtime = next_power_consumption_point[0]
-                next_runtime_time = next_runtime + current_time
-
-                # Either we dont have a next time and can just use next runtime time or
-                # the power consumption point is the closest then that is the next step.
-                if next_time is None:
-                    next_time = next_runtime_time
-                elif next_runtime_time < current_time:
-                    next_time = next_runtime_time
-
-            # Check if there was one if so then set current to be that.
-            if next_time is None:
-                break
-            current_time = next_time
-
-        return True
\ No newline at end of file
+        return True
@@ -3,6 +3,7 @@ from typing import List
 
 from infrastructure.must_start_between_validator import MustStartBetweenValidator
 from infrastructure.datetime_interval import DatetimeInterval
+from infrastructure.start_interval_set import StartIntervalSet
 from infrastructure.task import Task, TaskValidator
 
 
@@ -20,6 +21,13 @@ class MustEndBetweenValidator(TaskValidator):
         must_start_between_validator = self.create_must_start_between_validator_for(task)
         return must_start_between_validator.start_times(task)
 
+    def start_intervals(self, task: Task) -> StartIntervalSet:
+        return StartIntervalSet([(
+            self.end_time_interval.start - task.duration, self.end_time_interval.end - task.duration
+        )])
+
     def validate(self, task: Task, start_time: datetime) -> bool:
-        must_start_between_validator = self.create_must_start_between_validator_for(task)
-        return must_start_between_validator.validate(task, start_time)
\ No newline at end of file
+        # The same as the must start between validator for the task, without creating it.
+        end_time = start_time + task.duration
+        return end_time >= self.end_time_interval.start and \
+            end_time <= self.end_time_interval.end
\ No newline at end of file
@@ -1,8 +1,9 @@
 from datetime import datetime
-from typing import List
+from typing import List, Set
 
 from infrastructure.discrete_function_iterator import DiscreteFunctionIterator
 from infrastructure.datetime_interval import DatetimeInterval
+from infrastructure.start_interval_set import StartIntervalSet
 from infrastructure.task import Task, TaskValidator
 
 
@@ -12,7 +13,8 @@ class MustStartBetweenValidator(TaskValidator):
         self.start_time_interval = start_time_interval
     
     def start_times(self, task: Task) -> List[datetime]:
-        start_times = []
+        start_times: List[datetime] = []
+        seen: Set[datetime] = set()
 
         # Iterate over all runtime intervals between the "start_time_interval" and "duration"
         for runtime in DiscreteFunctionIterator(
@@ -20,15 +22,20 @@ class MustStartBetweenValidator(TaskValidator):
             end=self.start_time_interval.duration
         ):
             earliest_start_time = self.start_time_interval.start + runtime
-            if not earliest_start_time in start_times:
+            if not earliest_start_time in seen:
+                seen.add(earliest_start_time)
                 start_times.append(earliest_start_time)
 
             last_start_time = self.start_time_interval.end - runtime
-            if not last_start_time in start_times:
+            if not last_start_time in seen:
+                seen.add(last_start_time)
                 start_times.append(last_start_time)
 
         return start_times
 
+    def start_intervals(self, task: Task) -> StartIntervalSet:
+        return StartIntervalSet([(self.start_time_interval.start, self.start_time_interval.end)])
+
     def validate(self, task: Task, start_time: datetime) -> bool:
         return start_time >= self.start_time_interval.start and \
             start_time <= self.start_time_interval.end
\ No newline at end of file
@@ -1,7 +1,7 @@
 import math
 from datetime import datetime, timedelta
 from typing import List, Optional
-from domain import PricePoint
+from domain import PriceRecord
 
 from opentelemetry import trace
 tracer = trace.get_tracer(__name__)
@@ -10,7 +10,7 @@ class OptimalTimeCalculator:
     def __init__(self) -> None:
         pass
 
-    def calculate_optimal_time(self, price_points: List[PricePoint], duration: timedelta) -> int:
+    def calculate_optimal_time(self, price_points: List[PriceRecord], duration: timedelta) -> int:
         with tracer.start_as_current_span("CalculateOptimalTime"):
             has_incomplete_interval = False
             no_of_complete_intervals = int(duration.seconds / 3600)
@@ -0,0 +1,91 @@
+from __future__ import annotations
+from datetime import datetime, timedelta
+from typing import List, NamedTuple, Optional
+
+from infrastructure.datetime_interval import DatetimeInterval
+from infrastructure.schedule import Schedule
+from infrastructure.schedule_task import ScheduledTask
+from infrastructure.task import Task
+
+
+class Placement(NamedTuple):
+    task_index: int
+    start: datetime
+    cost: float
+
+
+class PersistentSchedule:
+    """An immutable schedule used while searching, where placing a task shares the parent instead of copying it.
+
+    Each schedule only keeps its own placement and a link to its parent, the placed tasks are indices into the tasks being scheduled.
+    The full schedule to validate placements against is created once per expanded schedule from the parent's.
+    """
+    parent: Optional[PersistentSchedule]
+    placement: Optional[Placement]
+    cost: float
+    depth: int
+
+    def __init__(
+        self,
+        base: Schedule,
+        tasks: List[Task],
+        parent: Optional[PersistentSchedule] = None,
+        placement: Optional[Placement] = None
+    ) -> None:
+        self.base = base
+        self.tasks = tasks
+        self.parent = parent
+        self.placement = placement
+        self.cost = 0.0 if parent is None or placement is None else parent.cost + placement.cost
+        self.depth = 0 if parent is None else parent.depth + 1
+        self._validation_schedule: Optional[Schedule] = None
+
+    def place(self, placement: Placement) -> PersistentSchedule:
+        return PersistentSchedule(self.base, self.tasks, self, placement)
+
+    def placements(self) -> List[Placement]:
+        """Gets the placements from the first to the last placed task."""
+        placements: List[Placement] = []
+        node: Optional[PersistentSchedule] = self
+        while node is not None and node.placement is not None:
+            placements.append(node.placement)
+            node = node.parent
+        placements.reverse()
+        return placements
+
+    def validation_schedule(self) -> Schedule:
+        """Gets the full schedule to validate placing more tasks against, which is created once from the parent's validation schedule.
+        It must not be changed, "to_schedule" creates a schedule which can be changed.
+        """
+        # Walk up to the closest schedule whose validation schedule is created, such that long chains are not recursed.
+        missing: List[PersistentSchedule] = []
+        node = self
+        while node._validation_schedule is None and node.parent is not None:
+            missing.append(node)
+            node = node.parent
+        if node._validation_schedule is None:
+            node._validation_schedule = node.base.copy()
+
+        schedule = node._validation_schedule
+        for node in reversed(missing):
+            # Every schedule with a parent has placed a task.
+            assert node.placement is not None
+            schedule = schedule.copy()
+            schedule.add(ScheduledTask(
+                DatetimeInterval(node.placement.start, timedelta()),
+                node.tasks[node.placement.task_index],
+                node.placement.cost
+            ))
+            node._validation_schedule = schedule
+        return schedule
+
+    def to_schedule(self) -> Schedule:
+        """Creates a full schedule with the tasks of the base schedule followed by the placed tasks."""
+        scheduled_tasks = self.base.tasks.copy()
+        for placement in self.placements():
+            scheduled_tasks.append(ScheduledTask(
+                DatetimeInterval(placement.start, timedelta()),
+                self.tasks[placement.task_index],
+                placement.cost
+            ))
+        return Schedule(scheduled_tasks, self.base.validator)
@@ -1,7 +1,7 @@
 from typing import List, Optional
 
-from domain import Co2EmissionPoint
-from infrastructure.eds_requests import PricePoint
+from domain import EmissionRecord, PriceRecord
+from infrastructure.time_series import TimeSeries
 import psycopg2
 from psycopg2 import extras
 from datetime import datetime
@@ -21,7 +21,7 @@ class PostgresDatabase:
             )
             self.cursor = self.conn.cursor()
 
-    def get_prices(self, start_time: datetime, ascending: bool = False) -> List[PricePoint]:
+    def get_prices(self, start_time: datetime, ascending: bool = False) -> List[PriceRecord]:
         query = f"SELECT * FROM pricepoint WHERE _time >= '{start_time.isoformat()}'"
         if ascending:
             query += " ORDER BY _time ASC"
@@ -29,35 +29,45 @@ class PostgresDatabase:
 
         self.cursor.execute(query)
         rows = self.cursor.fetchall()
-        price_points: List[PricePoint] = [PricePoint(datetime.fromisoformat(str(row[0])), float(row[1])) for row in rows]
+        price_points: List[PriceRecord] = [PriceRecord(datetime.fromisoformat(str(row[0])), float(row[1])) for row in rows]
 
         return price_points
 
-    def get_latest_price_point(self) -> Optional[PricePoint]:
+    def get_price_series(self, start_time: datetime, ascending: bool = False) -> TimeSeries:
+        """Gets the prices like "get_prices", but fills the arrays of a series directly from the rows."""
+        query = f"SELECT _time, _price FROM pricepoint WHERE _time >= '{start_time.isoformat()}'"
+        if ascending:
+            query += " ORDER BY _time ASC"
+        else: query += " ORDER BY _time DESC"
+
+        self.cursor.execute(query)
+        return TimeSeries.from_rows(self.cursor.fetchall())
+
+    def get_latest_price_point(self) -> Optional[PriceRecord]:
         query = "SELECT * FROM pricepoint ORDER BY _time DESC LIMIT 1"
         self.cursor.execute(query)
         row = self.cursor.fetchone()
 
         if row is None:
             return None
-        return PricePoint(datetime.fromisoformat(str(row[0])), float(row[1]))
+        return PriceRecord(datetime.fromisoformat(str(row[0])), float(row[1]))
 
-    def get_earliest_price_point(self) -> Optional[PricePoint]:
+    def get_earliest_price_point(self) -> Optional[PriceRecord]:
         query = "SELECT * FROM pricepoint ORDER BY _time ASC LIMIT 1"
         self.cursor.execute(query)
         row = self.cursor.fetchone()
 
         if row is None:
             return None
-        return PricePoint(datetime.fromisoformat(str(row[0])), float(row[1]))
+        return PriceRecord(datetime.fromisoformat(str(row[0])), float(row[1]))
 
-    def insert_prices(self, price_points: List[PricePoint]) -> None:
+    def insert_prices(self, price_points: List[PriceRecord]) -> None:
         query = "INSERT INTO pricepoint (_time, _price) VALUES %s ON CONFLICT DO NOTHING"
         values = [(price_point.time.isoformat(), price_point.price) for price_point in price_points]
         extras.execute_values(self.cursor, query, values)
         self.conn.commit()
 
-    def get_emissions(self, start_time: datetime, ascending: bool = False) -> List[Co2EmissionPoint]:
+    def get_emissions(self, start_time: datetime, ascending: bool = False) -> List[EmissionRecord]:
         query = f"SELECT * FROM emissions WHERE _time >= '{start_time.isoformat()}'"
         if ascending:
             query += " ORDER BY _time ASC"
@@ -65,29 +75,39 @@ class PostgresDatabase:
 
         self.cursor.execute(query)
         rows = self.cursor.fetchall()
-        price_points: List[Co2EmissionPoint] = [Co2EmissionPoint(datetime.fromisoformat(str(row[0])), float(row[1])) for row in rows]
+        price_points: List[EmissionRecord] = [EmissionRecord(datetime.fromisoformat(str(row[0])), float(row[1])) for row in rows]
 
         return price_points
 
-    def get_latest_emission(self) -> Optional[Co2EmissionPoint]:
+    def get_emission_series(self, start_time: datetime, ascending: bool = False) -> TimeSeries:
+        """Gets the emissions like "get_emissions", but fills the arrays of a series directly from the rows."""
+        query = f"SELECT _time, _emission FROM emissions WHERE _time >= '{start_time.isoformat()}'"
+        if ascending:
+            query += " ORDER BY _time ASC"
+        else: query += " ORDER BY _time DESC"
+
+        self.cursor.execute(query)
+        return TimeSeries.from_rows(self.cursor.fetchall())
+
+    def get_latest_emission(self) -> Optional[EmissionRecord]:
         query = "SELECT * FROM emissions ORDER BY _time DESC LIMIT 1"
         self.cursor.execute(query)
         row = self.cursor.fetchone()
 
         if row is None:
             return None
-        return Co2EmissionPoint(datetime.fromisoformat(str(row[0])), float(row[1]))
+        return EmissionRecord(datetime.fromisoformat(str(row[0])), float(row[1]))
 
-    def get_earliest_emission(self) -> Optional[Co2EmissionPoint]:
+    def get_earliest_emission(self) -> Optional[EmissionRecord]:
         query = "SELECT * FROM emissions ORDER BY _time ASC LIMIT 1"
         self.cursor.execute(query)
         row = self.cursor.fetchone()
 
         if row is None:
             return None
-        return Co2EmissionPoint(datetime.fromisoformat(str(row[0])), float(row[1]))
+        return EmissionRecord(datetime.fromisoformat(str(row[0])), float(row[1]))
 
-    def insert_emissions(self, emission_point: List[Co2EmissionPoint]) -> None:
+    def insert_emissions(self, emission_point: List[EmissionRecord]) -> None:
         query = "INSERT INTO emissions (_time, _emission) VALUES %s ON CONFLICT DO NOTHING"
         values = [(price_point.time.isoformat(), price_point.emission) for price_point in emission_point]
         extras.execute_values(self.cursor, query, values)
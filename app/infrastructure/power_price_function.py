@@ -1,11 +1,14 @@
 from datetime import datetime, timedelta
-from typing import Optional, Tuple
+from typing import Optional, Sequence, Tuple
+
+import numpy as np
 from infrastructure.discrete_function import DiscreteFunction
+from infrastructure.discrete_timeline import DiscreteTimelineCache
 
 from infrastructure.power_usage_function import PowerUsageFunction
 from infrastructure.spot_price_function import SpotPriceFunction
 from infrastructure.zipped_discrete_function import ZippedDiscreteFunction
-from domain import PricePoint
+from domain import PriceRecord
 from infrastructure.discrete_function_iterator import DiscreteFunctionIterator
 from infrastructure.scheduled_power_usage_function import ScheduledPowerUsageFunction
 
@@ -19,7 +22,7 @@ class ZippedPowerPriceFunction(
         # Integrals 
         float, float, 
         # discrete points
-        PricePoint, Tuple[timedelta, float],
+        PriceRecord, Tuple[timedelta, float],
         # Step
         timedelta
     ]
@@ -98,6 +101,7 @@ class PowerPriceFunction(
         super().__init__([])
         self.power_usage_function = power_usage_function
         self.spot_price_function = spot_price_function
+        self.timelines = DiscreteTimelineCache(self.find_next_discrete_point_from, self.get_domain)
 
     @property
     def min_domain(self) -> Tuple[datetime, timedelta]:
@@ -151,6 +155,25 @@ class PowerPriceFunction(
         argument: Tuple[datetime, timedelta],
         global_max: Tuple[datetime, timedelta],
     ) -> Optional[Tuple[datetime, timedelta]]:
+        # Boundary check
+        if argument < global_min: return None
+        if argument > global_max: return None
+
+        # Only arguments where the time and delta have moved equally from the minimum are on the timeline.
+        (min_time, min_delta) = global_min
+        (time, delta) = argument
+        if not time - min_time == delta - min_delta:
+            return self.find_next_discrete_point_from(global_min, argument, global_max)
+
+        return self.timelines.next_from(global_min, argument, global_max)
+
+    def find_next_discrete_point_from(
+        self,
+        global_min: Tuple[datetime, timedelta],
+        argument: Tuple[datetime, timedelta],
+        global_max: Tuple[datetime, timedelta],
+    ) -> Optional[Tuple[datetime, timedelta]]:
+        """Finds the next discrete point by querying both functions, without the timeline."""
         # TODO: Generalise this method.
 
         # Boundary check
@@ -220,4 +243,19 @@ class PowerPriceFunction(
         return self.integrate(
             (start, start_duration),
             (start + duration, start_duration + duration)
-        )
\ No newline at end of file
+        )
+
+    def integrate_many(self, starts: Sequence[datetime], duration: timedelta) -> np.ndarray:
+        """Calculates "integrate_from_to" for many start times in one vectorised pass.
+
+        Args:
+            starts (Sequence[datetime]): The start times.
+            duration (timedelta): The runtime from each start time.
+
+        Returns:
+            np.ndarray: The integral for each of the start times.
+        """
+        (offsets, powers) = self.power_usage_function.power_segments(duration)
+        return self.spot_price_function.integrate_profile_many(
+            self.spot_price_function.to_epochs(starts), offsets, powers
+        )
@@ -1,6 +1,8 @@
 from datetime import timedelta
 from typing import List, Optional, Tuple
 
+import numpy as np
+
 from infrastructure.discrete_function import DiscreteFunction
 
 
@@ -15,6 +17,7 @@ class PowerUsageFunction(DiscreteFunction[timedelta, float, float, Tuple[timedel
         (first_time, first_power) = power_points[0]
         if first_time > self.min_domain:
             power_points.insert(0, (self.min_domain, first_power))
+            self.index_discrete_points()
 
         min_step = extend_by
         (last_time, _) = power_points[0]
@@ -93,6 +96,40 @@ class PowerUsageFunction(DiscreteFunction[timedelta, float, float, Tuple[timedel
     def duration(self) -> timedelta:
         return self.max_domain - self.min_domain
 
+    def constant_power(self) -> Optional[float]:
+        """Gets the kw if it is the same over the whole domain.
+
+        Returns:
+            Optional[float]: The kw or None if it changes over the domain.
+        """
+        power = self.get_codomain(self.set[0])
+        for point in self.set[1:]:
+            if not self.get_codomain(point) == power:
+                return None
+        return power
+
+    def power_segments(self, duration: timedelta) -> Tuple[np.ndarray, np.ndarray]:
+        """Gets the constant power segments from the min domain until the duration.
+
+        Args:
+            duration (timedelta): The runtime to get the power segments until.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The segment boundaries in seconds and the kw of each segment.
+        """
+        if not self.is_valid_argument(duration):
+            raise ValueError("The argument is outside the domain boundaries")
+
+        offsets: List[float] = []
+        powers: List[float] = []
+        for point in self.set:
+            offset = self.get_domain(point)
+            if offset >= duration: break
+            offsets.append(offset.total_seconds())
+            powers.append(self.get_codomain(point))
+        offsets.append(duration.total_seconds())
+
+        return (np.array(offsets, dtype=np.float64), np.array(powers, dtype=np.float64))
 
     def apply(self, argument: timedelta) -> float:
         """Calculates the kw at the current time.
@@ -1,8 +1,9 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Optional
 
+from infrastructure.load_profile_index import LoadProfileIndex
 from infrastructure.schedule_task import ScheduledTask
 from infrastructure.spot_price_function import SpotPriceFunction
 from infrastructure.co2_emission_function import Co2EmissionFunction
@@ -24,13 +25,31 @@ class Schedule:
     def __init__(
             self,
             tasks: List[ScheduledTask] = [],
-            validator: Optional[ScheduleValidator] = None
+            validator: Optional[ScheduleValidator] = None,
+            load_profile: Optional[LoadProfileIndex] = None
         ) -> None:
         self.tasks = tasks
         self.validator = validator
+        self.load_profile = load_profile
 
     def add(self, task: ScheduledTask) -> None:
         self.tasks.append(task)
+        if self.load_profile is not None:
+            self.load_profile.add(task)
+
+    def load_profile_index(self, resolution: timedelta) -> LoadProfileIndex:
+        """Gets the load profile of the scheduled tasks, it is built on first use and then kept up to date by "add".
+        It is rebuilt if the tasks were changed without "add", e.g. if a task is replaced.
+
+        Args:
+            resolution (timedelta): The length of each slot in the time grid.
+
+        Returns:
+            LoadProfileIndex: The load profile of the scheduled tasks.
+        """
+        if self.load_profile is None or self.load_profile.resolution != resolution or not self.load_profile.indexes(self.tasks):
+            self.load_profile = LoadProfileIndex.from_tasks(self.tasks, resolution)
+        return self.load_profile
 
     def get_total_price(self, price_function: SpotPriceFunction) -> float:
         total_price = 0.0
@@ -44,11 +63,18 @@ class Schedule:
             total_emission += task.get_max_emission(emission_function)
         return total_emission
 
-    def can_schedule_task_at(self, task: Task, start_time: datetime) -> bool:
+    def can_schedule_task_at(self, task: Task, start_time: datetime, scheduleable: Optional[bool] = None) -> bool:
+        """Checks if the task can be scheduled at the start time.
+
+        Args:
+            scheduleable (Optional[bool]): Whether the task constraints allows the start time, if it is already known.
+        """
         if self.validator is None:
             return True
 
-        if not task.is_scheduleable_at(start_time):
+        if scheduleable is None:
+            scheduleable = task.is_scheduleable_at(start_time)
+        if not scheduleable:
             return False
 
         if not self.validator.validate(self, task, start_time):
@@ -57,4 +83,6 @@ class Schedule:
         return True
 
     def copy(self) -> Schedule:
-        return Schedule(self.tasks.copy(), self.validator)
\ No newline at end of file
+        # The load profile shares its tree with the copy, so it is copied in constant time and then updated by "add".
+        load_profile = None if self.load_profile is None else self.load_profile.copy()
+        return Schedule(self.tasks.copy(), self.validator, load_profile)
\ No newline at end of file
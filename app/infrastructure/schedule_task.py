@@ -5,6 +5,7 @@ from infrastructure.discrete_function_iterator import DiscreteFunctionIterator
 from infrastructure.power_emission_function import PowerEmissionFunction
 from infrastructure.datetime_interval import DatetimeInterval
 from infrastructure.power_price_function import PowerPriceFunction
+from infrastructure.constant_power_price_function import ConstantPowerPriceFunction
 from infrastructure.spot_price_function import SpotPriceFunction
 from infrastructure.co2_emission_function import Co2EmissionFunction
 from infrastructure.task import Task
@@ -89,7 +90,10 @@ class ScheduledTask:
         return greatest_emission
 
     def get_max_total_price(self, price_function: SpotPriceFunction) -> float:
-        power_price_function = PowerPriceFunction(
+        # Constant power tasks are integrated in closed form from the cumulative prices.
+        power_price_function = ConstantPowerPriceFunction.create(
+            self.task.power_usage_function, price_function
+        ) or PowerPriceFunction(
             self.task.power_usage_function, price_function
         )
 
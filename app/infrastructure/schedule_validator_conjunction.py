@@ -11,7 +11,8 @@ class ScheduleValidatorConjunction(ScheduleValidator):
         self.validators = validators
 
     def list_intersection(self, lhs: List, rhs: List) -> List:
-        return [value for value in lhs if value in rhs]
+        rhs_values = set(rhs)
+        return [value for value in lhs if value in rhs_values]
 
     def relevante_datetime(self, schedule: Schedule, task: Task, start_time: datetime) -> List[datetime]:
         if len(self.validators) == 0:
@@ -11,7 +11,8 @@ class ScheduleValidatorDisjunction(ScheduleValidator):
         self.validators = validators
 
     def list_union(self, lhs: List, rhs: List) -> List:
-        return list(set(lhs) | set(rhs))
+        # The keys of a dictionary are unique and keep their order.
+        return list(dict.fromkeys(lhs + rhs))
 
     def relevante_datetime(self, schedule: Schedule, task: Task, start_time: datetime) -> List[datetime]:
         if len(self.validators) == 0:
@@ -1,58 +1,137 @@
 from __future__ import annotations
 from datetime import datetime, timedelta
-import itertools
-from typing import List, Optional
+import time
+from typing import Iterator, List, Optional, Set, Tuple
 
+from infrastructure.cost_curve_cache import CostCurveCache
 from infrastructure.datetime_interval import DatetimeInterval
+from infrastructure.persistent_schedule import PersistentSchedule, Placement
 from infrastructure.schedule import Schedule
+from infrastructure.search_budget import SearchBudget, SearchStatistics
 from infrastructure.schedule_task import ScheduledTask
 from infrastructure.task import Task
+from infrastructure.task_fingerprinter import TaskFingerprinter
+from infrastructure.task_start_memo import TaskStartMemo
+from infrastructure.time_series import to_epoch
 from infrastructure.spot_price_function import SpotPriceFunction
 from infrastructure.power_price_function import PowerPriceFunction
+from infrastructure.constant_power_price_function import ConstantPowerPriceFunction
 
 from opentelemetry import trace
 tracer = trace.get_tracer(__name__)
 
 class Scheduler:
+    budget: SearchBudget
+    statistics: SearchStatistics
+
     def __init__(
         self,
         price_function: SpotPriceFunction,
+        budget: Optional[SearchBudget] = None,
+        cost_curves: Optional[CostCurveCache] = None,
+        resolution: Optional[timedelta] = None,
     ) -> None:
         self.price_function = price_function
+        # The start times are snapped to a grid of this resolution, or kept as they are if None.
+        self.resolution = resolution
+        self.snapped = False
+        self.budget = SearchBudget() if budget is None else budget
+        # The costs are only cached for this scheduler unless a cache shared between schedulers is given.
+        self.cost_curves = CostCurveCache() if cost_curves is None else cost_curves
+        self.statistics = SearchStatistics()
+        self.search_started = time.monotonic()
+        self.price_seeds: Optional[List[datetime]] = None
+        self.task_start_memo = TaskStartMemo()
+
+    def start_search(self) -> None:
+        self.statistics = SearchStatistics()
+        self.search_started = time.monotonic()
+        self.task_start_memo.clear()
+        self.snapped = False
+
+    def is_budget_exhausted(self) -> bool:
+        """Checks whether the search has used its budget, once exhausted it stays exhausted for the rest of the search."""
+        self.statistics.elapsed = timedelta(seconds=time.monotonic() - self.search_started)
+        if self.budget.is_exhausted(self.statistics):
+            self.statistics.budget_exhausted = True
+        return self.statistics.budget_exhausted
+
+    def is_optimal(self) -> bool:
+        """Whether the best of the generated schedules is proven to be the schedule with the lowest total cost.
+        Snapping a start time to the resolution might have moved it away from the lowest cost.
+        """
+        return not self.statistics.budget_exhausted and not self.snapped
+
+    def get_price_seeds(self) -> List[datetime]:
+        """Gets the times where the price function changes, they are only calculated once per scheduler."""
+        if self.price_seeds is None:
+            self.price_seeds = [
+                self.price_function.get_domain(point)
+                for point in self.price_function.get_all_discrete_points()
+            ]
+        return self.price_seeds
 
     def get_all_possible_start_times(
         self,
         task: Task,
         schedule: Optional[Schedule] = None
     ) -> List[datetime]:
+        """Gets the unique times the task could start at relative to the price changes, the scheduled tasks and its own constraints.
+
+        Returns:
+            List[datetime]: The start times in ascending order.
+        """
         # Add all price function changes as seeds.
-        seed_datetimes = [
-            self.price_function.get_domain(point)
-            for point in self.price_function.get_all_discrete_points()
-        ]
+        seed_datetimes = set(self.get_price_seeds())
 
         # For each scheduled task we also use there relevant datetimes as seeds.
         if not schedule is None:
             for scheduled_task in schedule.tasks:
-                for relevant_time in scheduled_task.derieve_start_times():
-                    seed_datetimes.append(relevant_time)
+                seed_datetimes.update(scheduled_task.derieve_start_times())
 
         # The task can possibly also be cosntrained in such a way that it has custom starting points.
-        for start_time in task.start_times():
-            seed_datetimes.append(start_time)
+        seed_datetimes.update(task.start_times())
 
         # Calculate all the relevant datetimes for the task relvative to the seeds.
-        relevant_datetimes = []
+        relevant_datetimes = set()
         for start_time in seed_datetimes:
-            for relevant_time in task.derieve_start_times(start_time):
-                if not (self.price_function.is_valid_argument(relevant_time) and \
-                        self.price_function.is_valid_argument(relevant_time + task.duration)):
-                    continue
+            relevant_datetimes.update(task.derieve_start_times(start_time))
+
+        if self.resolution is not None:
+            relevant_datetimes = self.snap_start_times(task, relevant_datetimes, self.resolution)
+
+        return sorted(
+            relevant_time for relevant_time in relevant_datetimes
+            if self.price_function.is_valid_argument(relevant_time) and \
+                self.price_function.is_valid_argument(relevant_time + task.duration)
+        )
+
+    def snap_start_times(self, task: Task, start_times: Set[datetime], resolution: timedelta) -> Set[datetime]:
+        """Snaps the start times to the grid of the resolution, such that nearly identical start times become the same.
+
+        A start time is snapped down to the grid, or up if the task cannot start there.
+        If the task can start at neither it is kept as it is, such that a constraint narrower than the grid can still be met.
 
-                if not relevant_time in relevant_datetimes:
-                    relevant_datetimes.append(relevant_time)
+        Returns:
+            Set[datetime]: The unique snapped start times.
+        """
+        snapped: Set[datetime] = set()
+        for start_time in start_times:
+            remainder = timedelta(seconds=to_epoch(start_time) % resolution.total_seconds())
+            if remainder == timedelta():
+                snapped.add(start_time)
+                continue
 
-        return relevant_datetimes
+            self.snapped = True
+            floor = start_time - remainder
+            ceiling = floor + resolution
+            if task.is_scheduleable_at(floor):
+                snapped.add(floor)
+            elif task.is_scheduleable_at(ceiling):
+                snapped.add(ceiling)
+            else:
+                snapped.add(start_time)
+        return snapped
 
     def get_all_possible_extrapolated_start_times(
         self,
@@ -66,9 +145,6 @@ class Scheduler:
             intervals: List[DatetimeInterval] = []
             all_start_points = self.get_all_possible_start_times(task, schedule)
 
-            # Make sure that the times are sorted in ascending order.
-            all_start_points.sort(reverse=False)
-
             if len(all_start_points) == 0:
                 return []
 
@@ -94,6 +170,62 @@ class Scheduler:
 
             return intervals
 
+    def placements_for(
+        self,
+        task: Task,
+        schedule: Schedule,
+        task_index: Optional[int] = None
+    ) -> List[Tuple[datetime, float]]:
+        """Finds every start time the task can be scheduled at in the schedule.
+
+        Args:
+            task_index (Optional[int]): The index of the task in the search, if given the cost and task constraints are memoised.
+
+        Returns:
+            List[Tuple[datetime, float]]: The start times and the cost of the task at each of them.
+        """
+        all_start_times = self.get_all_possible_start_times(task, schedule)
+
+        # If the task cannot be scheduled because of e.g. time and total power constraint then it is skipped.
+        if task_index is None:
+            start_times = [
+                start_time for start_time in all_start_times
+                if schedule.can_schedule_task_at(task, start_time)
+            ]
+            costs = self.costs_for(task, start_times)
+        else:
+            # Only the checks against the schedule differs between the branches of the search.
+            start_times = [
+                start_time for start_time in all_start_times
+                if schedule.can_schedule_task_at(
+                    task, start_time, self.task_start_memo.is_scheduleable_at(task_index, task, start_time)
+                )
+            ]
+            costs = self.task_start_memo.costs_at(
+                task_index, start_times, lambda missing: self.costs_for(task, missing)
+            )
+
+        self.statistics.candidates += len(start_times)
+        return list(zip(start_times, costs))
+
+    def costs_for(self, task: Task, start_times: List[datetime]) -> List[float]:
+        """Calculates the cost of the task at each of the start times at once.
+        The costs are shared by every request with the same power usage function and prices.
+
+        Returns:
+            List[float]: The cost at each of the start times in the same order.
+        """
+        # Constant power tasks are integrated in closed form from the cumulative prices.
+        power_price_function = ConstantPowerPriceFunction.create(
+            task.power_usage_function, self.price_function
+        ) or PowerPriceFunction(
+            task.power_usage_function, self.price_function
+        )
+        return self.cost_curves.costs_at(
+            task, self.price_function, start_times,
+            lambda missing: power_price_function.integrate_many(missing, task.duration).tolist()
+        )
+
     def schedule_task_for(
         self,
         task: Task,
@@ -102,19 +234,11 @@ class Scheduler:
         schedules = []
 
         # For each of the start times we can create a new schedule with the task schduled at that time.
-        start_times = self.get_all_possible_start_times(task, schedule)
-        for start_time in start_times:
-            # If the task cannot be scheduled because of e.g. time and total power constraint.
-            if not schedule.can_schedule_task_at(task, start_time):
-                continue
-
-            power_price_function = PowerPriceFunction(
-                task.power_usage_function, self.price_function
-            )
+        for (start_time, cost) in self.placements_for(task, schedule):
             scheduled_task = ScheduledTask(
                 DatetimeInterval(start_time, timedelta()),
                 task,
-                power_price_function.integrate_from_to(start_time, task.duration)
+                cost
             )
 
             # Create a copy of the schdule and add the new scheduled task to the copy.
@@ -125,26 +249,90 @@ class Scheduler:
 
         return schedules
 
+    def place_task_for(
+        self,
+        task_index: int,
+        schedule: PersistentSchedule
+    ) -> List[PersistentSchedule]:
+        """Places the task at every possible start time like "schedule_task_for", but the new schedules share the schedule.
+
+        The full schedule to validate the start times is created once per schedule, and not for each of the new schedules.
+        """
+        task = schedule.tasks[task_index]
+        return [
+            schedule.place(Placement(task_index, start_time, cost))
+            for (start_time, cost) in self.placements_for(task, schedule.validation_schedule(), task_index)
+        ]
+
+    def generate_schedules(
+        self,
+        tasks: List[Task],
+        s0: Schedule = Schedule()
+    ) -> Iterator[Schedule]:
+        """Generates every complete schedule of the tasks for every distinct order they can be scheduled in.
+        The schedules are generated one at a time, such that only the partial schedules being extended are kept in memory.
+        If the budget is exhausted no more schedules are generated.
+        """
+        self.start_search()
+        root = PersistentSchedule(s0, tasks)
+        for order in self.generate_task_index_orders(tasks):
+            yield from self.generate_schedules_in_order(order, root)
+            if self.is_budget_exhausted():
+                return
+
+    def generate_task_orders(self, tasks: List[Task]) -> Iterator[Tuple[Task, ...]]:
+        """Generates the orders of the tasks like permutations, but interchangeable tasks are always kept in the given order.
+        Every other order of interchangeable tasks would generate the same schedules, so it cuts the orders by the multiplicity of each task.
+        """
+        for order in self.generate_task_index_orders(tasks):
+            yield tuple(tasks[index] for index in order)
+
+    def generate_task_index_orders(self, tasks: List[Task]) -> Iterator[Tuple[int, ...]]:
+        classes = TaskFingerprinter().task_classes(tasks)
+
+        def generate(order: Tuple[int, ...], remaining: Tuple[int, ...]) -> Iterator[Tuple[int, ...]]:
+            if len(remaining) == 0:
+                yield order
+                return
+
+            for index in self.first_of_each_class(remaining, classes):
+                yield from generate(order + (index,), tuple(i for i in remaining if not i == index))
+
+        yield from generate((), tuple(range(len(tasks))))
+
+    def first_of_each_class(self, remaining: Tuple[int, ...], classes: List[int]) -> List[int]:
+        """Finds the remaining tasks which can be scheduled next, such that interchangeable tasks are scheduled in ascending order."""
+        seen = set()
+        indices: List[int] = []
+        for index in remaining:
+            if classes[index] in seen:
+                continue
+            seen.add(classes[index])
+            indices.append(index)
+        return indices
+
+    def generate_schedules_in_order(
+        self,
+        order: Tuple[int, ...],
+        schedule: PersistentSchedule
+    ) -> Iterator[Schedule]:
+        if len(order) == 0:
+            self.statistics.schedules += 1
+            yield schedule.to_schedule()
+            return
+
+        if self.is_budget_exhausted():
+            return
+
+        for next_schedule in self.place_task_for(order[0], schedule):
+            yield from self.generate_schedules_in_order(order[1:], next_schedule)
+            if self.is_budget_exhausted():
+                return
+
     def schedule_tasks(
         self,
         tasks: List[Task],
         s0: Schedule = Schedule()
     ) -> List[Schedule]:
-        S = []
-        for Tp in itertools.permutations(tasks):
-            Sp = [s0]
-
-            for t in Tp:
-                new_schedules = []
-
-                for next_schedule in Sp:
-                    for a in self.schedule_task_for(t, next_schedule.copy()):
-                        new_schedules.append(a)
-                
-                Sp = new_schedules
-
-            for next_schedule in new_schedules:
-                S.append(next_schedule)
-                    
-        return S
+        return list(self.generate_schedules(tasks, s0))
     
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Generic, TypeVar
+from typing import Iterable, Generic, TypeVar
 from .schedule import Schedule
 
 TRecommendation = TypeVar("TRecommendation")
@@ -9,5 +9,5 @@ class SchedulesRecommender(ABC, Generic[TRecommendation]):
         super().__init__()
 
     @abstractmethod
-    def recommend(self, schedules: List[Schedule]) ->TRecommendation:
+    def recommend(self, schedules: Iterable[Schedule]) ->TRecommendation:
         pass
\ No newline at end of file
@@ -0,0 +1,44 @@
+from __future__ import annotations
+from datetime import timedelta
+from typing import Optional
+
+
+class SearchStatistics:
+    """Statistics of a single search for schedules."""
+    candidates: int
+    schedules: int
+    elapsed: timedelta
+    budget_exhausted: bool
+    tolerance: Optional[float]
+
+    def __init__(self) -> None:
+        # The number of candidate schedules created by placing a task.
+        self.candidates = 0
+        # The number of complete schedules generated.
+        self.schedules = 0
+        self.elapsed = timedelta()
+        self.budget_exhausted = False
+        # How much the total cost may be above the lowest total cost, if the search knows.
+        self.tolerance = None
+
+
+class SearchBudget:
+    """Limits how long a search may run and how many candidate schedules it may create.
+
+    Every candidate is a copy of a schedule, so the candidate limit also bounds the memory used by the search.
+    When the budget is exhausted the search stops and generates the best schedule found so far.
+    """
+    def __init__(
+        self,
+        time_limit: Optional[timedelta] = None,
+        maximum_candidates: Optional[int] = None
+    ) -> None:
+        self.time_limit = time_limit
+        self.maximum_candidates = maximum_candidates
+
+    def is_exhausted(self, statistics: SearchStatistics) -> bool:
+        if self.time_limit is not None and statistics.elapsed >= self.time_limit:
+            return True
+        if self.maximum_candidates is not None and statistics.candidates >= self.maximum_candidates:
+            return True
+        return False
@@ -0,0 +1,55 @@
+from __future__ import annotations
+from typing import Dict, List, Optional
+
+from infrastructure.cost_curve_cache import CostCurveCache
+from infrastructure.schedule import Schedule
+from infrastructure.scheduler import Scheduler
+from infrastructure.search_budget import SearchBudget
+from infrastructure.spot_price_function import SpotPriceFunction
+from infrastructure.task import Task
+
+
+class SearchScheduler(Scheduler):
+    """A scheduler which searches for the schedule with the lowest total cost instead of generating every schedule.
+
+    Because not every schedule is generated the highest price of each task is from the placements explored by the search.
+    Interchangeable tasks are placed in the given order, such that each distinct partial schedule is only searched once.
+    """
+    highest_scheduled_task_prices: Dict[str, float]
+
+    def __init__(
+        self,
+        price_function: SpotPriceFunction,
+        budget: Optional[SearchBudget] = None,
+        cost_curves: Optional[CostCurveCache] = None,
+    ) -> None:
+        super().__init__(price_function, budget, cost_curves)
+        self.highest_scheduled_task_prices = {}
+
+    def lowest_standalone_cost(self, task: Task, schedule: Schedule, task_index: Optional[int] = None) -> float:
+        """Calculates the cost of the cheapest placement of the task in the schedule alone.
+
+        Returns:
+            float: The lowest cost or minus infinity if the task cannot be placed alone, such that it never prunes.
+        """
+        costs = [cost for (_, cost) in self.placements_for(task, schedule, task_index)]
+        if len(costs) == 0:
+            return float("-inf")
+        return min(costs)
+
+    def lowest_standalone_costs(self, tasks: List[Task], schedule: Schedule, classes: List[int]) -> List[float]:
+        # Interchangeable tasks have the same lowest standalone cost, so it is only calculated for the first of them.
+        costs: List[float] = []
+        for (index, task) in enumerate(tasks):
+            if classes[index] < index:
+                costs.append(costs[classes[index]])
+            else:
+                costs.append(self.lowest_standalone_cost(task, schedule, index))
+        return costs
+
+    def record_highest_price(self, task: Task, cost: float) -> None:
+        if task.id is None: return
+
+        highest_price = self.highest_scheduled_task_prices.get(task.id)
+        if highest_price is None or highest_price < cost:
+            self.highest_scheduled_task_prices[task.id] = cost
@@ -1,28 +1,29 @@
+from __future__ import annotations
 from datetime import datetime, timedelta
-from typing import List, Optional
-from infrastructure.discrete_function import DiscreteFunction
+from typing import Optional, Sequence
+from infrastructure.time_series import TimeSeries, TimeSeriesPoints
+from infrastructure.time_series_function import TimeSeriesFunction
 
-from domain import PricePoint
+from domain import PriceRecord
 
 
-class SpotPriceFunction(DiscreteFunction[datetime, float, float, PricePoint]):
+class SpotPriceFunction(TimeSeriesFunction[PriceRecord]):
     def __init__(
         self,
-        price_points: List[PricePoint],
+        price_points: Sequence[PriceRecord],
         extend_by: timedelta = timedelta(hours=1)
     ) -> None:
         super().__init__(price_points)
         # Check if the price points are in ascending order and not overlapping.
-        previous = int(price_points[0].time.timestamp())
-        for price_point in price_points[1:]:
-            current = int(price_point.time.timestamp())
-            if previous > current:
-                raise ValueError("The price points are not in ascending order")
-            if previous == current:
-                raise ValueError("The price point is exactly on the same time as the current")
-            previous = int(price_point.time.timestamp())
+        self.validate_ascending("price")
 
         self.extend_by = extend_by
+        self.index_integrals()
+
+    @staticmethod
+    def from_series(series: TimeSeries, extend_by: timedelta = timedelta(hours=1)) -> SpotPriceFunction:
+        """Creates the function directly from the arrays of a series, e.g. the rows of the database."""
+        return SpotPriceFunction(TimeSeriesPoints(series, PriceRecord), extend_by)
 
     @property
     def max_domain(self) -> datetime:
@@ -40,10 +41,13 @@ class SpotPriceFunction(DiscreteFunction[datetime, float, float, PricePoint]):
     def is_valid_argument(self, argument: datetime) -> bool:
         return argument >= self.min_domain and argument <= self.max_domain
 
-    def get_domain(self, point: PricePoint) -> datetime:
+    def create_point(self, time: datetime, value: float) -> PriceRecord:
+        return PriceRecord(time, value)
+
+    def get_domain(self, point: PriceRecord) -> datetime:
         return point.time
 
-    def get_codomain(self, point: PricePoint) -> float:
+    def get_codomain(self, point: PriceRecord) -> float:
         return point.price
 
     def next_discrete_point_from(
@@ -51,7 +55,7 @@ class SpotPriceFunction(DiscreteFunction[datetime, float, float, PricePoint]):
         min: datetime,
         argument: datetime,
         max: datetime,
-    ) -> Optional[PricePoint]:
+    ) -> Optional[PriceRecord]:
         # Check if this argument exceeds the last price point's time.
         last_point = self.set[-1]
         last_time = self.get_domain(last_point)
@@ -59,11 +63,11 @@ class SpotPriceFunction(DiscreteFunction[datetime, float, float, PricePoint]):
             # Check if delta is inside acceptable bounds.
             delta = argument - last_time
             if delta <= self.extend_by:
-                return PricePoint(self.max_domain, self.get_codomain(last_point))
+                return PriceRecord(self.max_domain, self.get_codomain(last_point))
 
         return super().next_discrete_point_from(min, argument, max)
 
-    def discrete_point_at(self, argument: datetime) -> PricePoint:
+    def discrete_point_at(self, argument: datetime) -> PriceRecord:
         if not self.is_valid_argument(argument):
             raise ValueError("The argument is outside the domain boundaries")
 
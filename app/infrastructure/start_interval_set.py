@@ -0,0 +1,85 @@
+from __future__ import annotations
+from bisect import bisect_right
+from datetime import datetime
+from typing import List, Tuple
+
+import numpy as np
+
+
+class StartIntervalSet:
+    """A normalized set of allowed start times as sorted, disjoint and closed intervals.
+
+    The universal set allows every start time, such that validators without constraints do not need any bounds.
+    """
+    intervals: List[Tuple[datetime, datetime]]
+    universal: bool
+
+    def __init__(self, intervals: List[Tuple[datetime, datetime]] = [], universal: bool = False) -> None:
+        self.universal = universal
+        self.intervals = [] if universal else self.normalize(intervals)
+        self._start_times = [start for (start, _) in self.intervals]
+        self._starts = np.array(self._start_times, dtype=object)
+        self._ends = np.array([end for (_, end) in self.intervals], dtype=object)
+
+    @staticmethod
+    def everything() -> StartIntervalSet:
+        return StartIntervalSet(universal=True)
+
+    @staticmethod
+    def normalize(intervals: List[Tuple[datetime, datetime]]) -> List[Tuple[datetime, datetime]]:
+        """Sorts the intervals, removes the empty ones and merges the overlapping ones."""
+        normalized: List[Tuple[datetime, datetime]] = []
+        for (start, end) in sorted(interval for interval in intervals if interval[0] <= interval[1]):
+            if len(normalized) > 0 and start <= normalized[-1][1]:
+                (last_start, last_end) = normalized[-1]
+                normalized[-1] = (last_start, max(last_end, end))
+            else:
+                normalized.append((start, end))
+        return normalized
+
+    def union(self, other: StartIntervalSet) -> StartIntervalSet:
+        if self.universal or other.universal:
+            return StartIntervalSet.everything()
+        return StartIntervalSet(self.intervals + other.intervals)
+
+    def intersection(self, other: StartIntervalSet) -> StartIntervalSet:
+        if self.universal: return other
+        if other.universal: return self
+
+        # Both are sorted and disjoint, so the overlaps are found by merging them.
+        intervals: List[Tuple[datetime, datetime]] = []
+        (i, j) = (0, 0)
+        while i < len(self.intervals) and j < len(other.intervals):
+            (start, end) = self.intervals[i]
+            (other_start, other_end) = other.intervals[j]
+            if max(start, other_start) <= min(end, other_end):
+                intervals.append((max(start, other_start), min(end, other_end)))
+
+            if end < other_end:
+                i += 1
+            else:
+                j += 1
+        return StartIntervalSet(intervals)
+
+    def contains(self, time: datetime) -> bool:
+        if self.universal:
+            return True
+
+        index = bisect_right(self._start_times, time) - 1
+        return index >= 0 and time <= self.intervals[index][1]
+
+    def filter(self, times: List[datetime]) -> List[datetime]:
+        """Finds the times inside the set in a single vectorized pass.
+
+        Returns:
+            List[datetime]: The contained times in the same order as given.
+        """
+        if self.universal or len(times) == 0:
+            return list(times)
+        if len(self.intervals) == 0:
+            return []
+
+        values = np.array(times, dtype=object)
+        indices = np.searchsorted(self._starts, values, side="right") - 1
+        contained = (indices >= 0) & (values <= self._ends[np.maximum(indices, 0)])
+        return [time for (time, keep) in zip(times, contained) if keep]
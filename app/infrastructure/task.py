@@ -1,10 +1,11 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import List, Optional, Set
 from datetime import datetime, timedelta
 
 from infrastructure.discrete_function_iterator import DiscreteFunctionIterator
 from infrastructure.power_usage_function import PowerUsageFunction
+from infrastructure.start_interval_set import StartIntervalSet
 
 
 class TaskValidator(ABC):
@@ -17,6 +18,14 @@ class TaskValidator(ABC):
     def derieve_start_times(self, task: Task, start_time: datetime) -> List[datetime]:
         return []
 
+    def start_intervals(self, task: Task) -> Optional[StartIntervalSet]:
+        """Compiles the validator into the start times it allows for the task.
+
+        Returns:
+            Optional[StartIntervalSet]: The allowed start times or None if the validator cannot be compiled, then "validate" is used.
+        """
+        return None
+
     @abstractmethod
     def validate(self, task: Task, start_time: datetime) -> bool:
         pass
@@ -31,26 +40,41 @@ class Task:
         self.id = id
         self.power_usage_function = power_usage_function
         self.validator = validator
+        self._compiled_validator: Optional[TaskValidator] = None
+        self._start_intervals: Optional[StartIntervalSet] = None
 
     @property
     def duration(self) -> timedelta:
         return self.power_usage_function.duration
     
+    def start_intervals(self) -> Optional[StartIntervalSet]:
+        """Gets the compiled start times allowed by the validator, it is only compiled again if the validator is replaced."""
+        if self.validator is None:
+            return StartIntervalSet.everything()
+
+        if self._compiled_validator is not self.validator:
+            self._compiled_validator = self.validator
+            self._start_intervals = self.validator.start_intervals(self)
+        return self._start_intervals
+
     def start_times(self) -> List[datetime]:
-        times: List[datetime] = []
         if self.validator is None:
-            return times
+            return []
 
-        for start_time in self.validator.start_times(self):
-            if self.is_scheduleable_at(start_time):
-                times.append(start_time)
-        return times
+        return self.filter_scheduleable(self.validator.start_times(self))
+
+    def filter_scheduleable(self, start_times: List[datetime]) -> List[datetime]:
+        start_intervals = self.start_intervals()
+        if start_intervals is not None:
+            return start_intervals.filter(start_times)
+        return [start_time for start_time in start_times if self.is_scheduleable_at(start_time)]
 
     def derieve_start_times(self, start_time: datetime) -> List[datetime]:
         if not self.is_scheduleable_at(start_time):
             return []
 
         start_times: List[datetime] = []
+        seen: Set[datetime] = set()
 
         runtime: timedelta
         for runtime in DiscreteFunctionIterator([ self.power_usage_function ]):
@@ -60,8 +84,11 @@ class Task:
 
             # Calculate start times as if the task ended in the "start_time".
             early_start = start_time - runtime
-            if not early_start in start_times and\
-                self.is_scheduleable_at(early_start):
+            if early_start in seen:
+                continue
+            seen.add(early_start)
+
+            if self.is_scheduleable_at(early_start):
                 start_times.append(early_start)
 
         return start_times
@@ -69,7 +96,11 @@ class Task:
     def is_scheduleable_at(self, start_time: datetime) -> bool:
         if self.validator is None:
             return True
-        
+
+        start_intervals = self.start_intervals()
+        if start_intervals is not None:
+            return start_intervals.contains(start_time)
+
         if not self.validator.validate(self, start_time):
             return False
         return True
\ No newline at end of file
@@ -0,0 +1,60 @@
+from typing import Dict, Hashable, List
+from .task import Task, TaskValidator
+from .task_validator_conjunction import TaskValidatorConjunction
+from .task_validator_disjunction import TaskValidatorDisjunction
+from .must_start_between_validator import MustStartBetweenValidator
+from .must_end_between_validator import MustEndBetweenValidator
+from .task_validator_visitor import TaskValidatorVisitor
+
+class TaskFingerprinter(TaskValidatorVisitor[Hashable]):
+    """Creates fingerprints of tasks such that interchangeable tasks have equal fingerprints.
+
+    Two tasks are interchangeable if they have the same power usage function and validator tree, the id is not part of the fingerprint.
+    """
+    def __init__(self) -> None:
+        super().__init__()
+
+    def fingerprint(self, task: Task) -> Hashable:
+        validator = None if task.validator is None else self.visit(task.validator)
+        return (self.power_fingerprint(task), validator)
+
+    def power_fingerprint(self, task: Task) -> Hashable:
+        """Creates a fingerprint of only the power usage function, such that tasks with equal fingerprints cost the same at any start time."""
+        power_usage_function = task.power_usage_function
+        return (tuple(power_usage_function.set), power_usage_function.extend_by)
+
+    def task_classes(self, tasks: List[Task]) -> List[int]:
+        """Finds the interchangeable tasks.
+
+        Returns:
+            List[int]: The index of the first task which is interchangeable with the task at the same index.
+        """
+        first_indices: Dict[Hashable, int] = {}
+        classes: List[int] = []
+        for (index, task) in enumerate(tasks):
+            classes.append(first_indices.setdefault(self.fingerprint(task), index))
+        return classes
+
+    def visit(self, validator: TaskValidator) -> Hashable:
+        if isinstance(validator, (
+            TaskValidatorConjunction, TaskValidatorDisjunction,
+            MustStartBetweenValidator, MustEndBetweenValidator
+        )):
+            return super().visit(validator)
+
+        # Unknown validators are only equal to themselves.
+        return (type(validator), id(validator))
+
+    def visit_conjunction(self, conjunction: TaskValidatorConjunction) -> Hashable:
+        return ("and", frozenset(self.visit(validator) for validator in conjunction.validators))
+
+    def visit_disjunction(self, disjunction: TaskValidatorDisjunction) -> Hashable:
+        return ("or", frozenset(self.visit(validator) for validator in disjunction.validators))
+
+    def visit_must_start_between(self, validator: MustStartBetweenValidator) -> Hashable:
+        interval = validator.start_time_interval
+        return ("start", interval.start, interval.duration)
+
+    def visit_must_end_between(self, validator: MustEndBetweenValidator) -> Hashable:
+        interval = validator.end_time_interval
+        return ("end", interval.start, interval.duration)
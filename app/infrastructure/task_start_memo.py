@@ -0,0 +1,57 @@
+from datetime import datetime
+from typing import Callable, Dict, List, Sequence, Tuple
+
+from infrastructure.task import Task
+
+
+class TaskStartMemo:
+    """Memoises what only depends on a task and its start time during a search, keyed by the index of the task and the start time.
+
+    The cost and the task constraints are the same in every branch of the search, so only the checks against the partial schedule,
+    e.g. the maximum power consumption, are evaluated for each branch.
+    """
+    costs: Dict[Tuple[int, datetime], float]
+    scheduleable: Dict[Tuple[int, datetime], bool]
+
+    def __init__(self) -> None:
+        self.costs = {}
+        self.scheduleable = {}
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self) -> None:
+        self.costs.clear()
+        self.scheduleable.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def is_scheduleable_at(self, task_index: int, task: Task, start_time: datetime) -> bool:
+        key = (task_index, start_time)
+        if key not in self.scheduleable:
+            self.scheduleable[key] = task.is_scheduleable_at(start_time)
+        return self.scheduleable[key]
+
+    def costs_at(
+        self,
+        task_index: int,
+        start_times: List[datetime],
+        calculate: Callable[[List[datetime]], Sequence[float]]
+    ) -> List[float]:
+        """Gets the cost of the task at each of the start times, the missing costs are calculated at once.
+
+        Args:
+            task_index (int): The index of the task in the search.
+            start_times (List[datetime]): The start times to get the costs of.
+            calculate (Callable[[List[datetime]], Sequence[float]]): Calculates the costs of the start times which are not memoised.
+
+        Returns:
+            List[float]: The cost at each of the start times in the same order.
+        """
+        missing = [start_time for start_time in start_times if (task_index, start_time) not in self.costs]
+        self.hits += len(start_times) - len(missing)
+        self.misses += len(missing)
+
+        if len(missing) > 0:
+            for (start_time, cost) in zip(missing, calculate(missing)):
+                self.costs[(task_index, start_time)] = float(cost)
+        return [self.costs[(task_index, start_time)] for start_time in start_times]
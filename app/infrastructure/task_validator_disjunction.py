@@ -1,5 +1,6 @@
 from datetime import datetime
-from typing import List
+from typing import List, Optional
+from infrastructure.start_interval_set import StartIntervalSet
 from infrastructure.task import Task, TaskValidator
 
 
@@ -9,7 +10,8 @@ class TaskValidatorDisjunction(TaskValidator):
         self.validators = validators
 
     def list_union(self, lhs: List, rhs: List) -> List:
-        return list(set(lhs) | set(rhs))
+        # The keys of a dictionary are unique and keep their order.
+        return list(dict.fromkeys(lhs + rhs))
 
     def start_times(self, task: Task) -> List[datetime]:
         if len(self.validators) == 0:
@@ -34,5 +36,14 @@ class TaskValidatorDisjunction(TaskValidator):
 
         return results
 
+    def start_intervals(self, task: Task) -> Optional[StartIntervalSet]:
+        results = StartIntervalSet()
+        for validator in self.validators:
+            start_intervals = validator.start_intervals(task)
+            if start_intervals is None:
+                return None
+            results = results.union(start_intervals)
+        return results
+
     def validate(self, task: Task, start_time: datetime) -> bool:
         return any([validator.validate(task, start_time) for validator in self.validators])
\ No newline at end of file
@@ -0,0 +1,115 @@
+from datetime import datetime, timedelta
+from typing import List
+
+import pytest
+
+from infrastructure.beam_search_scheduler import BeamSearchScheduler
+from infrastructure.branch_and_bound_scheduler import BranchAndBoundScheduler
+from infrastructure.datetime_interval import DatetimeInterval
+from infrastructure.maximum_power_consumption_validator import MaximumPowerConsumptionValidator
+from infrastructure.must_start_between_validator import MustStartBetweenValidator
+from infrastructure.power_usage_function import PowerUsageFunction
+from infrastructure.power_usage_function_factory import PowerUsageFunctionFactory
+from infrastructure.schedule import Schedule
+from infrastructure.search_budget import SearchBudget
+from infrastructure.task import Task
+from domain import PriceRecord
+from infrastructure.spot_price_function import SpotPriceFunction
+
+
+class TestBeamSearchScheduler:
+    def create_price_function(self) -> SpotPriceFunction:
+        prices = [3, 1, 4, 1, 5, 2]
+        return SpotPriceFunction([
+            PriceRecord(datetime(2021, 1, 1, 15) + timedelta(hours=hour), price)
+            for (hour, price) in enumerate(prices)
+        ])
+
+    def create_tasks(self) -> List[Task]:
+        return [
+            Task(PowerUsageFunction([
+                (timedelta(), 2), (timedelta(minutes=30), 1)
+            ], timedelta(minutes=60)), id="1"),
+            Task(
+                PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=90), 1),
+                MustStartBetweenValidator(DatetimeInterval(datetime(2021, 1, 1, 17), timedelta(hours=2))),
+                "2"
+            ),
+            Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=45), 2), id="3"),
+        ]
+
+    def total_cost(self, schedule: Schedule) -> float:
+        return sum(scheduled_task.cost for scheduled_task in schedule.tasks)
+
+    def test_wide_beam_finds_the_same_lowest_price_as_branch_and_bound(self):
+        # Arrange
+        price_function = self.create_price_function()
+        tasks = self.create_tasks()
+        exact = BranchAndBoundScheduler(price_function).schedule_tasks(
+            tasks, Schedule([], MaximumPowerConsumptionValidator(3))
+        )
+        scheduler = BeamSearchScheduler(price_function, 1000)
+
+        # Act
+        schedules = scheduler.schedule_tasks(tasks, Schedule([], MaximumPowerConsumptionValidator(3)))
+
+        # Assert
+        assert len(schedules) == 1
+        assert len(schedules[0].tasks) == len(tasks)
+        assert abs(self.total_cost(schedules[0]) - self.total_cost(exact[0])) < 1e-9
+        assert set(scheduler.highest_scheduled_task_prices.keys()) == { "1", "2", "3" }
+
+    def test_narrow_beam_schedules_all_tasks_no_cheaper_than_branch_and_bound(self):
+        # Arrange
+        price_function = self.create_price_function()
+        tasks = self.create_tasks()
+        exact = BranchAndBoundScheduler(price_function).schedule_tasks(
+            tasks, Schedule([], MaximumPowerConsumptionValidator(3))
+        )
+        scheduler = BeamSearchScheduler(price_function, 1)
+
+        # Act
+        schedules = scheduler.schedule_tasks(tasks, Schedule([], MaximumPowerConsumptionValidator(3)))
+
+        # Assert
+        assert len(schedules) == 1
+        assert len(schedules[0].tasks) == len(tasks)
+        assert self.total_cost(schedules[0]) >= self.total_cost(exact[0]) - 1e-9
+
+    def test_exhausted_budget_completes_the_most_promising_schedule(self):
+        # Arrange
+        price_function = self.create_price_function()
+        tasks = self.create_tasks()
+        scheduler = BeamSearchScheduler(price_function, 1000, SearchBudget(maximum_candidates=1))
+
+        # Act
+        schedules = scheduler.schedule_tasks(tasks, Schedule([], MaximumPowerConsumptionValidator(3)))
+
+        # Assert
+        assert len(schedules) == 1
+        assert len(schedules[0].tasks) == len(tasks)
+        assert scheduler.statistics.budget_exhausted
+        assert not scheduler.is_optimal()
+
+    def test_schedule_tasks_without_possible_schedule(self):
+        # Arrange
+        price_function = self.create_price_function()
+        tasks = [
+            Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=60), 2), id="1"),
+            Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=60), 2), id="2"),
+        ]
+        scheduler = BeamSearchScheduler(price_function, 4)
+
+        # Act
+        schedules = scheduler.schedule_tasks(tasks, Schedule([], MaximumPowerConsumptionValidator(1)))
+
+        # Assert
+        assert len(schedules) == 0
+
+    def test_width_must_be_positive(self):
+        # Arrange
+        price_function = self.create_price_function()
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            BeamSearchScheduler(price_function, 0)
@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta
+from typing import List
+
+from infrastructure.branch_and_bound_scheduler import BranchAndBoundScheduler
+from infrastructure.datetime_interval import DatetimeInterval
+from infrastructure.maximum_power_consumption_validator import MaximumPowerConsumptionValidator
+from infrastructure.must_start_between_validator import MustStartBetweenValidator
+from infrastructure.power_usage_function import PowerUsageFunction
+from infrastructure.power_usage_function_factory import PowerUsageFunctionFactory
+from infrastructure.schedule import Schedule
+from infrastructure.scheduler import Scheduler
+from infrastructure.search_budget import SearchBudget
+from infrastructure.task import Task
+from domain import PriceRecord
+from infrastructure.spot_price_function import SpotPriceFunction
+
+
+class TestBranchAndBoundScheduler:
+    def create_price_function(self) -> SpotPriceFunction:
+        prices = [3, 1, 4, 1, 5, 2]
+        return SpotPriceFunction([
+            PriceRecord(datetime(2021, 1, 1, 15) + timedelta(hours=hour), price)
+            for (hour, price) in enumerate(prices)
+        ])
+
+    def create_tasks(self) -> List[Task]:
+        return [
+            Task(PowerUsageFunction([
+                (timedelta(), 2), (timedelta(minutes=30), 1)
+            ], timedelta(minutes=60)), id="1"),
+            Task(
+                PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=90), 1),
+                MustStartBetweenValidator(DatetimeInterval(datetime(2021, 1, 1, 17), timedelta(hours=2))),
+                "2"
+            ),
+            Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=45), 2), id="3"),
+        ]
+
+    def test_schedule_tasks_finds_the_same_lowest_price_as_all_schedules(self):
+        # Arrange
+        price_function = self.create_price_function()
+        tasks = self.create_tasks()
+        all_schedules = Scheduler(price_function).schedule_tasks(
+            tasks, Schedule([], MaximumPowerConsumptionValidator(3))
+        )
+        lowest_cost = min(
+            sum(scheduled_task.cost for scheduled_task in schedule.tasks) for schedule in all_schedules
+        )
+        scheduler = BranchAndBoundScheduler(price_function)
+
+        # Act
+        schedules = scheduler.schedule_tasks(tasks, Schedule([], MaximumPowerConsumptionValidator(3)))
+
+        # Assert
+        assert len(schedules) == 1
+        assert len(schedules[0].tasks) == len(tasks)
+        assert abs(sum(scheduled_task.cost for scheduled_task in schedules[0].tasks) - lowest_cost) < 1e-9
+        assert set(scheduler.highest_scheduled_task_prices.keys()) == { "1", "2", "3" }
+        assert scheduler.is_optimal()
+
+    def test_schedule_tasks_returns_best_so_far_when_budget_is_exhausted(self):
+        # Arrange
+        price_function = self.create_price_function()
+        tasks = self.create_tasks()
+        lowest_cost = sum(
+            scheduled_task.cost for scheduled_task in BranchAndBoundScheduler(price_function).schedule_tasks(
+                tasks, Schedule([], MaximumPowerConsumptionValidator(3))
+            )[0].tasks
+        )
+        scheduler = BranchAndBoundScheduler(price_function, SearchBudget(maximum_candidates=30))
+
+        # Act
+        schedules = scheduler.schedule_tasks(tasks, Schedule([], MaximumPowerConsumptionValidator(3)))
+
+        # Assert
+        assert len(schedules) == 1
+        assert len(schedules[0].tasks) == len(tasks)
+        assert sum(scheduled_task.cost for scheduled_task in schedules[0].tasks) >= lowest_cost - 1e-9
+        assert scheduler.statistics.budget_exhausted
+        assert not scheduler.is_optimal()
+
+    def test_schedule_tasks_without_possible_schedule(self):
+        # Arrange
+        price_function = self.create_price_function()
+        tasks = [
+            Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=60), 2), id="1"),
+            Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=60), 2), id="2"),
+        ]
+        scheduler = BranchAndBoundScheduler(price_function)
+
+        # Act
+        schedules = scheduler.schedule_tasks(tasks, Schedule([], MaximumPowerConsumptionValidator(1)))
+
+        # Assert
+        assert len(schedules) == 0
@@ -0,0 +1,59 @@
+from datetime import datetime, timedelta
+
+from infrastructure.branch_and_bound_scheduler import BranchAndBoundScheduler
+from infrastructure.coarse_to_fine_scheduler import CoarseToFineScheduler
+from infrastructure.maximum_power_consumption_validator import MaximumPowerConsumptionValidator
+from infrastructure.power_usage_function_factory import PowerUsageFunctionFactory
+from infrastructure.schedule import Schedule
+from infrastructure.task import Task
+from domain import PriceRecord
+from infrastructure.spot_price_function import SpotPriceFunction
+
+
+class TestCoarseToFineScheduler:
+    def create_price_function(self) -> SpotPriceFunction:
+        prices = [3, 3, 2, 1, 2, 4, 4, 5, 1, 1, 2, 3]
+        return SpotPriceFunction([
+            PriceRecord(datetime(2021, 1, 1) + timedelta(minutes=15 * quarter), price)
+            for (quarter, price) in enumerate(prices)
+        ])
+
+    def test_coarse_phase_keeps_first_start_time_in_each_step(self):
+        # Arrange
+        scheduler = CoarseToFineScheduler(self.create_price_function())
+        task = Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=30), 1))
+
+        # Act
+        scheduler.phase = "coarse"
+        coarse_start_times = scheduler.get_all_possible_start_times(task)
+        scheduler.phase = "full"
+        start_times = scheduler.get_all_possible_start_times(task)
+
+        # Assert
+        assert len(start_times) > len(coarse_start_times)
+        assert coarse_start_times == [
+            datetime(2021, 1, 1), datetime(2021, 1, 1, 1), datetime(2021, 1, 1, 2), datetime(2021, 1, 1, 3, 15)
+        ]
+
+    def test_schedule_is_within_tolerance_of_the_full_search(self):
+        # Arrange
+        price_function = self.create_price_function()
+        tasks = [
+            Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=30), 1), id="1"),
+            Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=45), 2), id="2"),
+        ]
+        exact = BranchAndBoundScheduler(price_function).schedule_tasks(tasks, Schedule([], MaximumPowerConsumptionValidator(2)))
+        scheduler = CoarseToFineScheduler(price_function)
+
+        # Act
+        schedules = scheduler.schedule_tasks(tasks, Schedule([], MaximumPowerConsumptionValidator(2)))
+
+        # Assert
+        assert len(schedules) == 1
+        assert len(schedules[0].tasks) == len(tasks)
+        gap = sum(scheduled_task.cost for scheduled_task in schedules[0].tasks) - \
+            sum(scheduled_task.cost for scheduled_task in exact[0].tasks)
+        assert scheduler.tolerance is not None
+        assert scheduler.statistics.tolerance == scheduler.tolerance
+        assert gap >= -1e-9 and gap <= scheduler.tolerance + 1e-9
+        assert scheduler.phase == "full"
@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta
+from random import randint, seed
+from typing import List
+
+import pytest
+
+from domain import PriceRecord
+from infrastructure.constant_power_price_function import ConstantPowerPriceFunction
+from infrastructure.power_price_function import PowerPriceFunction
+from infrastructure.power_usage_function import PowerUsageFunction
+from infrastructure.power_usage_function_factory import PowerUsageFunctionFactory
+from infrastructure.spot_price_function import SpotPriceFunction
+
+
+class TestConstantPowerPriceFunction:
+    def create_price_function(self) -> SpotPriceFunction:
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1) + timedelta(minutes=15 * quarter), (quarter * 7) % 11 + 0.5)
+            for quarter in range(48)
+        ]
+        return SpotPriceFunction(price_points)
+
+    def test_is_only_created_for_constant_power(self):
+        # Arrange
+        spot_price_function = self.create_price_function()
+        constant = PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=90), 2)
+        variable = PowerUsageFunction([(timedelta(), 2), (timedelta(minutes=30), 1)], timedelta(minutes=60))
+
+        # Act
+        constant_price_function = ConstantPowerPriceFunction.create(constant, spot_price_function)
+        variable_price_function = ConstantPowerPriceFunction.create(variable, spot_price_function)
+
+        # Assert
+        assert constant_price_function is not None
+        assert constant_price_function.power == 2
+        assert constant_price_function.max_duration == timedelta(minutes=90)
+        assert variable_price_function is None
+
+    def test_integrate_matches_power_price_function(self):
+        # Arrange
+        seed(25)
+        spot_price_function = self.create_price_function()
+        power_usage_function = PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=100), 1.5)
+        constant_price_function = ConstantPowerPriceFunction.create(power_usage_function, spot_price_function)
+        power_price_function = PowerPriceFunction(power_usage_function, spot_price_function)
+        starts = [datetime(2021, 1, 1) + timedelta(minutes=randint(0, 12 * 60 - 100)) for _ in range(100)]
+        assert constant_price_function is not None
+
+        # Act
+        integrals = constant_price_function.integrate_many(starts, power_usage_function.duration)
+
+        # Assert
+        for (start, integral) in zip(starts, integrals):
+            expected = power_price_function.integrate_from_to(start, power_usage_function.duration)
+            assert abs(integral - expected) < 1e-9
+            assert abs(constant_price_function.integrate_from_to(start, power_usage_function.duration) - expected) < 1e-9
+
+    def test_integrate_longer_than_the_power_usage_function_raises(self):
+        # Arrange
+        spot_price_function = self.create_price_function()
+        power_usage_function = PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=30), 1)
+        constant_price_function = ConstantPowerPriceFunction.create(power_usage_function, spot_price_function)
+        assert constant_price_function is not None
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            constant_price_function.integrate_from_to(datetime(2021, 1, 1), timedelta(minutes=31))
+
+    def test_integrate_many_within_a_single_price_point(self):
+        # Arrange
+        spot_price_function = self.create_price_function()
+        power_usage_function = PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=10), 3)
+        constant_price_function = ConstantPowerPriceFunction.create(power_usage_function, spot_price_function)
+        assert constant_price_function is not None
+
+        # Act
+        integrals = constant_price_function.integrate_many([datetime(2021, 1, 1, 0, 5)], power_usage_function.duration)
+
+        # Assert
+        assert integrals.tolist() == [3 * 0.5 / 6]
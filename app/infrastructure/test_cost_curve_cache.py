@@ -0,0 +1,140 @@
+from datetime import datetime, timedelta
+from typing import List
+
+from infrastructure.cost_curve_cache import CostCurveCache
+from infrastructure.power_usage_function_factory import PowerUsageFunctionFactory
+from infrastructure.scheduler import Scheduler
+from infrastructure.task import Task
+from infrastructure.task_fingerprinter import TaskFingerprinter
+from domain import PriceRecord
+from infrastructure.spot_price_function import SpotPriceFunction
+
+
+class TestCostCurveCache:
+    def test_repeated_power_usage_functions_skip_cost_integration(self):
+        # Arrange
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 2),
+            PriceRecord(datetime(2021, 1, 1, 17), 3),
+        ]
+        cost_curves = CostCurveCache()
+        first_scheduler = Scheduler(SpotPriceFunction(price_points), cost_curves=cost_curves)
+        second_scheduler = Scheduler(SpotPriceFunction(price_points), cost_curves=cost_curves)
+
+        # The tasks are created for each request, but they have the same power usage function.
+        def create_task(id: str) -> Task:
+            return Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=30), 1), id=id)
+
+        # Act
+        first = first_scheduler.schedule_tasks([create_task("1")])
+        misses = cost_curves.misses
+        second = second_scheduler.schedule_tasks([create_task("2")])
+
+        # Assert
+        assert misses > 0
+        assert cost_curves.misses == misses
+        assert cost_curves.hits == misses
+        assert [schedule.tasks[0].cost for schedule in first] == [schedule.tasks[0].cost for schedule in second]
+
+    def test_schedulers_without_a_cache_do_not_share_costs(self):
+        # Arrange
+        price_points: List[PriceRecord] = [PriceRecord(datetime(2021, 1, 1, 15), 1), PriceRecord(datetime(2021, 1, 1, 16), 2)]
+        first_scheduler = Scheduler(SpotPriceFunction(price_points))
+        second_scheduler = Scheduler(SpotPriceFunction(price_points))
+        task = Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=30), 1))
+
+        # Act
+        first_scheduler.schedule_tasks([task])
+        second_scheduler.schedule_tasks([task])
+
+        # Assert
+        assert first_scheduler.cost_curves is not second_scheduler.cost_curves
+        assert second_scheduler.cost_curves.hits == 0
+        assert second_scheduler.cost_curves.misses == first_scheduler.cost_curves.misses
+
+    def test_changed_prices_are_not_reused(self):
+        # Arrange
+        cost_curves = CostCurveCache()
+        task = Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=60), 1))
+        start_times = [datetime(2021, 1, 1, 15)]
+        old_prices = SpotPriceFunction([PriceRecord(datetime(2021, 1, 1, 15), 1), PriceRecord(datetime(2021, 1, 1, 16), 2)])
+        new_prices = SpotPriceFunction([PriceRecord(datetime(2021, 1, 1, 15), 3), PriceRecord(datetime(2021, 1, 1, 16), 2)])
+
+        # Act
+        old_costs = cost_curves.costs_at(task, old_prices, start_times, lambda missing: [1.0 for _ in missing])
+        new_costs = cost_curves.costs_at(task, new_prices, start_times, lambda missing: [3.0 for _ in missing])
+
+        # Assert
+        assert old_costs == [1.0]
+        assert new_costs == [3.0]
+        assert list(cost_curves.snapshots) == [old_prices.snapshot_version, new_prices.snapshot_version]
+        assert cost_curves.misses == 2
+
+    def test_snapshots_in_use_do_not_evict_each_other(self):
+        # Arrange
+        cost_curves = CostCurveCache(maximum_snapshots=2)
+        task = Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=60), 1))
+        start_times = [datetime(2021, 1, 1, 15)]
+        prices = [
+            SpotPriceFunction([PriceRecord(datetime(2021, 1, 1, 15), price), PriceRecord(datetime(2021, 1, 1, 16), 2)])
+            for price in [1, 3, 5]
+        ]
+
+        # Act
+        for price_function in [prices[0], prices[1], prices[0], prices[1]]:
+            cost_curves.costs_at(task, price_function, start_times, lambda missing: [0.0 for _ in missing])
+        misses = cost_curves.misses
+        cost_curves.costs_at(task, prices[2], start_times, lambda missing: [0.0 for _ in missing])
+
+        # Assert
+        assert misses == 2
+        assert cost_curves.hits == 2
+        assert list(cost_curves.snapshots) == [prices[1].snapshot_version, prices[2].snapshot_version]
+        assert all(version != prices[0].snapshot_version for (version, _, _) in cost_curves.curves)
+
+    def test_least_recently_used_curve_is_evicted(self):
+        # Arrange
+        cost_curves = CostCurveCache(maximum_curves=2)
+        prices = SpotPriceFunction([PriceRecord(datetime(2021, 1, 1, 15), 1), PriceRecord(datetime(2021, 1, 1, 16), 2)])
+        tasks = [
+            Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=15 * (index + 1)), 1))
+            for index in range(3)
+        ]
+        start_times = [datetime(2021, 1, 1, 15)]
+
+        # Act
+        for task in [tasks[0], tasks[1], tasks[0], tasks[2]]:
+            cost_curves.costs_at(task, prices, start_times, lambda missing: [0.0 for _ in missing])
+
+        # Assert
+        assert cost_curves.misses == 3
+        assert len(cost_curves.curves) == 2
+        cost_curves.costs_at(tasks[1], prices, start_times, lambda missing: [0.0 for _ in missing])
+        assert cost_curves.misses == 4
+
+    def test_new_prices_only_evict_costs_covering_changed_prices(self):
+        # Arrange
+        cost_curves = CostCurveCache()
+        task = Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=60), 1))
+        start_times = [datetime(2021, 1, 1, 15), datetime(2021, 1, 1, 16), datetime(2021, 1, 1, 17)]
+        old_prices = SpotPriceFunction([
+            PriceRecord(datetime(2021, 1, 1, 15), 1), PriceRecord(datetime(2021, 1, 1, 16), 2), PriceRecord(datetime(2021, 1, 1, 17), 3)
+        ])
+        # The window has moved forward by an hour and the prices of the next hour are released.
+        new_prices = SpotPriceFunction([
+            PriceRecord(datetime(2021, 1, 1, 16), 2), PriceRecord(datetime(2021, 1, 1, 17), 3), PriceRecord(datetime(2021, 1, 1, 18), 4)
+        ])
+        cost_curves.costs_at(task, old_prices, start_times, lambda missing: [old_prices.integrate(start_time, start_time + task.duration) for start_time in missing])
+
+        # Act
+        calculated: List[datetime] = []
+        def calculate(missing: List[datetime]) -> List[float]:
+            calculated.extend(missing)
+            return [new_prices.integrate(start_time, start_time + task.duration) for start_time in missing]
+        costs = cost_curves.costs_at(task, new_prices, start_times[1:] + [datetime(2021, 1, 1, 17, 30)], calculate)
+
+        # Assert
+        assert calculated == [datetime(2021, 1, 1, 17, 30)]
+        assert costs == [2.0, 3.0, 3.5]
+        assert datetime(2021, 1, 1, 15) not in cost_curves.curves[(new_prices.snapshot_version, TaskFingerprinter().power_fingerprint(task), task.duration)]
@@ -91,3 +91,28 @@ class TestDiscreteFunctionIterator:
         assert points[1] == timedelta(minutes=20)
         assert points[2] == timedelta(hours=1, minutes=20)
         assert points[3] == timedelta(hours=2, minutes=20)
+
+    def test_single_function_start_end_window(self):
+        # Arrange
+        power_function = PowerUsageFunction([
+            (timedelta(), 0),
+            (timedelta(minutes=20), 1),
+            (timedelta(minutes=40), 2),
+            (timedelta(minutes=60), 3),
+        ], timedelta(hours=1))
+        iterator = DiscreteFunctionIterator(
+            [power_function], timedelta(minutes=17), timedelta(minutes=45)
+        )
+        points = []
+
+        # Act
+        for point in iterator:
+            points.append(point)
+
+        # Assert
+        assert points == [
+            timedelta(minutes=17),
+            timedelta(minutes=20),
+            timedelta(minutes=40),
+            timedelta(minutes=45),
+        ]
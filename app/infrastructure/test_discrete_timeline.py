@@ -0,0 +1,53 @@
+from typing import List, Optional
+
+from infrastructure.discrete_timeline import DiscreteTimelineCache
+
+
+class TestDiscreteTimelineCache:
+    def create_cache(self, queried: List[int], maximum_timelines: int = DiscreteTimelineCache.DEFAULT_MAXIMUM_TIMELINES) -> DiscreteTimelineCache[int, int]:
+        def find_next(global_min: int, argument: int, global_max: int) -> Optional[int]:
+            queried.append(argument)
+            return None if argument + 1 > global_max else argument + 1
+        return DiscreteTimelineCache(find_next, lambda point: point, maximum_timelines)
+
+    def test_timeline_is_only_stepped_as_far_as_it_is_queried(self):
+        # Arrange
+        queried: List[int] = []
+        cache = self.create_cache(queried)
+
+        # Act
+        next_point = cache.next_from(0, 3, 1000)
+        same_next_point = cache.next_from(0, 2, 1000)
+
+        # Assert
+        assert next_point == 4
+        assert same_next_point == 3
+        assert queried == [0, 1, 2, 3]
+        assert cache.timeline(0, 1000).domains == [1, 2, 3, 4]
+
+    def test_arguments_after_the_timeline_are_stepped_from_directly(self):
+        # Arrange
+        queried: List[int] = []
+        cache = self.create_cache(queried)
+
+        # Act
+        last_point = cache.next_from(0, 9, 10)
+        no_point = cache.next_from(0, 10, 10)
+
+        # Assert
+        assert last_point == 10
+        assert no_point is None
+        assert cache.timeline(0, 10).is_complete
+
+    def test_least_recently_used_timelines_are_evicted(self):
+        # Arrange
+        cache = self.create_cache([], maximum_timelines=2)
+
+        # Act
+        cache.next_from(0, 1, 10)
+        cache.next_from(1, 2, 10)
+        cache.next_from(0, 1, 10)
+        cache.next_from(2, 3, 10)
+
+        # Assert
+        assert list(cache.timelines.keys()) == [(0, 10), (2, 10)]
@@ -2,6 +2,7 @@ from datetime import datetime
 from typing import List, Dict, Any
 
 import pytest
+from domain import PricePoint, PriceRecord
 from .eds_requests import EdsRequests
 
 class TestEdsRequests:
@@ -49,6 +50,25 @@ class TestEdsRequests:
         # Assert
         assert all([float(records[i]["SpotPriceDKK"]) / 1000 == price_points[i].price for i in range(len(records))])
 
+    def test_create_price_points_from_json_creates_records_convertible_to_price_points(self):
+        # Arrange
+        eds = EdsRequests()
+        records: List[Dict[str, str]] = [
+            { "HourUTC": "2023-02-01T23:00:00", "SpotPriceDKK": "1" },
+            { "HourUTC": "2023-02-02T23:00:00", "SpotPriceDKK": "2" },
+        ]
+
+        # Act
+        price_points = eds.create_price_points_from_json(records)
+
+        # Assert
+        assert all([isinstance(price_point, PriceRecord) for price_point in price_points])
+        for price_point in price_points:
+            converted = price_point.to_point()
+            assert isinstance(converted, PricePoint)
+            assert converted.time == price_point.time
+            assert converted.price == price_point.price
+
     def test_create_price_points_from_json_invalid_missing_hourdk(self):
         # Arrange
         eds = EdsRequests()
@@ -0,0 +1,97 @@
+from datetime import datetime, timedelta
+from typing import List
+
+from infrastructure.branch_and_bound_scheduler import BranchAndBoundScheduler
+from infrastructure.datetime_interval import DatetimeInterval
+from infrastructure.greedy_scheduler import GreedyScheduler
+from infrastructure.maximum_power_consumption_validator import MaximumPowerConsumptionValidator
+from infrastructure.must_start_between_validator import MustStartBetweenValidator
+from infrastructure.power_usage_function import PowerUsageFunction
+from infrastructure.power_usage_function_factory import PowerUsageFunctionFactory
+from infrastructure.schedule import Schedule
+from infrastructure.task import Task
+from domain import PriceRecord
+from infrastructure.spot_price_function import SpotPriceFunction
+
+
+class TestGreedyScheduler:
+    def create_price_function(self, prices: List[float]) -> SpotPriceFunction:
+        return SpotPriceFunction([
+            PriceRecord(datetime(2021, 1, 1) + timedelta(hours=hour), price)
+            for (hour, price) in enumerate(prices)
+        ])
+
+    def total_cost(self, schedule: Schedule) -> float:
+        return sum(scheduled_task.cost for scheduled_task in schedule.tasks)
+
+    def test_schedules_all_tasks_no_cheaper_than_branch_and_bound(self):
+        # Arrange
+        price_function = self.create_price_function([3, 1, 4, 1, 5, 2])
+        tasks = [
+            Task(PowerUsageFunction([
+                (timedelta(), 2), (timedelta(minutes=30), 1)
+            ], timedelta(minutes=60)), id="1"),
+            Task(
+                PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=90), 1),
+                MustStartBetweenValidator(DatetimeInterval(datetime(2021, 1, 1, 2), timedelta(hours=2))),
+                "2"
+            ),
+            Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=45), 2), id="3"),
+        ]
+        exact = BranchAndBoundScheduler(price_function).schedule_tasks(
+            tasks, Schedule([], MaximumPowerConsumptionValidator(3))
+        )
+        scheduler = GreedyScheduler(price_function)
+
+        # Act
+        schedules = scheduler.schedule_tasks(tasks, Schedule([], MaximumPowerConsumptionValidator(3)))
+
+        # Assert
+        assert len(schedules) == 1
+        assert len(schedules[0].tasks) == len(tasks)
+        assert self.total_cost(schedules[0]) >= self.total_cost(exact[0]) - 1e-9
+        assert not scheduler.is_optimal()
+        assert set(scheduler.highest_scheduled_task_prices.keys()) == { "1", "2", "3" }
+
+    def test_tight_energy_intensive_tasks_are_placed_first(self):
+        # Arrange
+
+        # "1" can only start in the cheapest hour, so it is placed before "2" takes that hour.
+        price_function = self.create_price_function([3, 1, 4, 2])
+        tasks = [
+            Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=60), 1), id="2"),
+            Task(
+                PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=60), 1),
+                MustStartBetweenValidator(DatetimeInterval(datetime(2021, 1, 1, 1), timedelta())),
+                "1"
+            ),
+        ]
+        scheduler = GreedyScheduler(price_function)
+
+        # Act
+        schedules = scheduler.schedule_tasks(tasks, Schedule([], MaximumPowerConsumptionValidator(1)))
+
+        # Assert
+        assert len(schedules) == 1
+        starts = { scheduled_task.task.id: scheduled_task.start_interval.start for scheduled_task in schedules[0].tasks }
+        assert starts == { "1": datetime(2021, 1, 1, 1), "2": datetime(2021, 1, 1, 3) }
+
+    def test_schedules_many_tasks(self):
+        # Arrange
+        price_function = self.create_price_function([(hour * 7) % 11 + 1 for hour in range(24)])
+        tasks = [
+            Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=30 * (index % 3 + 1)), 1), id=str(index))
+            for index in range(25)
+        ]
+        validator = MaximumPowerConsumptionValidator(4)
+        scheduler = GreedyScheduler(price_function)
+
+        # Act
+        schedules = scheduler.schedule_tasks(tasks, Schedule([], validator))
+
+        # Assert
+        assert len(schedules) == 1
+        assert len(schedules[0].tasks) == len(tasks)
+        for scheduled_task in schedules[0].tasks:
+            others = Schedule([other for other in schedules[0].tasks if other is not scheduled_task])
+            assert validator.validate(others, scheduled_task.task, scheduled_task.start_interval.start)
@@ -0,0 +1,101 @@
+from datetime import datetime, timedelta
+from random import randint, seed
+from typing import List, Tuple
+
+from infrastructure.datetime_interval import DatetimeInterval
+from infrastructure.load_profile_index import LoadProfileIndex
+from infrastructure.power_usage_function_factory import PowerUsageFunctionFactory
+from infrastructure.schedule import Schedule
+from infrastructure.schedule_task import ScheduledTask
+from infrastructure.task import Task
+
+
+class TestLoadProfileIndex:
+    def test_maximum_between_sums_overlapping_loads(self):
+        # Arrange
+        index = LoadProfileIndex(timedelta(minutes=15))
+
+        # Act
+        index.add_load(datetime(2021, 1, 1, 12), datetime(2021, 1, 1, 13), 1.0)
+        index.add_load(datetime(2021, 1, 1, 12, 30), datetime(2021, 1, 1, 14), 2.0)
+        # This grows the tree to the left of the first load.
+        index.add_load(datetime(2021, 1, 1, 10), datetime(2021, 1, 1, 11), 0.5)
+
+        # Assert
+        assert index.is_exact
+        assert index.maximum_between(datetime(2021, 1, 1, 12), datetime(2021, 1, 1, 12, 30)) == 1.0
+        assert index.maximum_between(datetime(2021, 1, 1, 12), datetime(2021, 1, 1, 12, 45)) == 3.0
+        assert index.maximum_between(datetime(2021, 1, 1, 13), datetime(2021, 1, 1, 16)) == 2.0
+        assert index.maximum_between(datetime(2021, 1, 1, 9), datetime(2021, 1, 1, 12)) == 0.5
+        assert index.maximum_between(datetime(2021, 1, 1, 14), datetime(2021, 1, 1, 15)) == 0.0
+
+    def test_schedule_add_updates_copied_index_without_rebuilding(self):
+        # Arrange
+        power_usage_function = PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=60), 1)
+        schedule = Schedule([ScheduledTask(DatetimeInterval(datetime(2021, 1, 1, 12)), Task(power_usage_function), 0)])
+        index = schedule.load_profile_index(timedelta(minutes=1))
+        copy = schedule.copy()
+        copy_index = copy.load_profile
+
+        # Act
+        copy.add(ScheduledTask(DatetimeInterval(datetime(2021, 1, 1, 12, 30)), Task(power_usage_function), 0))
+
+        # Assert
+        assert copy_index is not None and copy_index is not index
+        assert copy.load_profile_index(timedelta(minutes=1)) is copy_index
+        assert copy_index.count == 2
+        assert copy_index.maximum_between(datetime(2021, 1, 1, 12), datetime(2021, 1, 1, 14)) == 2.0
+        assert schedule.load_profile_index(timedelta(minutes=1)) is index
+        assert index.count == 1
+        assert index.maximum_between(datetime(2021, 1, 1, 12), datetime(2021, 1, 1, 14)) == 1.0
+
+    def test_copies_match_the_consumption_of_their_loads(self):
+        # Arrange
+        seed(18)
+        origin = datetime(2021, 1, 1, 12)
+        indices: List[Tuple[LoadProfileIndex, List[float]]] = [(LoadProfileIndex(timedelta(minutes=15)), [0.0] * 96)]
+
+        # Act
+        # Every load is added to a copy of a random earlier index, which must not change the earlier index.
+        for _ in range(200):
+            (parent, parent_slots) = indices[randint(0, len(indices) - 1)]
+            (first, last, power) = (randint(0, 95), randint(0, 95), randint(1, 5))
+            (first, last) = (min(first, last), max(first, last))
+            index = parent.copy()
+            index.add_load(origin + timedelta(minutes=15 * first), origin + timedelta(minutes=15 * (last + 1)), power)
+            slots = [slot + power if first <= i <= last else slot for (i, slot) in enumerate(parent_slots)]
+            indices.append((index, slots))
+
+        # Assert
+        for (index, slots) in indices:
+            for _ in range(5):
+                (first, last) = (randint(0, 95), randint(0, 95))
+                (first, last) = (min(first, last), max(first, last))
+                expected = max(slots[first:last + 1])
+                assert index.maximum_between(origin + timedelta(minutes=15 * first), origin + timedelta(minutes=15 * (last + 1))) == expected
+
+    def test_index_is_rebuilt_when_a_task_is_replaced(self):
+        # Arrange
+        power_usage_function = PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=60), 1)
+        schedule = Schedule([ScheduledTask(DatetimeInterval(datetime(2021, 1, 1, 12)), Task(power_usage_function), 0)])
+        index = schedule.load_profile_index(timedelta(minutes=1))
+
+        # Act
+        schedule.tasks[0] = ScheduledTask(DatetimeInterval(datetime(2021, 1, 1, 15)), Task(power_usage_function), 0)
+        replaced_index = schedule.load_profile_index(timedelta(minutes=1))
+
+        # Assert
+        assert replaced_index is not index
+        assert replaced_index.maximum_between(datetime(2021, 1, 1, 12), datetime(2021, 1, 1, 13)) == 0.0
+        assert replaced_index.maximum_between(datetime(2021, 1, 1, 15), datetime(2021, 1, 1, 16)) == 1.0
+
+    def test_loads_off_the_grid_are_not_exact(self):
+        # Arrange
+        index = LoadProfileIndex(timedelta(minutes=15))
+
+        # Act
+        index.add_load(datetime(2021, 1, 1, 12), datetime(2021, 1, 1, 12, 10), 1.0)
+
+        # Assert
+        assert not index.is_exact
+        assert index.maximum_between(datetime(2021, 1, 1, 12, 10), datetime(2021, 1, 1, 12, 15)) == 1.0
@@ -0,0 +1,79 @@
+from datetime import datetime, timedelta
+from typing import List
+
+from infrastructure.datetime_interval import DatetimeInterval
+from infrastructure.local_search_improver import LocalSearchImprover
+from infrastructure.maximum_power_consumption_validator import MaximumPowerConsumptionValidator
+from infrastructure.power_usage_function_factory import PowerUsageFunctionFactory
+from infrastructure.schedule import Schedule
+from infrastructure.schedule_task import ScheduledTask
+from infrastructure.scheduler import Scheduler
+from infrastructure.task import Task
+from domain import PriceRecord
+from infrastructure.spot_price_function import SpotPriceFunction
+
+
+class TestLocalSearchImprover:
+    def create_scheduler(self, prices: List[float]) -> Scheduler:
+        return Scheduler(SpotPriceFunction([
+            PriceRecord(datetime(2021, 1, 1) + timedelta(hours=hour), price)
+            for (hour, price) in enumerate(prices)
+        ]))
+
+    def scheduled_task(self, scheduler: Scheduler, task: Task, start_time: datetime) -> ScheduledTask:
+        [cost] = scheduler.costs_for(task, [start_time])
+        return ScheduledTask(DatetimeInterval(start_time, timedelta()), task, cost)
+
+    def test_shifts_task_to_cheaper_neighbouring_start_times(self):
+        # Arrange
+        scheduler = self.create_scheduler([1, 2, 3, 4])
+        task = Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=60), 1), id="1")
+        schedule = Schedule([self.scheduled_task(scheduler, task, datetime(2021, 1, 1, 2))], MaximumPowerConsumptionValidator(1))
+        improver = LocalSearchImprover(scheduler, None)
+
+        # Act
+        improved = improver.improve(schedule)
+
+        # Assert
+        assert improved.tasks[0].start_interval.start == datetime(2021, 1, 1)
+        assert improved.tasks[0].cost == 1.0
+        assert improver.moves > 1
+        assert schedule.tasks[0].start_interval.start == datetime(2021, 1, 1, 2)
+
+    def test_swaps_tasks_within_the_power_cap(self):
+        # Arrange
+
+        # Both hours are taken and the cap only allows one task at a time, so only a swap lowers the cost.
+        scheduler = self.create_scheduler([1, 3])
+        small = Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=60), 1), id="small")
+        large = Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=60), 2), id="large")
+        schedule = Schedule([
+            self.scheduled_task(scheduler, small, datetime(2021, 1, 1)),
+            self.scheduled_task(scheduler, large, datetime(2021, 1, 1, 1)),
+        ], MaximumPowerConsumptionValidator(2))
+
+        # Act
+        improved = LocalSearchImprover(scheduler, None).improve(schedule)
+
+        # Assert
+        starts = { scheduled_task.task.id: scheduled_task.start_interval.start for scheduled_task in improved.tasks }
+        assert starts == { "small": datetime(2021, 1, 1, 1), "large": datetime(2021, 1, 1) }
+        assert sum(scheduled_task.cost for scheduled_task in improved.tasks) == 5.0
+
+    def test_base_schedule_tasks_are_not_moved(self):
+        # Arrange
+        scheduler = self.create_scheduler([1, 2, 3])
+        fixed = self.scheduled_task(
+            scheduler, Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=60), 1), id="fixed"),
+            datetime(2021, 1, 1, 2)
+        )
+        base = Schedule([fixed], MaximumPowerConsumptionValidator(1))
+        task = Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=60), 1), id="1")
+        schedule = Schedule([fixed, self.scheduled_task(scheduler, task, datetime(2021, 1, 1, 1))], base.validator)
+
+        # Act
+        improved = LocalSearchImprover(scheduler, None).improve(schedule, base)
+
+        # Assert
+        assert improved.tasks[0] is fixed
+        assert improved.tasks[1].start_interval.start == datetime(2021, 1, 1)
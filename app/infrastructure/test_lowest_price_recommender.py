@@ -0,0 +1,54 @@
+from datetime import datetime, timedelta
+from typing import Iterator, List
+
+from infrastructure.co2_emission_function import Co2EmissionFunction
+from infrastructure.datetime_interval import DatetimeInterval
+from infrastructure.lowest_price_recommender import LowestPriceRecommender
+from infrastructure.power_usage_function_factory import PowerUsageFunctionFactory
+from infrastructure.schedule import Schedule
+from infrastructure.schedule_task import ScheduledTask
+from infrastructure.task import Task
+from domain import EmissionRecord, PriceRecord
+from infrastructure.spot_price_function import SpotPriceFunction
+
+
+class TestLowestPriceRecommender:
+    def create_recommender(self) -> LowestPriceRecommender:
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 3),
+            PriceRecord(datetime(2021, 1, 1, 16), 1),
+            PriceRecord(datetime(2021, 1, 1, 17), 2),
+        ]
+        return LowestPriceRecommender(
+            SpotPriceFunction(price_points),
+            Co2EmissionFunction([EmissionRecord(datetime(2021, 1, 1, 15), 1)])
+        )
+
+    def test_recommend_lowest_price_from_generated_schedules(self):
+        # Arrange
+        recommender = self.create_recommender()
+        task = Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(hours=1), 1), id="1")
+
+        def generate_schedules() -> Iterator[Schedule]:
+            for (hour, cost) in [(15, 3), (16, 1), (17, 2)]:
+                yield Schedule([
+                    ScheduledTask(DatetimeInterval(datetime(2021, 1, 1, hour), timedelta()), task, cost)
+                ])
+
+        # Act
+        recommendation = recommender.recommend(generate_schedules())
+
+        # Assert
+        assert recommendation is not None
+        assert recommendation.tasks[0].start_interval.start == datetime(2021, 1, 1, 16)
+        assert recommender.highest_scheduled_task_prices == { "1": 3 }
+
+    def test_recommend_without_schedules(self):
+        # Arrange
+        recommender = self.create_recommender()
+
+        # Act
+        recommendation = recommender.recommend(iter([]))
+
+        # Assert
+        assert recommendation is None
@@ -298,4 +298,78 @@ class TestMaximumPowerConsumptionValidator:
         )
 
         # Assert
-        assert not valid
\ No newline at end of file
+        assert not valid
+
+    def test_validate_checks_power_changes_of_the_task_between_schedule_changes(self):
+        # Arrange
+
+        # "1" uses 1Kw from 12:00 to 14:00 and "2" uses 0.1Kw from 12:10 to 12:20.
+        # The new task uses 1.5Kw from 12:30 to 12:40, which exceeds the limit together with "1".
+        scheduled_task_1 = ScheduledTask(
+            DatetimeInterval(datetime(2021, 1, 1, 12), timedelta()),
+            Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(hours=2), 1), id="1"),
+            0
+        )
+        scheduled_task_2 = ScheduledTask(
+            DatetimeInterval(datetime(2021, 1, 1, 12, 10), timedelta()),
+            Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=10), 0.1), id="2"),
+            0
+        )
+        task = Task(PowerUsageFunctionFactory().create_variable_consumption(
+            [(timedelta(), 0.5), (timedelta(minutes=30), 1.5), (timedelta(minutes=40), 0.5)], timedelta(minutes=20)
+        ))
+        validator = MaximumPowerConsumptionValidator(2)
+        schedule = Schedule([scheduled_task_1, scheduled_task_2], validator)
+
+        # Act
+        valid = validator.validate(schedule, task, datetime(2021, 1, 1, 12))
+
+        # Assert
+        assert not valid
+
+    def test_validate_flexible_start_interval_runs_until_latest_end(self):
+        # Arrange
+
+        # "1" can start between 12:00 and 12:30, so it might be running until 13:30.
+        scheduled_task = ScheduledTask(
+            DatetimeInterval(datetime(2021, 1, 1, 12), timedelta(minutes=30)),
+            Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(hours=1), 1), id="1"),
+            0
+        )
+        task = Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=15), 1))
+        validator = MaximumPowerConsumptionValidator(1.5)
+        schedule = Schedule([scheduled_task], validator)
+
+        # Act
+        valid_while_running = validator.validate(schedule, task, datetime(2021, 1, 1, 12, 20))
+        valid_at_latest_end = validator.validate(schedule, task, datetime(2021, 1, 1, 13, 30))
+
+        # Assert
+        assert not valid_while_running
+        assert valid_at_latest_end
+
+    def test_validate_time_varying_maximum_consumption(self):
+        # Arrange
+
+        # The greatest total consumption drops to 1Kw from 17:00 until 18:00.
+        validator = MaximumPowerConsumptionValidator(2, [
+            (datetime(2021, 1, 1, 17), 1),
+            (datetime(2021, 1, 1, 18), 2),
+        ])
+        scheduled_task = ScheduledTask(
+            DatetimeInterval(datetime(2021, 1, 1, 15), timedelta()),
+            Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(hours=4), 1), id="1"),
+            0
+        )
+        schedule = Schedule([scheduled_task], validator)
+        task = Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=30), 1))
+
+        # Act
+        valid_before = validator.validate(schedule, task, datetime(2021, 1, 1, 16, 30))
+        valid_overlapping = validator.validate(schedule, task, datetime(2021, 1, 1, 16, 45))
+        valid_after = validator.validate(schedule, task, datetime(2021, 1, 1, 18))
+
+        # Assert
+        assert valid_before
+        assert not valid_overlapping
+        assert valid_after
@@ -1,6 +1,6 @@
 from datetime import datetime, timedelta
 from typing import List
-from domain import PricePoint
+from domain import PriceRecord
 from infrastructure import OptimalTimeCalculator
 
 
@@ -8,15 +8,15 @@ class TestOptimalTimeCalculator:
     def test_one_hour_span(self):
         # Arrange
         expected: datetime = datetime(2021, 1, 1, 19)
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 10.0),
-            PricePoint(datetime(2021, 1, 1, 16), 10.0),
-            PricePoint(datetime(2021, 1, 1, 17), 10.0),
-            PricePoint(datetime(2021, 1, 1, 18), 10.0),
-            PricePoint(expected, 5.0),
-            PricePoint(datetime(2021, 1, 1, 20), 10.0),
-            PricePoint(datetime(2021, 1, 1, 21), 10.0),
-            PricePoint(datetime(2021, 1, 1, 22), 10.0)
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 16), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 17), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 18), 10.0),
+            PriceRecord(expected, 5.0),
+            PriceRecord(datetime(2021, 1, 1, 20), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 21), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 22), 10.0)
         ]
 
         # Act
@@ -28,16 +28,16 @@ class TestOptimalTimeCalculator:
     def test_two_hour_span(self):
         # Arrange
         expected: datetime = datetime(2021, 1, 1, 17)
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 10.0),
-            PricePoint(datetime(2021, 1, 1, 16), 10.0),
-            PricePoint(datetime(2021, 1, 1, 17), 10.0),
-            PricePoint(expected, 5.0),
-            PricePoint(datetime(2021, 1, 1, 19), 10.0),
-            PricePoint(datetime(2021, 1, 1, 20), 10.0),
-            PricePoint(datetime(2021, 1, 1, 21), 10.0),
-            PricePoint(datetime(2021, 1, 1, 22), 10.0),
-            PricePoint(datetime(2021, 1, 1, 23), 10.0)
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 16), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 17), 10.0),
+            PriceRecord(expected, 5.0),
+            PriceRecord(datetime(2021, 1, 1, 19), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 20), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 21), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 22), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 23), 10.0)
         ]
 
         # Act
@@ -49,16 +49,16 @@ class TestOptimalTimeCalculator:
     def test_one_hour_span_early_edge_case(self):
         # Arrange
         expected: datetime = datetime(2021, 1, 1, 15)
-        price_points: List[PricePoint] = [
-            PricePoint(expected, 5.0),
-            PricePoint(datetime(2021, 1, 1, 16), 10.0),
-            PricePoint(datetime(2021, 1, 1, 17), 10.0),
-            PricePoint(datetime(2021, 1, 1, 18), 10.0),
-            PricePoint(datetime(2021, 1, 1, 19), 10.0),
-            PricePoint(datetime(2021, 1, 1, 20), 10.0),
-            PricePoint(datetime(2021, 1, 1, 21), 10.0),
-            PricePoint(datetime(2021, 1, 1, 22), 10.0),
-            PricePoint(datetime(2021, 1, 1, 23), 10.0)
+        price_points: List[PriceRecord] = [
+            PriceRecord(expected, 5.0),
+            PriceRecord(datetime(2021, 1, 1, 16), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 17), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 18), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 19), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 20), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 21), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 22), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 23), 10.0)
         ]
 
         # Act
@@ -70,16 +70,16 @@ class TestOptimalTimeCalculator:
     def test_one_hour_span_late_edge_case(self):
         # Arrange
         expected: datetime = datetime(2021, 1, 1, 23)
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 10.0),
-            PricePoint(datetime(2021, 1, 1, 16), 10.0),
-            PricePoint(datetime(2021, 1, 1, 17), 10.0),
-            PricePoint(datetime(2021, 1, 1, 18), 10.0),
-            PricePoint(datetime(2021, 1, 1, 19), 10.0),
-            PricePoint(datetime(2021, 1, 1, 20), 10.0),
-            PricePoint(datetime(2021, 1, 1, 21), 10.0),
-            PricePoint(datetime(2021, 1, 1, 22), 10.0),
-            PricePoint(expected, 5.0)
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 16), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 17), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 18), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 19), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 20), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 21), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 22), 10.0),
+            PriceRecord(expected, 5.0)
         ]
 
         # Act
@@ -91,15 +91,15 @@ class TestOptimalTimeCalculator:
     def test_one_and_a_half_hour_span(self):
         # Arrange
         expected: datetime = datetime(2021, 1, 1, 18, 30)
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 10.0),
-            PricePoint(datetime(2021, 1, 1, 16), 10.0),
-            PricePoint(datetime(2021, 1, 1, 17), 5.0),
-            PricePoint(datetime(2021, 1, 1, 18), 6.0),
-            PricePoint(datetime(2021, 1, 1, 19), 4.0),
-            PricePoint(datetime(2021, 1, 1, 20), 10.0),
-            PricePoint(datetime(2021, 1, 1, 21), 10.0),
-            PricePoint(datetime(2021, 1, 1, 22), 10.0)
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 16), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 17), 5.0),
+            PriceRecord(datetime(2021, 1, 1, 18), 6.0),
+            PriceRecord(datetime(2021, 1, 1, 19), 4.0),
+            PriceRecord(datetime(2021, 1, 1, 20), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 21), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 22), 10.0)
         ]
 
         # Act
@@ -111,15 +111,15 @@ class TestOptimalTimeCalculator:
     def test_one_and_a_quarter_hour_span(self):
         # Arrange
         expected: datetime = datetime(2021, 1, 1, 18, 45)
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 10.0),
-            PricePoint(datetime(2021, 1, 1, 16), 10.0),
-            PricePoint(datetime(2021, 1, 1, 17), 5.0),
-            PricePoint(datetime(2021, 1, 1, 18), 6.0),
-            PricePoint(datetime(2021, 1, 1, 19), 4.0),
-            PricePoint(datetime(2021, 1, 1, 20), 10.0),
-            PricePoint(datetime(2021, 1, 1, 21), 10.0),
-            PricePoint(datetime(2021, 1, 1, 22), 10.0)
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 16), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 17), 5.0),
+            PriceRecord(datetime(2021, 1, 1, 18), 6.0),
+            PriceRecord(datetime(2021, 1, 1, 19), 4.0),
+            PriceRecord(datetime(2021, 1, 1, 20), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 21), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 22), 10.0)
         ]
 
         # Act
@@ -131,15 +131,15 @@ class TestOptimalTimeCalculator:
     def test_one_and_three_quarters_hour_span(self):
         # Arrange
         expected: datetime = datetime(2021, 1, 1, 18, 15)
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 10.0),
-            PricePoint(datetime(2021, 1, 1, 16), 10.0),
-            PricePoint(datetime(2021, 1, 1, 17), 5.0),
-            PricePoint(datetime(2021, 1, 1, 18), 6.0),
-            PricePoint(datetime(2021, 1, 1, 19), 4.0),
-            PricePoint(datetime(2021, 1, 1, 20), 10.0),
-            PricePoint(datetime(2021, 1, 1, 21), 10.0),
-            PricePoint(datetime(2021, 1, 1, 22), 10.0)
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 16), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 17), 5.0),
+            PriceRecord(datetime(2021, 1, 1, 18), 6.0),
+            PriceRecord(datetime(2021, 1, 1, 19), 4.0),
+            PriceRecord(datetime(2021, 1, 1, 20), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 21), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 22), 10.0)
         ]
 
         # Act
@@ -151,15 +151,15 @@ class TestOptimalTimeCalculator:
     def test_span_is_zero(self):
         # Arrange
         expected: datetime = datetime(2021, 1, 1, 15)
-        price_points: List[PricePoint] = [
-            PricePoint(expected, 10.0),
-            PricePoint(datetime(2021, 1, 1, 16), 10.0),
-            PricePoint(datetime(2021, 1, 1, 17), 5.0),
-            PricePoint(datetime(2021, 1, 1, 18), 10.0),
-            PricePoint(datetime(2021, 1, 1, 19), 10.0),
-            PricePoint(datetime(2021, 1, 1, 20), 10.0),
-            PricePoint(datetime(2021, 1, 1, 21), 10.0),
-            PricePoint(datetime(2021, 1, 1, 22), 10.0)
+        price_points: List[PriceRecord] = [
+            PriceRecord(expected, 10.0),
+            PriceRecord(datetime(2021, 1, 1, 16), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 17), 5.0),
+            PriceRecord(datetime(2021, 1, 1, 18), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 19), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 20), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 21), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 22), 10.0)
         ]
 
         # Act
@@ -171,15 +171,15 @@ class TestOptimalTimeCalculator:
     def test_span_is_sub_one_minute(self):
         # Arrange
         expected: datetime = datetime(2021, 1, 1, 17)
-        price_points: List[PricePoint] = [
-            PricePoint(expected, 10.0),
-            PricePoint(datetime(2021, 1, 1, 16), 10.0),
-            PricePoint(datetime(2021, 1, 1, 17), 5.0),
-            PricePoint(datetime(2021, 1, 1, 18), 10.0),
-            PricePoint(datetime(2021, 1, 1, 19), 10.0),
-            PricePoint(datetime(2021, 1, 1, 20), 10.0),
-            PricePoint(datetime(2021, 1, 1, 21), 10.0),
-            PricePoint(datetime(2021, 1, 1, 22), 10.0)
+        price_points: List[PriceRecord] = [
+            PriceRecord(expected, 10.0),
+            PriceRecord(datetime(2021, 1, 1, 16), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 17), 5.0),
+            PriceRecord(datetime(2021, 1, 1, 18), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 19), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 20), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 21), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 22), 10.0)
         ]
 
         # Act
@@ -191,15 +191,15 @@ class TestOptimalTimeCalculator:
     def test_span_is_sub_one_minute_decomposable(self):
         # Arrange
         expected: datetime = datetime(2021, 1, 1, 17)
-        price_points: List[PricePoint] = [
-            PricePoint(expected, 10.0),
-            PricePoint(datetime(2021, 1, 1, 16), 10.0),
-            PricePoint(datetime(2021, 1, 1, 17), 5.0),
-            PricePoint(datetime(2021, 1, 1, 18), 10.0),
-            PricePoint(datetime(2021, 1, 1, 19), 10.0),
-            PricePoint(datetime(2021, 1, 1, 20), 10.0),
-            PricePoint(datetime(2021, 1, 1, 21), 10.0),
-            PricePoint(datetime(2021, 1, 1, 22), 10.0)
+        price_points: List[PriceRecord] = [
+            PriceRecord(expected, 10.0),
+            PriceRecord(datetime(2021, 1, 1, 16), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 17), 5.0),
+            PriceRecord(datetime(2021, 1, 1, 18), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 19), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 20), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 21), 10.0),
+            PriceRecord(datetime(2021, 1, 1, 22), 10.0)
         ]
 
         # Act
@@ -0,0 +1,103 @@
+from datetime import datetime, timedelta
+
+from infrastructure.datetime_interval import DatetimeInterval
+from infrastructure.maximum_power_consumption_validator import MaximumPowerConsumptionValidator
+from infrastructure.persistent_schedule import PersistentSchedule, Placement
+from infrastructure.power_usage_function_factory import PowerUsageFunctionFactory
+from infrastructure.schedule import Schedule
+from infrastructure.schedule_task import ScheduledTask
+from infrastructure.scheduler import Scheduler
+from infrastructure.task import Task
+from domain import PriceRecord
+from infrastructure.spot_price_function import SpotPriceFunction
+
+
+class TestPersistentSchedule:
+    def test_place_shares_the_parent(self):
+        # Arrange
+        tasks = [
+            Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=60), 1), id="1"),
+            Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=30), 2), id="2"),
+        ]
+        root = PersistentSchedule(Schedule([]), tasks)
+
+        # Act
+        first = root.place(Placement(1, datetime(2021, 1, 1, 15), 2.0))
+        second = first.place(Placement(0, datetime(2021, 1, 1, 16), 3.0))
+        other = first.place(Placement(0, datetime(2021, 1, 1, 17), 1.0))
+
+        # Assert
+        assert second.parent is first and other.parent is first
+        assert root.placements() == []
+        assert first.placements() == [Placement(1, datetime(2021, 1, 1, 15), 2.0)]
+        assert second.placements() == [
+            Placement(1, datetime(2021, 1, 1, 15), 2.0), Placement(0, datetime(2021, 1, 1, 16), 3.0)
+        ]
+        assert (second.cost, second.depth) == (5.0, 2)
+        assert (other.cost, other.depth) == (3.0, 2)
+
+    def test_to_schedule_appends_placements_to_base(self):
+        # Arrange
+        base_task = Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=60), 1), id="base")
+        validator = MaximumPowerConsumptionValidator(2)
+        base = Schedule([ScheduledTask(DatetimeInterval(datetime(2021, 1, 1, 14)), base_task, 4.0)], validator)
+        tasks = [Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=30), 2), id="1")]
+        schedule = PersistentSchedule(base, tasks).place(Placement(0, datetime(2021, 1, 1, 15), 2.0))
+
+        # Act
+        full_schedule = schedule.to_schedule()
+
+        # Assert
+        assert full_schedule.validator is validator
+        assert [scheduled_task.task.id for scheduled_task in full_schedule.tasks] == ["base", "1"]
+        assert full_schedule.tasks[1].start_interval == DatetimeInterval(datetime(2021, 1, 1, 15), timedelta())
+        assert full_schedule.tasks[1].cost == 2.0
+        assert len(base.tasks) == 1
+
+    def test_place_task_for_matches_schedule_task_for(self):
+        # Arrange
+        scheduler = Scheduler(SpotPriceFunction([
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 2),
+        ]))
+        tasks = [
+            Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=60), 1), id="1"),
+            Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=30), 2), id="2"),
+        ]
+        root = PersistentSchedule(Schedule([], MaximumPowerConsumptionValidator(2)), tasks)
+        parent = scheduler.place_task_for(0, root)[0]
+
+        # Act
+        placed = scheduler.place_task_for(1, parent)
+        scheduled = scheduler.schedule_task_for(tasks[1], parent.to_schedule())
+
+        # Assert
+        assert len(placed) == len(scheduled)
+        for (placed_schedule, scheduled_schedule) in zip(placed, scheduled):
+            assert placed_schedule.parent is parent
+            assert placed_schedule.placement is not None
+            assert placed_schedule.placement.start == scheduled_schedule.tasks[-1].start_interval.start
+            assert placed_schedule.placement.cost == scheduled_schedule.tasks[-1].cost
+
+    def test_validation_schedule_is_created_once_from_the_parent(self):
+        # Arrange
+        tasks = [
+            Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=60), 1), id="1"),
+            Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=30), 2), id="2"),
+        ]
+        base = Schedule([], MaximumPowerConsumptionValidator(2))
+        root = PersistentSchedule(base, tasks)
+        first = root.place(Placement(1, datetime(2021, 1, 1, 15), 2.0))
+        second = first.place(Placement(0, datetime(2021, 1, 1, 16), 3.0))
+
+        # Act
+        second_schedule = second.validation_schedule()
+        first_schedule = first.validation_schedule()
+
+        # Assert
+        assert second.validation_schedule() is second_schedule
+        assert [scheduled_task.task.id for scheduled_task in first_schedule.tasks] == ["2"]
+        assert [scheduled_task.task.id for scheduled_task in second_schedule.tasks] == ["2", "1"]
+        assert second_schedule.tasks[0] is first_schedule.tasks[0]
+        assert second_schedule.validator is base.validator
+        assert len(base.tasks) == 0
@@ -2,7 +2,7 @@ from datetime import datetime, timedelta
 from random import random
 from typing import List, Tuple
 
-from domain import PricePoint
+from domain import PriceRecord
 from infrastructure.spot_price_function import SpotPriceFunction
 from infrastructure.power_usage_function import PowerUsageFunction
 from infrastructure.power_price_function import PowerPriceFunction
@@ -11,10 +11,10 @@ from infrastructure.power_price_function import PowerPriceFunction
 class TestPowerPriceFunction:
     def test_is_in_same_discrete_point(self):
         # Arrange
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 1),
-            PricePoint(datetime(2021, 1, 1, 16), 2),
-            PricePoint(datetime(2021, 1, 1, 17), 3)
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 2),
+            PriceRecord(datetime(2021, 1, 1, 17), 3)
         ]
         spot_price_function = SpotPriceFunction(price_points)
         power_points: List[Tuple[timedelta, float]] = [
@@ -38,10 +38,10 @@ class TestPowerPriceFunction:
 
     def test_integrate_over_the_same_power_point(self):
         # Arrange
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 1),
-            PricePoint(datetime(2021, 1, 1, 16), 2),
-            PricePoint(datetime(2021, 1, 1, 17), 3)
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 2),
+            PriceRecord(datetime(2021, 1, 1, 17), 3)
         ]
         spot_price_function = SpotPriceFunction(price_points)
         power_points: List[Tuple[timedelta, float]] = [
@@ -66,10 +66,10 @@ class TestPowerPriceFunction:
 
     def test_integrate_over_nearly_the_same_power_price_point(self):
         # Arrange
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 1),
-            PricePoint(datetime(2021, 1, 1, 16), 2),
-            PricePoint(datetime(2021, 1, 1, 17), 3)
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 2),
+            PriceRecord(datetime(2021, 1, 1, 17), 3)
         ]
         spot_price_function = SpotPriceFunction(price_points)
         power_points: List[Tuple[timedelta, float]] = [
@@ -95,10 +95,10 @@ class TestPowerPriceFunction:
 
     def test_integrate_over_multiple_hours(self):
         # Arrange
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 1),
-            PricePoint(datetime(2021, 1, 1, 16), 2),
-            PricePoint(datetime(2021, 1, 1, 17), 3)
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 2),
+            PriceRecord(datetime(2021, 1, 1, 17), 3)
         ]
         spot_price_function = SpotPriceFunction(price_points)
         power_points: List[Tuple[timedelta, float]] = [
@@ -119,10 +119,10 @@ class TestPowerPriceFunction:
 
     def random_property_based_integral(self):
         # Arrange
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 1),
-            PricePoint(datetime(2021, 1, 1, 16), 1),
-            PricePoint(datetime(2021, 1, 1, 17), 1)
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 1),
+            PriceRecord(datetime(2021, 1, 1, 17), 1)
         ]
         spot_price_function = SpotPriceFunction(price_points)
         power_points: List[Tuple[timedelta, float]] = [
@@ -152,9 +152,9 @@ class TestPowerPriceFunction:
 
     def test_next_discrete_point_with_smaller_power_domain_jumps(self):
         # Arrange
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 1),
-            PricePoint(datetime(2021, 1, 1, 18), 4)
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 18), 4)
         ]
         spot_price_function = SpotPriceFunction(price_points)
         power_points: List[Tuple[timedelta, float]] = [
@@ -194,11 +194,11 @@ class TestPowerPriceFunction:
 
     def test_next_discrete_point_with_smaller_spot_price_domain_jumps(self):
         # Arrange
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 1),
-            PricePoint(datetime(2021, 1, 1, 15, 30), 1),
-            PricePoint(datetime(2021, 1, 1, 16, 30), 1),
-            PricePoint(datetime(2021, 1, 1, 18), 4)
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 15, 30), 1),
+            PriceRecord(datetime(2021, 1, 1, 16, 30), 1),
+            PriceRecord(datetime(2021, 1, 1, 18), 4)
         ]
         spot_price_function = SpotPriceFunction(price_points)
         power_points: List[Tuple[timedelta, float]] = [
@@ -242,11 +242,11 @@ class TestPowerPriceFunction:
 
     def test_integral_example(self):
         # Arrange
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 1),
-            PricePoint(datetime(2021, 1, 1, 15, 30), 10),
-            PricePoint(datetime(2021, 1, 1, 16, 30), 1),
-            PricePoint(datetime(2021, 1, 1, 18), 4)
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 15, 30), 10),
+            PriceRecord(datetime(2021, 1, 1, 16, 30), 1),
+            PriceRecord(datetime(2021, 1, 1, 18), 4)
         ]
         spot_price_function = SpotPriceFunction(price_points, timedelta(hours=2))
         power_points: List[Tuple[timedelta, float]] = [
@@ -319,15 +319,15 @@ class TestPowerPriceFunction:
 
     def test_same_intervals(self):
         # Arrange
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 1),
-            PricePoint(datetime(2021, 1, 1, 16), 2),
-            PricePoint(datetime(2021, 1, 1, 17), 3),
-            PricePoint(datetime(2021, 1, 1, 18), 4),
-            PricePoint(datetime(2021, 1, 1, 19), 5),
-            PricePoint(datetime(2021, 1, 1, 20), 6),
-            PricePoint(datetime(2021, 1, 1, 21), 7),
-            PricePoint(datetime(2021, 1, 1, 22), 8)
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 2),
+            PriceRecord(datetime(2021, 1, 1, 17), 3),
+            PriceRecord(datetime(2021, 1, 1, 18), 4),
+            PriceRecord(datetime(2021, 1, 1, 19), 5),
+            PriceRecord(datetime(2021, 1, 1, 20), 6),
+            PriceRecord(datetime(2021, 1, 1, 21), 7),
+            PriceRecord(datetime(2021, 1, 1, 22), 8)
         ]
         spot_price_function = SpotPriceFunction(price_points)
         power_points: List[Tuple[timedelta, float]] = [
@@ -355,15 +355,15 @@ class TestPowerPriceFunction:
 
     def test_next_point_should_not_be_is_same_discrete_point(self):
         # Arrange
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 1),
-            PricePoint(datetime(2021, 1, 1, 16), 2),
-            PricePoint(datetime(2021, 1, 1, 17), 3),
-            PricePoint(datetime(2021, 1, 1, 18), 4),
-            PricePoint(datetime(2021, 1, 1, 19), 5),
-            PricePoint(datetime(2021, 1, 1, 20), 6),
-            PricePoint(datetime(2021, 1, 1, 21), 7),
-            PricePoint(datetime(2021, 1, 1, 22), 8)
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 2),
+            PriceRecord(datetime(2021, 1, 1, 17), 3),
+            PriceRecord(datetime(2021, 1, 1, 18), 4),
+            PriceRecord(datetime(2021, 1, 1, 19), 5),
+            PriceRecord(datetime(2021, 1, 1, 20), 6),
+            PriceRecord(datetime(2021, 1, 1, 21), 7),
+            PriceRecord(datetime(2021, 1, 1, 22), 8)
         ]
         spot_price_function = SpotPriceFunction(price_points)
         power_points: List[Tuple[timedelta, float]] = [
@@ -452,11 +452,11 @@ class TestPowerPriceFunction:
 
     def test_n_version_test_over_integrate_and_integrate_from_to(self):
         # Arrange
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 1),
-            PricePoint(datetime(2021, 1, 1, 15, 30), 10),
-            PricePoint(datetime(2021, 1, 1, 16, 30), 1),
-            PricePoint(datetime(2021, 1, 1, 18), 4)
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 15, 30), 10),
+            PriceRecord(datetime(2021, 1, 1, 16, 30), 1),
+            PriceRecord(datetime(2021, 1, 1, 18), 4)
         ]
         spot_price_function = SpotPriceFunction(price_points)
         power_points: List[Tuple[timedelta, float]] = [
@@ -518,15 +518,15 @@ class TestPowerPriceFunction:
 
     def test_sum_over_variable_sized_domains(self):
         # Arrange
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 1),
-            PricePoint(datetime(2021, 1, 1, 15, 30), 2),
-            PricePoint(datetime(2021, 1, 1, 16), 3),
-            PricePoint(datetime(2021, 1, 1, 16, 30), 4),
-            PricePoint(datetime(2021, 1, 1, 17), 5),
-            PricePoint(datetime(2021, 1, 1, 17, 30), 6),
-            PricePoint(datetime(2021, 1, 1, 18), 7),
-            PricePoint(datetime(2021, 1, 1, 18, 30), 8)
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 15, 30), 2),
+            PriceRecord(datetime(2021, 1, 1, 16), 3),
+            PriceRecord(datetime(2021, 1, 1, 16, 30), 4),
+            PriceRecord(datetime(2021, 1, 1, 17), 5),
+            PriceRecord(datetime(2021, 1, 1, 17, 30), 6),
+            PriceRecord(datetime(2021, 1, 1, 18), 7),
+            PriceRecord(datetime(2021, 1, 1, 18, 30), 8)
         ]
         spot_price_function = SpotPriceFunction(price_points)
         power_points: List[Tuple[timedelta, float]] = [
@@ -549,4 +549,62 @@ class TestPowerPriceFunction:
         )
 
         # Assert
-        assert sum == 3
\ No newline at end of file
+        assert sum == 3
+
+    def test_integrate_many_matches_integrate_from_to(self):
+        # Arrange
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 15, 30), 10),
+            PriceRecord(datetime(2021, 1, 1, 16, 30), 1),
+            PriceRecord(datetime(2021, 1, 1, 18), 4)
+        ]
+        spot_price_function = SpotPriceFunction(price_points)
+        power_points: List[Tuple[timedelta, float]] = [
+            (timedelta(hours=0), 4),
+            (timedelta(minutes=20), 1),
+            (timedelta(minutes=50), 10),
+        ]
+        power_usage_function = PowerUsageFunction(power_points)
+        power_price_function = PowerPriceFunction(power_usage_function, spot_price_function)
+        duration = timedelta(hours=1, minutes=10)
+        starts = [datetime(2021, 1, 1, 15) + timedelta(minutes=minutes) for minutes in range(0, 170, 5)]
+
+        # Act
+        integrals = power_price_function.integrate_many(starts, duration)
+
+        # Assert
+        assert len(integrals) == len(starts)
+        for (start, integral) in zip(starts, integrals):
+            expected = power_price_function.integrate_from_to(start, duration)
+            assert abs(integral - expected) < 1e-9
+
+    def test_next_discrete_point_from_timeline_matches_stepping_both_functions(self):
+        # Arrange
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 15, 30), 10),
+            PriceRecord(datetime(2021, 1, 1, 16, 30), 1),
+            PriceRecord(datetime(2021, 1, 1, 18), 4)
+        ]
+        spot_price_function = SpotPriceFunction(price_points)
+        power_points: List[Tuple[timedelta, float]] = [
+            (timedelta(hours=0), 4),
+            (timedelta(minutes=20), 1),
+            (timedelta(minutes=50), 10),
+        ]
+        power_usage_function = PowerUsageFunction(power_points)
+        power_price_function = PowerPriceFunction(power_usage_function, spot_price_function)
+        start = datetime(2021, 1, 1, 15, 10)
+        global_min = (start, timedelta())
+        global_max = (start + power_usage_function.max_domain, power_usage_function.max_domain)
+
+        for minutes in range(0, 110, 5):
+            # Act
+            argument = (start + timedelta(minutes=minutes), timedelta(minutes=minutes))
+            next_point = power_price_function.next_discrete_point_from(global_min, argument, global_max)
+
+            # Assert
+            assert next_point == power_price_function.find_next_discrete_point_from(
+                global_min, argument, global_max
+            )
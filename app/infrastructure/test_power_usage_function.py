@@ -329,4 +329,39 @@ class TestPowerUsageFunction:
         # Assert
         assert next_1 == (datetime(2015, 10, 20, 16), 1)
         assert next_2 == (datetime(2015, 10, 20, 17), 2)
-        assert next_3 == (datetime(2015, 10, 20, 18), 3)
\ No newline at end of file
+        assert next_3 == (datetime(2015, 10, 20, 18), 3)
+
+    def test_sum_and_integrate_over_more_points_than_the_recursion_limit(self):
+        # Arrange
+        power_points: List[Tuple[timedelta, float]] = [
+            (timedelta(minutes=5 * minutes), 1) for minutes in range(1, 5000)
+        ]
+        power_usage_function = PowerUsageFunction(power_points, extend_by=timedelta(minutes=5))
+
+        # Act
+        sum = power_usage_function.sum(
+            power_usage_function.min_domain, power_usage_function.max_domain
+        )
+        integral = power_usage_function.integrate(
+            power_usage_function.min_domain, power_usage_function.max_domain
+        )
+
+        # Assert
+        assert sum == 5001
+        assert abs(integral - 5000 / 12) < 1e-6
+
+    def test_integrate_to_an_end_on_a_power_point(self):
+        # Arrange
+        power_points: List[Tuple[timedelta, float]] = [
+            (timedelta(hours=0), 1),
+            (timedelta(hours=1), 2),
+            (timedelta(hours=2), 3),
+        ]
+        power_usage_function = PowerUsageFunction(power_points)
+
+        # Act
+        # The end is equal to the domain of a power point, but it is not the same object.
+        integral = power_usage_function.integrate(timedelta(hours=0), timedelta(minutes=120))
+
+        # Assert
+        assert integral == 3
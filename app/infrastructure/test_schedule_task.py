@@ -3,7 +3,7 @@ from random import random
 from typing import List
 
 from infrastructure.power_price_function import PowerPriceFunction
-from domain import PricePoint
+from domain import PriceRecord
 from infrastructure.spot_price_function import SpotPriceFunction
 from infrastructure.schedule_task import ScheduledTask
 from infrastructure.datetime_interval import DatetimeInterval
@@ -132,19 +132,19 @@ class TestScheduledTask():
             start_interval = DatetimeInterval(start_datetime, start_duration)
             scheduled_task = ScheduledTask(start_interval, task, 0)
 
-            price_points: List[PricePoint] = [
-                PricePoint(start_datetime + runtime_step * 0, 1),
-                PricePoint(start_datetime + runtime_step * 1, 2),
-                PricePoint(start_datetime + runtime_step * 2, 3),
-                PricePoint(start_datetime + runtime_step * 3, 4),
-                PricePoint(start_datetime + runtime_step * 4, 5),
-                PricePoint(start_datetime + runtime_step * 5, 6),
-                PricePoint(start_datetime + runtime_step * 6, 7),
-                PricePoint(start_datetime + runtime_step * 7, 8),
-                PricePoint(start_datetime + runtime_step * 8, 9),
-                PricePoint(start_datetime + runtime_step * 9, 10),
-                PricePoint(start_datetime + runtime_step * 10, 11),
-                PricePoint(start_datetime + runtime_step * 11, 12),
+            price_points: List[PriceRecord] = [
+                PriceRecord(start_datetime + runtime_step * 0, 1),
+                PriceRecord(start_datetime + runtime_step * 1, 2),
+                PriceRecord(start_datetime + runtime_step * 2, 3),
+                PriceRecord(start_datetime + runtime_step * 3, 4),
+                PriceRecord(start_datetime + runtime_step * 4, 5),
+                PriceRecord(start_datetime + runtime_step * 5, 6),
+                PriceRecord(start_datetime + runtime_step * 6, 7),
+                PriceRecord(start_datetime + runtime_step * 7, 8),
+                PriceRecord(start_datetime + runtime_step * 8, 9),
+                PriceRecord(start_datetime + runtime_step * 9, 10),
+                PriceRecord(start_datetime + runtime_step * 10, 11),
+                PriceRecord(start_datetime + runtime_step * 11, 12),
             ]
             spot_price_function = SpotPriceFunction(price_points)
 
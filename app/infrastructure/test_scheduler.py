@@ -10,18 +10,19 @@ from infrastructure.datetime_interval import DatetimeInterval
 from infrastructure.schedule import Schedule
 from infrastructure.schedule_task import ScheduledTask
 from infrastructure.scheduler import Scheduler
+from infrastructure.search_budget import SearchBudget
 from infrastructure.task import Task
 from infrastructure.power_usage_function import PowerUsageFunction
-from domain import PricePoint
+from domain import PriceRecord
 from infrastructure.spot_price_function import SpotPriceFunction
 
 
 class TestScheduler:
     def test_get_available_start_times_half_hour_none_scheduled(self):
         # Arrange
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 1),
-            PricePoint(datetime(2021, 1, 1, 16), 1),
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 1),
         ]
         spot_price_function = SpotPriceFunction(price_points)
         scheduler = Scheduler(spot_price_function)
@@ -43,9 +44,9 @@ class TestScheduler:
 
     def test_get_available_start_times_full_hour_none_scheduled(self):
         # Arrange
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 1),
-            PricePoint(datetime(2021, 1, 1, 16), 1),
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 1),
         ]
         spot_price_function = SpotPriceFunction(price_points)
         scheduler = Scheduler(spot_price_function)
@@ -65,9 +66,9 @@ class TestScheduler:
 
     def test_get_available_start_times_one_and_a_half_hour_none_scheduled(self):
         # Arrange
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 1),
-            PricePoint(datetime(2021, 1, 1, 16), 1),
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 1),
         ]
         spot_price_function = SpotPriceFunction(price_points)
         scheduler = Scheduler(spot_price_function)
@@ -88,9 +89,9 @@ class TestScheduler:
 
     def test_get_available_start_times_half_hour_one_scheduled(self):
         # Arrange
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 1),
-            PricePoint(datetime(2021, 1, 1, 16), 1),
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 1),
         ]
         spot_price_function = SpotPriceFunction(price_points)
         scheduler = Scheduler(spot_price_function)
@@ -120,9 +121,9 @@ class TestScheduler:
 
     def test_get_available_start_times_one_full_hour_one_scheduled(self):
         # Arrange
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 1),
-            PricePoint(datetime(2021, 1, 1, 16), 1),
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 1),
         ]
         spot_price_function = SpotPriceFunction(price_points)
         scheduler = Scheduler(spot_price_function)
@@ -148,9 +149,9 @@ class TestScheduler:
 
     def test_get_available_start_times_one_and_a_half_hour_one_scheduled(self):
         # Arrange
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 1),
-            PricePoint(datetime(2021, 1, 1, 16), 1),
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 1),
         ]
         spot_price_function = SpotPriceFunction(price_points)
         scheduler = Scheduler(spot_price_function)
@@ -175,9 +176,9 @@ class TestScheduler:
     
     def test_get_available_start_times_variable_power_consumption(self):
         # Arrange
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 1),
-            PricePoint(datetime(2021, 1, 1, 16), 1),
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 1),
         ]
         spot_price_function = SpotPriceFunction(price_points)
         scheduler = Scheduler(spot_price_function)
@@ -202,9 +203,9 @@ class TestScheduler:
     
     def test_get_available_start_times_variable_power_consumption_with_start_constraint(self):
         # Arrange
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 1),
-            PricePoint(datetime(2021, 1, 1, 16), 1),
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 1),
         ]
         spot_price_function = SpotPriceFunction(price_points)
         scheduler = Scheduler(spot_price_function)
@@ -238,9 +239,9 @@ class TestScheduler:
     
     def test_get_available_start_times_variable_power_consumption_with_start_and_end_constraint(self):
         # Arrange
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 1),
-            PricePoint(datetime(2021, 1, 1, 16), 1),
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 1),
         ]
         spot_price_function = SpotPriceFunction(price_points)
         scheduler = Scheduler(spot_price_function)
@@ -271,9 +272,9 @@ class TestScheduler:
     
     def test_get_available_start_times_variable_power_consumption_with_start_constraint_offsetted(self):
         # Arrange
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 1),
-            PricePoint(datetime(2021, 1, 1, 16), 1),
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 1),
         ]
         spot_price_function = SpotPriceFunction(price_points)
         scheduler = Scheduler(spot_price_function)
@@ -302,9 +303,9 @@ class TestScheduler:
 
     def test_schedule_task_for_one_full_hour_none_scheduled(self):
         # Arrange
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 1),
-            PricePoint(datetime(2021, 1, 1, 16), 4),
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 4),
         ]
         spot_price_function = SpotPriceFunction(price_points)
         scheduler = Scheduler(spot_price_function)
@@ -348,11 +349,11 @@ class TestScheduler:
         validator = MaximumPowerConsumptionValidator(1)
         schedule = Schedule([scheduled_task_1], validator)
 
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 1),
-            PricePoint(datetime(2021, 1, 1, 16), 1),
-            PricePoint(datetime(2021, 1, 1, 17), 1),
-            PricePoint(datetime(2021, 1, 1, 18), 1),
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 1),
+            PriceRecord(datetime(2021, 1, 1, 17), 1),
+            PriceRecord(datetime(2021, 1, 1, 18), 1),
         ]
         scheduler = Scheduler(
             SpotPriceFunction(price_points)
@@ -372,8 +373,8 @@ class TestScheduler:
 
     def test_len_schedules_from_scheduler(self):
         # Arrange
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 1)
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1)
         ]
         spot_price_function = SpotPriceFunction(price_points)
         scheduler = Scheduler(
@@ -393,4 +394,167 @@ class TestScheduler:
         schedules = scheduler.schedule_tasks([task_1, task_2, task_3])
 
         # Assert
-        assert len(schedules) == 6
\ No newline at end of file
+        # The tasks are interchangeable, so only one of their six orders is scheduled.
+        assert len(schedules) == 1
+
+    def test_generate_task_orders_keeps_interchangeable_tasks_in_order(self):
+        # Arrange
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1)
+        ]
+        scheduler = Scheduler(
+            SpotPriceFunction(price_points)
+        )
+
+        task_1 = Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=60), 1), id="1")
+        task_2 = Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=30), 1), id="2")
+        task_3 = Task(PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=60), 1), id="3")
+
+        # Act
+        orders = [
+            [task.id for task in order] for order in scheduler.generate_task_orders([task_1, task_2, task_3])
+        ]
+
+        # Assert
+        assert orders == [["1", "2", "3"], ["1", "3", "2"], ["2", "1", "3"]]
+
+    def test_generate_schedules_is_lazy_and_same_as_schedule_tasks(self):
+        # Arrange
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 2),
+        ]
+        scheduler = Scheduler(
+            SpotPriceFunction(price_points)
+        )
+
+        power_function_1 = PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=30), 1)
+        task_1 = Task(power_function_1, id="1")
+
+        power_function_2 = PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=60), 1)
+        task_2 = Task(power_function_2, id="2")
+
+        # Act
+        generator = scheduler.generate_schedules([task_1, task_2])
+        first = next(generator)
+        generated = [first] + list(generator)
+        schedules = scheduler.schedule_tasks([task_1, task_2])
+
+        # Assert
+        assert len(first.tasks) == 2
+        assert len(generated) == len(schedules)
+        for (generated_schedule, schedule) in zip(generated, schedules):
+            assert [
+                (scheduled_task.task.id, scheduled_task.start_interval.start) for scheduled_task in generated_schedule.tasks
+            ] == [
+                (scheduled_task.task.id, scheduled_task.start_interval.start) for scheduled_task in schedule.tasks
+            ]
+
+    def test_generate_schedules_stops_when_candidate_budget_is_exhausted(self):
+        # Arrange
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 2),
+        ]
+        power_function_1 = PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=30), 1)
+        task_1 = Task(power_function_1, id="1")
+
+        power_function_2 = PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=60), 1)
+        task_2 = Task(power_function_2, id="2")
+
+        unlimited_scheduler = Scheduler(SpotPriceFunction(price_points))
+        scheduler = Scheduler(SpotPriceFunction(price_points), SearchBudget(maximum_candidates=5))
+
+        # Act
+        all_schedules = unlimited_scheduler.schedule_tasks([task_1, task_2])
+        schedules = scheduler.schedule_tasks([task_1, task_2])
+
+        # Assert
+        assert unlimited_scheduler.is_optimal()
+        assert unlimited_scheduler.statistics.schedules == len(all_schedules)
+        assert 0 < len(schedules) < len(all_schedules)
+        assert scheduler.statistics.budget_exhausted
+        assert scheduler.statistics.candidates >= 5
+        assert not scheduler.is_optimal()
+
+    def test_get_all_possible_start_times_is_sorted_and_unique(self):
+        # Arrange
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 2),
+            PriceRecord(datetime(2021, 1, 1, 17), 1),
+        ]
+        scheduler = Scheduler(SpotPriceFunction(price_points))
+        task = Task(PowerUsageFunction([
+            (timedelta(), 1), (timedelta(minutes=20), 2)
+        ], timedelta(minutes=40)))
+        schedule = Schedule([
+            ScheduledTask(DatetimeInterval(datetime(2021, 1, 1, 16, 10), timedelta()), task, 0)
+        ])
+
+        # Act
+        start_points = scheduler.get_all_possible_start_times(task, schedule)
+        price_seeds = scheduler.get_price_seeds()
+
+        # Assert
+        assert start_points == sorted(set(start_points))
+        assert datetime(2021, 1, 1, 15, 50) in start_points
+        assert datetime(2021, 1, 1, 16, 10) in start_points
+        assert scheduler.get_all_possible_start_times(task, schedule) == start_points
+        assert scheduler.get_price_seeds() is price_seeds
+
+    def test_generate_schedules_memoises_costs_across_branches(self):
+        # Arrange
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 2),
+            PriceRecord(datetime(2021, 1, 1, 17), 3),
+        ]
+        spot_price_function = SpotPriceFunction(price_points)
+        scheduler = Scheduler(spot_price_function)
+
+        power_function_1 = PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=30), 1)
+        task_1 = Task(power_function_1, id="1")
+
+        power_function_2 = PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=60), 1)
+        task_2 = Task(power_function_2, id="2")
+
+        # Act
+        schedules = scheduler.schedule_tasks([task_1, task_2], Schedule([], MaximumPowerConsumptionValidator(1)))
+
+        # Assert
+        assert scheduler.task_start_memo.hits > 0
+        assert len(scheduler.task_start_memo.costs) == scheduler.task_start_memo.misses
+        for schedule in schedules:
+            (first, second) = schedule.tasks
+            assert first.start_interval.start + first.task.duration <= second.start_interval.start or \
+                second.start_interval.start + second.task.duration <= first.start_interval.start
+            for scheduled_task in schedule.tasks:
+                assert abs(scheduled_task.cost - scheduled_task.get_max_total_price(spot_price_function)) < 1e-9
+
+    def test_get_all_possible_start_times_snaps_to_resolution(self):
+        # Arrange
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 2),
+        ]
+        scheduler = Scheduler(SpotPriceFunction(price_points), resolution=timedelta(minutes=15))
+        power_usage_function = PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=37), 1)
+        task = Task(power_usage_function)
+        # The task cannot start before 15:05, so 15:23 is snapped up instead of down.
+        constrained_task = Task(
+            power_usage_function,
+            MustStartBetweenValidator(DatetimeInterval(datetime(2021, 1, 1, 15, 5), timedelta(minutes=40)))
+        )
+
+        # Act
+        start_times = scheduler.get_all_possible_start_times(task)
+        constrained_start_times = scheduler.get_all_possible_start_times(constrained_task)
+
+        # Assert
+        assert start_times == [
+            datetime(2021, 1, 1, 15), datetime(2021, 1, 1, 15, 15), datetime(2021, 1, 1, 16), datetime(2021, 1, 1, 16, 15)
+        ]
+        assert len(constrained_start_times) > 0
+        assert all(constrained_task.is_scheduleable_at(start_time) for start_time in constrained_start_times)
+        assert all(start_time.minute % 15 == 0 for start_time in constrained_start_times)
@@ -1,16 +1,23 @@
 import time
 
 from datetime import datetime, timedelta
-from typing import List
+from typing import Any, Callable, Dict, List, Tuple
 
+from infrastructure.beam_search_scheduler import BeamSearchScheduler
+from infrastructure.branch_and_bound_scheduler import BranchAndBoundScheduler
+from infrastructure.coarse_to_fine_scheduler import CoarseToFineScheduler
+from infrastructure.cost_curve_cache import CostCurveCache
+from infrastructure.maximum_power_consumption_validator import MaximumPowerConsumptionValidator
 from infrastructure.must_end_between_validator import MustEndBetweenValidator
 from infrastructure.must_start_between_validator import MustStartBetweenValidator
 from infrastructure.datetime_interval import DatetimeInterval
 from infrastructure.schedule import Schedule
 from infrastructure.schedule_task import ScheduledTask
+from infrastructure.scheduler import Scheduler
 from infrastructure.task import Task
 from infrastructure.power_usage_function import PowerUsageFunction
-from domain import PricePoint
+from infrastructure.power_usage_function_factory import PowerUsageFunctionFactory
+from domain import PriceRecord
 from infrastructure.spot_price_function import SpotPriceFunction
 
 def test_benchmark_1(benchmark):
@@ -18,4 +25,123 @@ def test_benchmark_1(benchmark):
     # Arrange
     # Act
     # Assert
-    pass
\ No newline at end of file
+    pass
+
+def create_benchmark_price_function() -> SpotPriceFunction:
+    prices = [1.2, 0.9, 0.7, 0.6, 1.4, 2.1, 1.5, 1.1]
+    return SpotPriceFunction([
+        PriceRecord(datetime(2023, 4, 21) + timedelta(hours=hour), price)
+        for (hour, price) in enumerate(prices)
+    ])
+
+def create_benchmark_tasks() -> List[Task]:
+    factory = PowerUsageFunctionFactory()
+    return [
+        Task(factory.create_constant_consumption(timedelta(minutes=120), 1.5), id="washer"),
+        Task(factory.create_constant_consumption(timedelta(minutes=90), 1.0), id="dryer"),
+        Task(factory.create_constant_consumption(timedelta(minutes=60), 1.2), id="dishwasher"),
+        Task(factory.create_constant_consumption(timedelta(minutes=45), 0.8), id="tv"),
+    ]
+
+def total_cost(schedule: Schedule) -> float:
+    return sum(scheduled_task.cost for scheduled_task in schedule.tasks)
+
+def with_fresh_cost_curves(scheduler: Scheduler, *args: Any) -> Callable[[], Tuple[Tuple[Any, ...], Dict[str, Any]]]:
+    """Creates the setup of a benchmark round which gives the scheduler an empty cache, such that every round calculates its costs."""
+    def setup() -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+        scheduler.cost_curves = CostCurveCache()
+        return (args, {})
+    return setup
+
+def test_benchmark_beam_search_quality_gap(benchmark):
+    # Arrange
+    price_function = create_benchmark_price_function()
+    tasks = create_benchmark_tasks()
+    exact = BranchAndBoundScheduler(price_function).schedule_tasks(
+        tasks, Schedule([], MaximumPowerConsumptionValidator(2))
+    )
+    scheduler = BeamSearchScheduler(price_function)
+
+    # Act
+    schedules = benchmark.pedantic(
+        scheduler.schedule_tasks,
+        setup=with_fresh_cost_curves(scheduler, tasks, Schedule([], MaximumPowerConsumptionValidator(2))),
+        rounds=3
+    )
+
+    # Assert
+    quality_gap = (total_cost(schedules[0]) - total_cost(exact[0])) / total_cost(exact[0])
+    benchmark.extra_info["beam_width"] = scheduler.width
+    benchmark.extra_info["quality_gap"] = quality_gap
+    assert len(schedules[0].tasks) == len(tasks)
+    assert quality_gap >= -1e-9
+
+def create_quarterly_benchmark_price_function() -> SpotPriceFunction:
+    # Prices every 15 minutes, such that there are many more start times than hours.
+    prices = [1.2, 1.3, 1.1, 0.9, 0.9, 0.8, 0.7, 0.7, 0.6, 0.7, 0.6, 0.8, 1.4, 1.6, 1.5, 1.9,
+              2.1, 2.0, 1.8, 1.5, 1.5, 1.4, 1.2, 1.1, 1.1, 1.0, 0.9, 1.2, 1.3, 1.4, 1.2, 1.1]
+    return SpotPriceFunction([
+        PriceRecord(datetime(2023, 4, 21) + timedelta(minutes=15 * quarter), price)
+        for (quarter, price) in enumerate(prices)
+    ])
+
+def test_benchmark_coarse_to_fine_tolerance(benchmark):
+    # Arrange
+    price_function = create_quarterly_benchmark_price_function()
+    tasks = create_benchmark_tasks()[:3]
+    full = BranchAndBoundScheduler(price_function)
+    exact = full.schedule_tasks(tasks, Schedule([], MaximumPowerConsumptionValidator(2)))
+    scheduler = CoarseToFineScheduler(price_function)
+
+    # Act
+    schedules = benchmark.pedantic(
+        scheduler.schedule_tasks,
+        setup=with_fresh_cost_curves(scheduler, tasks, Schedule([], MaximumPowerConsumptionValidator(2))),
+        rounds=3
+    )
+
+    # Assert
+    gap = total_cost(schedules[0]) - total_cost(exact[0])
+    benchmark.extra_info["gap"] = gap
+    benchmark.extra_info["tolerance"] = scheduler.tolerance
+    benchmark.extra_info["candidates"] = scheduler.statistics.candidates
+    benchmark.extra_info["full_candidates"] = full.statistics.candidates
+    assert len(schedules[0].tasks) == len(tasks)
+    assert scheduler.tolerance is not None
+    assert gap >= -1e-9 and gap <= scheduler.tolerance + 1e-9
+
+def test_benchmark_start_time_resolution_candidates(benchmark):
+    # Arrange
+    prices = [1.2, 0.9, 0.7, 0.6, 1.4, 2.1, 1.5, 1.1, 0.8, 0.9, 1.3, 1.7]
+    price_function = SpotPriceFunction([
+        PriceRecord(datetime(2023, 4, 21) + timedelta(hours=hour), price)
+        for (hour, price) in enumerate(prices)
+    ])
+    # Durations of requests are arbitrary seconds, such that the start times relative to each other are as well.
+    factory = PowerUsageFunctionFactory()
+    tasks = [
+        Task(factory.create_constant_consumption(timedelta(seconds=13680), 1.0), id="1"),
+        Task(factory.create_constant_consumption(timedelta(seconds=11280), 1.0), id="2"),
+    ]
+
+    candidates = {}
+    lowest_costs = {}
+    for minutes in [None, 1, 5, 15]:
+        scheduler = Scheduler(price_function, resolution=None if minutes is None else timedelta(minutes=minutes))
+        schedules = scheduler.schedule_tasks(tasks, Schedule([], MaximumPowerConsumptionValidator(1)))
+        candidates[str(minutes)] = scheduler.statistics.candidates
+        lowest_costs[str(minutes)] = min(total_cost(schedule) for schedule in schedules)
+    scheduler = Scheduler(price_function, resolution=timedelta(minutes=15))
+
+    # Act
+    benchmark.pedantic(
+        scheduler.schedule_tasks,
+        setup=with_fresh_cost_curves(scheduler, tasks, Schedule([], MaximumPowerConsumptionValidator(1))),
+        rounds=3
+    )
+
+    # Assert
+    benchmark.extra_info["candidates"] = candidates
+    benchmark.extra_info["lowest_costs"] = lowest_costs
+    assert candidates["15"] < candidates["None"]
+    assert candidates["15"] <= candidates["5"] <= candidates["1"] <= candidates["None"]
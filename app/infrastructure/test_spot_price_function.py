@@ -1,22 +1,24 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
 from random import random
 from typing import List
-from domain import PricePoint
+from domain import PriceRecord
 from infrastructure.spot_price_function import SpotPriceFunction
+from infrastructure.time_series import TimeSeries, TimeSeriesPoints
 
 
 class TestSpotPriceFunction:
     def test_apply_correctly_evaluates_and_returns_price(self):
         # Arrange
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 1),
-            PricePoint(datetime(2021, 1, 1, 16), 2),
-            PricePoint(datetime(2021, 1, 1, 17), 3),
-            PricePoint(datetime(2021, 1, 1, 18), 4),
-            PricePoint(datetime(2021, 1, 1, 19), 5),
-            PricePoint(datetime(2021, 1, 1, 20), 6),
-            PricePoint(datetime(2021, 1, 1, 21), 7),
-            PricePoint(datetime(2021, 1, 1, 22), 8)
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 2),
+            PriceRecord(datetime(2021, 1, 1, 17), 3),
+            PriceRecord(datetime(2021, 1, 1, 18), 4),
+            PriceRecord(datetime(2021, 1, 1, 19), 5),
+            PriceRecord(datetime(2021, 1, 1, 20), 6),
+            PriceRecord(datetime(2021, 1, 1, 21), 7),
+            PriceRecord(datetime(2021, 1, 1, 22), 8)
         ]
         spot_price_function = SpotPriceFunction(price_points)
 
@@ -29,15 +31,15 @@ class TestSpotPriceFunction:
 
     def test_integrate_over_the_same_price_point(self):
         # Setup
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 1),
-            PricePoint(datetime(2021, 1, 1, 16), 2),
-            PricePoint(datetime(2021, 1, 1, 17), 3),
-            PricePoint(datetime(2021, 1, 1, 18), 4),
-            PricePoint(datetime(2021, 1, 1, 19), 5),
-            PricePoint(datetime(2021, 1, 1, 20), 6),
-            PricePoint(datetime(2021, 1, 1, 21), 7),
-            PricePoint(datetime(2021, 1, 1, 22), 8)
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 2),
+            PriceRecord(datetime(2021, 1, 1, 17), 3),
+            PriceRecord(datetime(2021, 1, 1, 18), 4),
+            PriceRecord(datetime(2021, 1, 1, 19), 5),
+            PriceRecord(datetime(2021, 1, 1, 20), 6),
+            PriceRecord(datetime(2021, 1, 1, 21), 7),
+            PriceRecord(datetime(2021, 1, 1, 22), 8)
         ]
         spot_price_function = SpotPriceFunction(price_points)
 
@@ -57,15 +59,15 @@ class TestSpotPriceFunction:
 
     def test_integrate_over_nearly_the_same_price_point(self):
         # Setup
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 1),
-            PricePoint(datetime(2021, 1, 1, 16), 2),
-            PricePoint(datetime(2021, 1, 1, 17), 3),
-            PricePoint(datetime(2021, 1, 1, 18), 4),
-            PricePoint(datetime(2021, 1, 1, 19), 5),
-            PricePoint(datetime(2021, 1, 1, 20), 6),
-            PricePoint(datetime(2021, 1, 1, 21), 7),
-            PricePoint(datetime(2021, 1, 1, 22), 8)
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 2),
+            PriceRecord(datetime(2021, 1, 1, 17), 3),
+            PriceRecord(datetime(2021, 1, 1, 18), 4),
+            PriceRecord(datetime(2021, 1, 1, 19), 5),
+            PriceRecord(datetime(2021, 1, 1, 20), 6),
+            PriceRecord(datetime(2021, 1, 1, 21), 7),
+            PriceRecord(datetime(2021, 1, 1, 22), 8)
         ]
         spot_price_function = SpotPriceFunction(price_points)
 
@@ -83,15 +85,15 @@ class TestSpotPriceFunction:
 
     def test_integrate_over_multiple_hours(self):
         # Arrange
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 1),
-            PricePoint(datetime(2021, 1, 1, 16), 2),
-            PricePoint(datetime(2021, 1, 1, 17), 3),
-            PricePoint(datetime(2021, 1, 1, 18), 4),
-            PricePoint(datetime(2021, 1, 1, 19), 5),
-            PricePoint(datetime(2021, 1, 1, 20), 6),
-            PricePoint(datetime(2021, 1, 1, 21), 7),
-            PricePoint(datetime(2021, 1, 1, 22), 8)
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 2),
+            PriceRecord(datetime(2021, 1, 1, 17), 3),
+            PriceRecord(datetime(2021, 1, 1, 18), 4),
+            PriceRecord(datetime(2021, 1, 1, 19), 5),
+            PriceRecord(datetime(2021, 1, 1, 20), 6),
+            PriceRecord(datetime(2021, 1, 1, 21), 7),
+            PriceRecord(datetime(2021, 1, 1, 22), 8)
         ]
         spot_price_function = SpotPriceFunction(price_points)
 
@@ -106,8 +108,8 @@ class TestSpotPriceFunction:
 
     def test_integrate_from_0_hour_to_1(self):
         # Arrange
-        power_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 1),
+        power_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
         ]
         spot_price_function = SpotPriceFunction(power_points)
 
@@ -122,15 +124,15 @@ class TestSpotPriceFunction:
 
     def test_sum_single_price_point(self):
         # Arrange
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 1),
-            PricePoint(datetime(2021, 1, 1, 16), 2),
-            PricePoint(datetime(2021, 1, 1, 17), 3),
-            PricePoint(datetime(2021, 1, 1, 18), 4),
-            PricePoint(datetime(2021, 1, 1, 19), 5),
-            PricePoint(datetime(2021, 1, 1, 20), 6),
-            PricePoint(datetime(2021, 1, 1, 21), 7),
-            PricePoint(datetime(2021, 1, 1, 22), 8)
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 2),
+            PriceRecord(datetime(2021, 1, 1, 17), 3),
+            PriceRecord(datetime(2021, 1, 1, 18), 4),
+            PriceRecord(datetime(2021, 1, 1, 19), 5),
+            PriceRecord(datetime(2021, 1, 1, 20), 6),
+            PriceRecord(datetime(2021, 1, 1, 21), 7),
+            PriceRecord(datetime(2021, 1, 1, 22), 8)
         ]
         spot_price_function = SpotPriceFunction(price_points)
 
@@ -144,15 +146,15 @@ class TestSpotPriceFunction:
 
     def test_sum_between_two_price_points(self):
         # Arrange
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 1),
-            PricePoint(datetime(2021, 1, 1, 16), 2),
-            PricePoint(datetime(2021, 1, 1, 17), 3),
-            PricePoint(datetime(2021, 1, 1, 18), 4),
-            PricePoint(datetime(2021, 1, 1, 19), 5),
-            PricePoint(datetime(2021, 1, 1, 20), 6),
-            PricePoint(datetime(2021, 1, 1, 21), 7),
-            PricePoint(datetime(2021, 1, 1, 22), 8)
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 2),
+            PriceRecord(datetime(2021, 1, 1, 17), 3),
+            PriceRecord(datetime(2021, 1, 1, 18), 4),
+            PriceRecord(datetime(2021, 1, 1, 19), 5),
+            PriceRecord(datetime(2021, 1, 1, 20), 6),
+            PriceRecord(datetime(2021, 1, 1, 21), 7),
+            PriceRecord(datetime(2021, 1, 1, 22), 8)
         ]
         spot_price_function = SpotPriceFunction(price_points)
 
@@ -167,15 +169,15 @@ class TestSpotPriceFunction:
 
     def test_sum_two_price_points(self):
         # Arrange
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 1),
-            PricePoint(datetime(2021, 1, 1, 16), 2),
-            PricePoint(datetime(2021, 1, 1, 17), 3),
-            PricePoint(datetime(2021, 1, 1, 18), 4),
-            PricePoint(datetime(2021, 1, 1, 19), 5),
-            PricePoint(datetime(2021, 1, 1, 20), 6),
-            PricePoint(datetime(2021, 1, 1, 21), 7),
-            PricePoint(datetime(2021, 1, 1, 22), 8)
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 2),
+            PriceRecord(datetime(2021, 1, 1, 17), 3),
+            PriceRecord(datetime(2021, 1, 1, 18), 4),
+            PriceRecord(datetime(2021, 1, 1, 19), 5),
+            PriceRecord(datetime(2021, 1, 1, 20), 6),
+            PriceRecord(datetime(2021, 1, 1, 21), 7),
+            PriceRecord(datetime(2021, 1, 1, 22), 8)
         ]
         spot_price_function = SpotPriceFunction(price_points)
 
@@ -189,15 +191,15 @@ class TestSpotPriceFunction:
 
     def test_sum_over_all_price_points(self):
         # Arrange
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 1),
-            PricePoint(datetime(2021, 1, 1, 16), 2),
-            PricePoint(datetime(2021, 1, 1, 17), 3),
-            PricePoint(datetime(2021, 1, 1, 18), 4),
-            PricePoint(datetime(2021, 1, 1, 19), 5),
-            PricePoint(datetime(2021, 1, 1, 20), 6),
-            PricePoint(datetime(2021, 1, 1, 21), 7),
-            PricePoint(datetime(2021, 1, 1, 22), 8)
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 2),
+            PriceRecord(datetime(2021, 1, 1, 17), 3),
+            PriceRecord(datetime(2021, 1, 1, 18), 4),
+            PriceRecord(datetime(2021, 1, 1, 19), 5),
+            PriceRecord(datetime(2021, 1, 1, 20), 6),
+            PriceRecord(datetime(2021, 1, 1, 21), 7),
+            PriceRecord(datetime(2021, 1, 1, 22), 8)
         ]
         spot_price_function = SpotPriceFunction(price_points, extend_by=timedelta(hours=0))
 
@@ -211,15 +213,15 @@ class TestSpotPriceFunction:
 
     def test_sum_over_all_price_points_extended_one_hour(self):
         # Arrange
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 1),
-            PricePoint(datetime(2021, 1, 1, 16), 2),
-            PricePoint(datetime(2021, 1, 1, 17), 3),
-            PricePoint(datetime(2021, 1, 1, 18), 4),
-            PricePoint(datetime(2021, 1, 1, 19), 5),
-            PricePoint(datetime(2021, 1, 1, 20), 6),
-            PricePoint(datetime(2021, 1, 1, 21), 7),
-            PricePoint(datetime(2021, 1, 1, 22), 8)
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 2),
+            PriceRecord(datetime(2021, 1, 1, 17), 3),
+            PriceRecord(datetime(2021, 1, 1, 18), 4),
+            PriceRecord(datetime(2021, 1, 1, 19), 5),
+            PriceRecord(datetime(2021, 1, 1, 20), 6),
+            PriceRecord(datetime(2021, 1, 1, 21), 7),
+            PriceRecord(datetime(2021, 1, 1, 22), 8)
         ]
         spot_price_function = SpotPriceFunction(price_points, extend_by=timedelta(hours=1))
 
@@ -233,15 +235,15 @@ class TestSpotPriceFunction:
     
     def test_random_sum_over_price_points(self):
         # Arrange
-        price_points: List[PricePoint] = [
-            PricePoint(datetime(2021, 1, 1, 15), 1),
-            PricePoint(datetime(2021, 1, 1, 16), 1),
-            PricePoint(datetime(2021, 1, 1, 17), 1),
-            PricePoint(datetime(2021, 1, 1, 18), 1),
-            PricePoint(datetime(2021, 1, 1, 19), 1),
-            PricePoint(datetime(2021, 1, 1, 20), 1),
-            PricePoint(datetime(2021, 1, 1, 21), 1),
-            PricePoint(datetime(2021, 1, 1, 22), 1)
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 1),
+            PriceRecord(datetime(2021, 1, 1, 17), 1),
+            PriceRecord(datetime(2021, 1, 1, 18), 1),
+            PriceRecord(datetime(2021, 1, 1, 19), 1),
+            PriceRecord(datetime(2021, 1, 1, 20), 1),
+            PriceRecord(datetime(2021, 1, 1, 21), 1),
+            PriceRecord(datetime(2021, 1, 1, 22), 1)
         ]
         spot_price_function = SpotPriceFunction(price_points, extend_by=timedelta(hours=1))
 
@@ -254,4 +256,97 @@ class TestSpotPriceFunction:
             )
 
             # Assert
-            assert sum == expected
\ No newline at end of file
+            assert sum == expected
+
+    def test_discrete_point_at_evenly_spaced_price_points(self):
+        # Arrange
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 16), 2),
+            PriceRecord(datetime(2021, 1, 1, 17), 3),
+            PriceRecord(datetime(2021, 1, 1, 18), 4)
+        ]
+        spot_price_function = SpotPriceFunction(price_points)
+
+        for minutes in range(0, 4 * 60, 7):
+            # Act
+            point = spot_price_function.discrete_point_at(
+                datetime(2021, 1, 1, 15) + timedelta(minutes=minutes)
+            )
+
+            # Assert
+            assert point == price_points[minutes // 60]
+
+    def test_discrete_point_at_unevenly_spaced_price_points(self):
+        # Arrange
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 15, 30), 2),
+            PriceRecord(datetime(2021, 1, 1, 17), 3),
+            PriceRecord(datetime(2021, 1, 1, 18), 4)
+        ]
+        spot_price_function = SpotPriceFunction(price_points)
+
+        # Act
+        points = [
+            spot_price_function.discrete_point_at(datetime(2021, 1, 1, 15, 29)),
+            spot_price_function.discrete_point_at(datetime(2021, 1, 1, 15, 30)),
+            spot_price_function.discrete_point_at(datetime(2021, 1, 1, 16, 59)),
+            spot_price_function.discrete_point_at(datetime(2021, 1, 1, 17)),
+            spot_price_function.discrete_point_at(datetime(2021, 1, 1, 18, 30)),
+        ]
+        next_point = spot_price_function.next_discrete_point_from(
+            spot_price_function.min_domain, datetime(2021, 1, 1, 15, 45), spot_price_function.max_domain
+        )
+
+        # Assert
+        assert points == [price_points[0], price_points[1], price_points[1], price_points[2], price_points[3]]
+        assert next_point == price_points[2]
+
+    def test_integrate_partial_points_on_both_sides(self):
+        # Arrange
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15), 1),
+            PriceRecord(datetime(2021, 1, 1, 15, 30), 10),
+            PriceRecord(datetime(2021, 1, 1, 16, 30), 1),
+            PriceRecord(datetime(2021, 1, 1, 18), 4)
+        ]
+        spot_price_function = SpotPriceFunction(price_points)
+
+        # Act
+        integral = spot_price_function.integrate(
+            datetime(2021, 1, 1, 15, 15), datetime(2021, 1, 1, 17, 30)
+        )
+        extended_integral = spot_price_function.integrate(
+            datetime(2021, 1, 1, 17, 30), datetime(2021, 1, 1, 18, 30)
+        )
+
+        # Assert
+        assert abs(integral - (0.25 * 1 + 1 * 10 + 1 * 1)) < 1e-9
+        assert abs(extended_integral - (0.5 * 1 + 0.5 * 4)) < 1e-9
+
+    def test_from_series_matches_price_points(self):
+        # Arrange
+        price_points: List[PriceRecord] = [
+            PriceRecord(datetime(2021, 1, 1, 15, tzinfo=timezone.utc), 1),
+            PriceRecord(datetime(2021, 1, 1, 15, 30, tzinfo=timezone.utc), 10),
+            PriceRecord(datetime(2021, 1, 1, 16, 30, tzinfo=timezone.utc), 1),
+            PriceRecord(datetime(2021, 1, 1, 18, tzinfo=timezone.utc), 4)
+        ]
+        rows = [(price_point.time, Decimal(str(price_point.price))) for price_point in price_points]
+        spot_price_function = SpotPriceFunction(price_points)
+
+        # Act
+        series_function = SpotPriceFunction.from_series(TimeSeries.from_rows(rows))
+
+        # Assert
+        assert isinstance(series_function.set, TimeSeriesPoints)
+        assert isinstance(spot_price_function.set, TimeSeriesPoints)
+        assert series_function.min_domain == spot_price_function.min_domain
+        assert series_function.max_domain == spot_price_function.max_domain
+        assert list(series_function.set) == price_points
+        for minutes in range(0, 4 * 60, 10):
+            time = price_points[0].time + timedelta(minutes=minutes)
+            assert series_function.discrete_point_at(time) == spot_price_function.discrete_point_at(time)
+            assert series_function.integrate(price_points[0].time, time) == \
+                spot_price_function.integrate(price_points[0].time, time)
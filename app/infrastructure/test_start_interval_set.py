@@ -0,0 +1,68 @@
+from datetime import datetime
+
+from infrastructure.start_interval_set import StartIntervalSet
+
+
+class TestStartIntervalSet:
+    def test_normalize_merges_overlapping_and_removes_empty_intervals(self):
+        # Arrange
+        intervals = [
+            (datetime(2021, 1, 1, 16), datetime(2021, 1, 1, 18)),
+            (datetime(2021, 1, 1, 12), datetime(2021, 1, 1, 13)),
+            (datetime(2021, 1, 1, 13), datetime(2021, 1, 1, 14)),
+            (datetime(2021, 1, 1, 17), datetime(2021, 1, 1, 17, 30)),
+            (datetime(2021, 1, 1, 20), datetime(2021, 1, 1, 19)),
+        ]
+
+        # Act
+        start_intervals = StartIntervalSet(intervals)
+
+        # Assert
+        assert start_intervals.intervals == [
+            (datetime(2021, 1, 1, 12), datetime(2021, 1, 1, 14)),
+            (datetime(2021, 1, 1, 16), datetime(2021, 1, 1, 18)),
+        ]
+
+    def test_union_and_intersection(self):
+        # Arrange
+        lhs = StartIntervalSet([
+            (datetime(2021, 1, 1, 12), datetime(2021, 1, 1, 14)),
+            (datetime(2021, 1, 1, 16), datetime(2021, 1, 1, 18)),
+        ])
+        rhs = StartIntervalSet([
+            (datetime(2021, 1, 1, 13), datetime(2021, 1, 1, 17)),
+        ])
+
+        # Act
+        union = lhs.union(rhs)
+        intersection = lhs.intersection(rhs)
+
+        # Assert
+        assert union.intervals == [(datetime(2021, 1, 1, 12), datetime(2021, 1, 1, 18))]
+        assert intersection.intervals == [
+            (datetime(2021, 1, 1, 13), datetime(2021, 1, 1, 14)),
+            (datetime(2021, 1, 1, 16), datetime(2021, 1, 1, 17)),
+        ]
+        assert lhs.intersection(StartIntervalSet.everything()) is lhs
+        assert lhs.union(StartIntervalSet.everything()).universal
+
+    def test_contains_and_filter_are_inclusive(self):
+        # Arrange
+        start_intervals = StartIntervalSet([
+            (datetime(2021, 1, 1, 12), datetime(2021, 1, 1, 14)),
+            (datetime(2021, 1, 1, 16), datetime(2021, 1, 1, 16)),
+        ])
+        times = [
+            datetime(2021, 1, 1, 11), datetime(2021, 1, 1, 12), datetime(2021, 1, 1, 14),
+            datetime(2021, 1, 1, 15), datetime(2021, 1, 1, 16), datetime(2021, 1, 1, 17),
+        ]
+
+        # Act
+        contained = [time for time in times if start_intervals.contains(time)]
+        filtered = start_intervals.filter(times)
+
+        # Assert
+        assert contained == [datetime(2021, 1, 1, 12), datetime(2021, 1, 1, 14), datetime(2021, 1, 1, 16)]
+        assert filtered == contained
+        assert StartIntervalSet().filter(times) == []
+        assert StartIntervalSet.everything().filter(times) == times
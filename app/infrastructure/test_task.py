@@ -1,6 +1,8 @@
 from datetime import datetime, timedelta
 
 from infrastructure.task_validator_conjunction import TaskValidatorConjunction
+from infrastructure.task_validator_disjunction import TaskValidatorDisjunction
+from infrastructure.must_end_between_validator import MustEndBetweenValidator
 from infrastructure.datetime_interval import DatetimeInterval
 from infrastructure.must_start_between_validator import MustStartBetweenValidator
 from infrastructure.power_usage_function import PowerUsageFunction
@@ -130,4 +132,32 @@ class TestTask():
         scheduleable = task.is_scheduleable_at(start_time)
 
         # Assert
-        assert scheduleable is True
\ No newline at end of file
+        assert scheduleable is True
+
+    def test_start_intervals_compiles_validator_tree(self):
+        # Arrange
+        power_function = PowerUsageFunction([
+            (timedelta(), 1.2),
+        ], timedelta(hours=1))
+        task = Task(
+            power_function,
+            TaskValidatorConjunction([
+                TaskValidatorDisjunction([
+                    MustStartBetweenValidator(DatetimeInterval(datetime(2021, 1, 1, 12), timedelta(hours=2))),
+                    MustStartBetweenValidator(DatetimeInterval(datetime(2021, 1, 1, 16), timedelta(hours=2))),
+                ]),
+                MustEndBetweenValidator(DatetimeInterval(datetime(2021, 1, 1, 14), timedelta(hours=4))),
+            ])
+        )
+
+        # Act
+        start_intervals = task.start_intervals()
+
+        # Assert
+        assert start_intervals is not None
+        assert start_intervals.intervals == [
+            (datetime(2021, 1, 1, 13), datetime(2021, 1, 1, 14)),
+            (datetime(2021, 1, 1, 16), datetime(2021, 1, 1, 17)),
+        ]
+        assert task.is_scheduleable_at(datetime(2021, 1, 1, 13, 30))
+        assert not task.is_scheduleable_at(datetime(2021, 1, 1, 15))
@@ -0,0 +1,72 @@
+from datetime import datetime, timedelta
+
+from infrastructure.datetime_interval import DatetimeInterval
+from infrastructure.must_end_between_validator import MustEndBetweenValidator
+from infrastructure.must_start_between_validator import MustStartBetweenValidator
+from infrastructure.power_usage_function import PowerUsageFunction
+from infrastructure.power_usage_function_factory import PowerUsageFunctionFactory
+from infrastructure.task import Task
+from infrastructure.task_fingerprinter import TaskFingerprinter
+from infrastructure.task_validator_conjunction import TaskValidatorConjunction
+from infrastructure.task_validator_disjunction import TaskValidatorDisjunction
+
+
+class TestTaskFingerprinter:
+    def create_task(self, id: str, minutes: int = 60, start_hour: int = 15) -> Task:
+        return Task(
+            PowerUsageFunctionFactory().create_constant_consumption(timedelta(minutes=minutes), 1),
+            TaskValidatorConjunction([
+                TaskValidatorDisjunction([
+                    MustStartBetweenValidator(DatetimeInterval(datetime(2021, 1, 1, start_hour), timedelta(hours=2)))
+                ]),
+                TaskValidatorDisjunction([
+                    MustEndBetweenValidator(DatetimeInterval(datetime(2021, 1, 1, 20), timedelta(hours=1)))
+                ]),
+            ]),
+            id
+        )
+
+    def test_interchangeable_tasks_have_equal_fingerprints(self):
+        # Arrange
+        fingerprinter = TaskFingerprinter()
+
+        # Act
+        fingerprint_1 = fingerprinter.fingerprint(self.create_task("1"))
+        fingerprint_2 = fingerprinter.fingerprint(self.create_task("2"))
+
+        # Assert
+        assert fingerprint_1 == fingerprint_2
+
+    def test_different_tasks_have_different_fingerprints(self):
+        # Arrange
+        fingerprinter = TaskFingerprinter()
+        task = self.create_task("1")
+        other_power = Task(PowerUsageFunction([
+            (timedelta(), 2), (timedelta(minutes=30), 1)
+        ], timedelta(minutes=30)), task.validator, "2")
+
+        # Act
+        fingerprint = fingerprinter.fingerprint(task)
+
+        # Assert
+        assert fingerprint != fingerprinter.fingerprint(self.create_task("2", minutes=30))
+        assert fingerprint != fingerprinter.fingerprint(self.create_task("2", start_hour=16))
+        assert fingerprint != fingerprinter.fingerprint(other_power)
+        assert fingerprint != fingerprinter.fingerprint(Task(task.power_usage_function, id="2"))
+
+    def test_task_classes(self):
+        # Arrange
+        fingerprinter = TaskFingerprinter()
+        tasks = [
+            self.create_task("1"),
+            self.create_task("2", minutes=30),
+            self.create_task("3"),
+            self.create_task("4", minutes=30),
+            self.create_task("5", start_hour=16),
+        ]
+
+        # Act
+        classes = fingerprinter.task_classes(tasks)
+
+        # Assert
+        assert classes == [0, 1, 0, 1, 4]
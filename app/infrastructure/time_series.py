@@ -0,0 +1,93 @@
+from __future__ import annotations
+from datetime import datetime, timedelta, timezone, tzinfo
+from typing import Any, Callable, Iterable, List, Optional, Sequence, Tuple, TypeVar, overload
+
+import numpy as np
+
+TPoint = TypeVar("TPoint")
+
+EPOCH = datetime(1970, 1, 1)
+EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+SECOND = timedelta(seconds=1)
+
+def to_epoch(time: datetime) -> float:
+    """Converts a datetime to seconds since the epoch.
+    Naive datetimes are treated as being in the same (unknown) timezone as the epoch so they round trip exactly.
+    """
+    if time.tzinfo is None:
+        return (time - EPOCH) / SECOND
+    return (time - EPOCH_UTC) / SECOND
+
+def from_epoch(seconds: float, tz: Optional[tzinfo] = None) -> datetime:
+    if tz is None:
+        return EPOCH + timedelta(seconds=float(seconds))
+    return (EPOCH_UTC + timedelta(seconds=float(seconds))).astimezone(tz)
+
+class TimeSeries:
+    """Parallel arrays of epoch seconds and values, in the order they were queried."""
+
+    def __init__(self, times: np.ndarray, values: np.ndarray, tz: Optional[tzinfo] = None) -> None:
+        if not len(times) == len(values):
+            raise ValueError("The times and values must have the same length")
+
+        # Keep integer seconds whenever possible such that comparisons are integer operations.
+        if np.all(np.mod(times, 1) == 0):
+            times = times.astype(np.int64)
+
+        self.times = times
+        self.values = values.astype(np.float64)
+        self.tz = tz
+
+    @staticmethod
+    def from_pairs(pairs: Iterable[Tuple[datetime, Any]]) -> TimeSeries:
+        tz: Optional[tzinfo] = None
+        times: List[float] = []
+        values: List[float] = []
+        for (time, value) in pairs:
+            if len(times) == 0: tz = time.tzinfo
+            times.append(to_epoch(time))
+            values.append(float(value))
+
+        return TimeSeries(
+            np.array(times, dtype=np.float64), np.array(values, dtype=np.float64), tz
+        )
+
+    @staticmethod
+    def from_rows(rows: Sequence[Tuple[Any, ...]]) -> TimeSeries:
+        """Creates a series from database rows of (time, value, ...) without creating a point for each row."""
+        return TimeSeries.from_pairs((row[0], row[1]) for row in rows)
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def time_at(self, index: int) -> datetime:
+        return from_epoch(self.times[index], self.tz)
+
+    def value_at(self, index: int) -> float:
+        return float(self.values[index])
+
+class TimeSeriesPoints(Sequence[TPoint]):
+    """A read-only view of a time series which creates the discrete points when they are accessed."""
+
+    def __init__(self, series: TimeSeries, create_point: Callable[[datetime, float], TPoint]) -> None:
+        self.series = series
+        self.create_point = create_point
+
+    def __len__(self) -> int:
+        return len(self.series)
+
+    @overload
+    def __getitem__(self, index: int) -> TPoint: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[TPoint]: ...
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        if index < 0: index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("Time series index out of range")
+
+        return self.create_point(self.series.time_at(index), self.series.value_at(index))
@@ -0,0 +1,218 @@
+from __future__ import annotations
+from abc import abstractmethod
+from datetime import datetime, timedelta
+from typing import Any, Generic, Optional, Sequence, Tuple, TypeVar
+
+import numpy as np
+
+from infrastructure.discrete_function import DiscreteFunction
+from infrastructure.time_series import TimeSeries, TimeSeriesPoints, from_epoch, to_epoch
+
+TPoint = TypeVar("TPoint")
+
+class TimeSeriesFunction(
+    DiscreteFunction[datetime, float, float, TPoint],
+    Generic[TPoint],
+):
+    """A step function over datetimes where each point's value holds until the next point.
+    The last point's value holds for "extend_by" after the last point.
+
+    The points are only stored as parallel arrays of epoch seconds and values,
+    "set" is a view for the discrete function API which creates the points when they are accessed.
+    """
+    extend_by: timedelta
+    series: TimeSeries
+
+    @abstractmethod
+    def create_point(self, time: datetime, value: float) -> TPoint:
+        pass
+
+    def index_discrete_points(self) -> None:
+        if isinstance(self.set, TimeSeriesPoints):
+            self.series = self.set.series
+        else:
+            self.series = TimeSeries.from_pairs(
+                (self.get_domain(point), self.get_codomain(point)) for point in self.set
+            )
+        # Only the arrays are kept, the points are created again when they are accessed.
+        self.set = TimeSeriesPoints(self.series, self.create_point)
+
+        # If the points are evenly spaced (e.g. hourly prices) we can use index arithmetic instead of bisection.
+        self._epoch_step: Optional[float] = None
+        steps = np.diff(self.series.times)
+        if len(steps) > 0 and steps[0] > 0 and np.all(steps == steps[0]):
+            self._epoch_step = steps[0]
+
+        self._snapshot_version: Optional[int] = None
+        if len(self.series) > 0:
+            self._first_time = self.series.time_at(0)
+            self._last_time = self.series.time_at(-1)
+
+    @property
+    def snapshot_version(self) -> int:
+        """Identifies the points of the function, such that functions of the same points have the same version."""
+        if self._snapshot_version is None:
+            self._snapshot_version = hash((
+                self.series.times.tobytes(), self.series.values.tobytes(), self.extend_by
+            ))
+        return self._snapshot_version
+
+    def unchanged_between(self, previous: TimeSeriesFunction[Any]) -> Optional[Tuple[datetime, datetime]]:
+        """Finds where this function has the same values as a previous function of e.g. an earlier request.
+        The prices of an hour do not change once they are released, so it is everywhere the functions overlap
+        until the previous function's extension of its last point is replaced by the prices of a new day.
+
+        Args:
+            previous (TimeSeriesFunction[Any]): The function to compare with.
+
+        Returns:
+            Optional[Tuple[datetime, datetime]]: The start and end of the unchanged values or None if the first values differ.
+        """
+        # Naive and aware times can not be compared.
+        if not (self.series.tz is None) == (previous.series.tz is None):
+            return None
+
+        start = max(self.series.times[0], previous.series.times[0])
+        end = min(to_epoch(self.max_domain), to_epoch(previous.max_domain))
+        if end <= start:
+            return None
+
+        breakpoints = np.union1d(self.series.times, previous.series.times)
+        breakpoints = breakpoints[(breakpoints >= start) & (breakpoints < end)]
+        values = self.series.values[self.segment_indices(breakpoints)]
+        previous_values = previous.series.values[previous.segment_indices(breakpoints)]
+        changed = np.flatnonzero(values != previous_values)
+        if len(changed) > 0:
+            if changed[0] == 0:
+                return None
+            end = breakpoints[changed[0]]
+        return (from_epoch(start, self.series.tz), from_epoch(end, self.series.tz))
+
+    def validate_ascending(self, name: str) -> None:
+        steps = np.diff(self.series.times)
+        if np.any(steps < 0):
+            raise ValueError(f'The {name} points are not in ascending order')
+        if np.any(steps == 0):
+            raise ValueError(f'The {name} point is exactly on the same time as the current')
+
+    def index_integrals(self) -> None:
+        """Builds the cumulative integral from the first point to every point.
+
+        Must be called once the points have been validated to be in ascending order.
+        """
+        hours = np.diff(self.series.times) / 3600
+        self._integrals: np.ndarray = np.concatenate((np.zeros(1), np.cumsum(self.series.values[:-1] * hours)))
+
+    @property
+    def min_domain(self) -> datetime:
+        return self._first_time
+
+    @property
+    def max_domain(self) -> datetime:
+        return self._last_time
+
+    def discrete_point_index(self, argument: datetime) -> int:
+        epoch = to_epoch(argument)
+        times = self.series.times
+
+        if self._epoch_step is not None:
+            index = int((epoch - times[0]) // self._epoch_step)
+            if index < 0: return -1
+            return min(index, len(times) - 1)
+
+        return int(np.searchsorted(times, epoch, side="right")) - 1
+
+    def segment_index(self, argument: datetime) -> int:
+        # Arguments after the last point are in its extension.
+        return max(self.discrete_point_index(argument), 0)
+
+    def integrate(self, start: datetime, end: datetime) -> float:
+        if not self.is_valid_argument(start) or not self.is_valid_argument(end):
+            raise ValueError("The argument is outside the domain boundaries")
+
+        start_index = self.segment_index(start)
+        end_index = self.segment_index(end)
+        values = self.series.values
+        start_value = float(values[start_index])
+
+        # Both are inside the same point so there is nothing to look up.
+        if start_index >= end_index:
+            return start_value * (end - start).total_seconds() / 3600
+
+        # The partial start and end segments and the whole points in between from the cumulative integrals.
+        times = self.series.times
+        start_hours = (times[start_index + 1] - to_epoch(start)) / 3600
+        end_hours = (to_epoch(end) - times[end_index]) / 3600
+        middle = self._integrals[end_index] - self._integrals[start_index + 1]
+        return float(start_value * start_hours + middle + values[end_index] * end_hours)
+
+    def to_epochs(self, times: Sequence[datetime]) -> np.ndarray:
+        return np.fromiter((to_epoch(time) for time in times), dtype=np.float64, count=len(times))
+
+    def segment_indices(self, epochs: np.ndarray) -> np.ndarray:
+        times = self.series.times
+        return np.clip(np.searchsorted(times, epochs, side="right") - 1, 0, len(times) - 1)
+
+    def antiderivative_many(self, epochs: np.ndarray, indices: Optional[np.ndarray] = None) -> np.ndarray:
+        """Calculates the integral from the first point to each of the epoch seconds.
+
+        Args:
+            epochs (np.ndarray): Epoch seconds of any shape.
+            indices (Optional[np.ndarray]): The segment indices of the epochs if they are already known.
+
+        Returns:
+            np.ndarray: The integrals with the same shape as the epochs.
+        """
+        if indices is None: indices = self.segment_indices(epochs)
+        times = self.series.times
+        return self._integrals[indices] + self.series.values[indices] * (epochs - times[indices]) / 3600
+
+    def integrate_many(self, starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+        """Calculates "integrate" for many start and end times at once, as the difference of the cumulative integrals.
+
+        Args:
+            starts (np.ndarray): The start times in epoch seconds.
+            ends (np.ndarray): The end times in epoch seconds.
+
+        Returns:
+            np.ndarray: The integral from each start time to its end time.
+        """
+        if len(starts) > 0 and (
+            min(starts.min(), ends.min()) < to_epoch(self.min_domain) or max(starts.max(), ends.max()) > to_epoch(self.max_domain)
+        ):
+            raise ValueError("The argument is outside the domain boundaries")
+
+        start_indices = self.segment_indices(starts)
+        end_indices = self.segment_indices(ends)
+        integrals = self.antiderivative_many(ends, end_indices) - self.antiderivative_many(starts, start_indices)
+
+        # Both are inside the same point, so they are calculated directly to not lose precision to the cumulative integrals.
+        direct = self.series.values[start_indices] * (ends - starts) / 3600
+        return np.where(start_indices == end_indices, direct, integrals)
+
+    def integrate_profile_many(self, starts: np.ndarray, offsets: np.ndarray, weights: np.ndarray) -> np.ndarray:
+        """Integrates a step profile, which is weighted by this function, for many start times at once.
+
+        Args:
+            starts (np.ndarray): The start times in epoch seconds.
+            offsets (np.ndarray): The profile breakpoints in seconds relative to the start, the last being the end.
+            weights (np.ndarray): The weight (e.g. power) between each pair of succeeding offsets.
+
+        Returns:
+            np.ndarray: The integral for each start time.
+        """
+        breakpoints = starts[:, np.newaxis] + offsets[np.newaxis, :]
+        if len(starts) > 0 and (
+            breakpoints.min() < to_epoch(self.min_domain) or breakpoints.max() > to_epoch(self.max_domain)
+        ):
+            raise ValueError("The argument is outside the domain boundaries")
+
+        indices = self.segment_indices(breakpoints)
+        integrals = np.diff(self.antiderivative_many(breakpoints, indices), axis=1)
+
+        # Pieces within a single point are calculated directly to not lose precision to the cumulative integrals.
+        same_point = indices[:, 1:] == indices[:, :-1]
+        direct = self.series.values[indices[:, :-1]] * np.diff(breakpoints, axis=1) / 3600
+        integrals = np.where(same_point, direct, integrals)
+
+        return (integrals * weights[np.newaxis, :]).sum(axis=1)
@@ -1,5 +1,6 @@
 from typing import Generic, List, Optional, Tuple, TypeVar
 from infrastructure.discrete_function import *
+from infrastructure.discrete_timeline import DiscreteTimelineCache
 
 TDomain1 = TypeVar("TDomain1")
 TCodomain1 = TypeVar("TCodomain1")
@@ -22,10 +23,11 @@ class ZippedDiscreteFunction(
         function_1: DiscreteFunction[TDomain1, TCodomain1, TIntegral1, TDiscretePoint1],
         function_2: DiscreteFunction[TDomain2, TCodomain2, TIntegral2, TDiscretePoint2],
     ) -> None:
-        # TODO: Should we lazy evaluate the entire set if required?
         super().__init__([])
         self.function_1 = function_1
         self.function_2 = function_2
+        # The merged steps are lazily materialized for each minimum and maximum stepped between.
+        self.timelines = DiscreteTimelineCache(self.find_next_step, self.step_domain)
 
     def domain_order(self, a: Tuple[TDomain1, TDomain2], b: Tuple[TDomain1, TDomain2]) -> int:
         (a1, a2) = a
@@ -82,6 +84,35 @@ class ZippedDiscreteFunction(
         if self.domain_lt(argument, global_min): return None
         if self.domain_gt(argument, global_max): return None
 
+        # Only arguments which have been stepped equally in both domains from the minimum are on the timeline.
+        (step_1, step_2) = self.step_lengths(global_min, argument)
+        if step_1 == step_2:
+            step = self.timelines.next_from(global_min, argument, global_max)
+        else:
+            step = self.find_next_step(global_min, argument, global_max)
+
+        if step is None: return None
+        (_, point) = step
+        return point
+
+    def step_domain(
+            self,
+            step: Tuple[Tuple[TDomain1, TDomain2], Tuple[TDiscretePoint1, TDiscretePoint2]]
+        ) -> Tuple[TDomain1, TDomain2]:
+        (domain, _) = step
+        return domain
+
+    def find_next_step(
+            self, 
+            global_min: Tuple[TDomain1, TDomain2],
+            argument: Tuple[TDomain1, TDomain2],
+            global_max: Tuple[TDomain1, TDomain2]
+        ) -> Optional[Tuple[Tuple[TDomain1, TDomain2], Tuple[TDiscretePoint1, TDiscretePoint2]]]:
+        """Finds the domain stepped to and the next discrete point by querying both functions, without the timeline."""
+        # Boundary check.
+        if self.domain_lt(argument, global_min): return None
+        if self.domain_gt(argument, global_max): return None
+
         # Deconstruct parameters.
         (global_min_1, global_min_2) = global_min
         (argument_1, argument_2) = argument
@@ -110,8 +141,11 @@ class ZippedDiscreteFunction(
         )
 
         return (
-            self.function_1.discrete_point_at(new_domain_1),
-            self.function_2.discrete_point_at(new_domain_2),
+            (new_domain_1, new_domain_2),
+            (
+                self.function_1.discrete_point_at(new_domain_1),
+                self.function_2.discrete_point_at(new_domain_2),
+            )
         )
 
     @abstractmethod
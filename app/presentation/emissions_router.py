@@ -16,7 +16,7 @@ async def get_emissions(response: Response) -> GetCarbonEmissionIntensityRespons
         now = datetime.utcnow()
         now = now.replace(tzinfo=timezone.utc)
         request = GetCarbonEmissionIntensityRequest(now)
-        return User().get_emissions(request)
+        return User().get_emissions(request).with_emission_points()
     except Exception as e:
         print(traceback.format_exc())
         response.status_code = 500
@@ -35,7 +35,7 @@ async def schedule_v2(request: ScheduleTasksRequest, response: Response) -> Sche
                 response.status_code = 400
                 return ""
             else:
-                return User().schedule_tasks(request)
+                return scheduler_response
     except Exception as e:
         print(traceback.format_exc())
         response.status_code = 500
@@ -16,7 +16,7 @@ async def get_elspot_prices(response: Response) -> GetSpotPricesResponse | str:
         now = datetime.utcnow()
         now = now.replace(tzinfo=timezone.utc)
         request = GetSpotPricesRequest(now)
-        return User().get_elspot_prices(request)
+        return User().get_elspot_prices(request).with_price_points()
     except Exception as e:
         print(traceback.format_exc())
         response.status_code = 500
@@ -0,0 +1,72 @@
+import asyncio
+import json
+from typing import Any, Dict, List, Tuple
+
+from fastapi import FastAPI
+from starlette.types import Message, Scope
+
+from presentation.schedules_router import schedules_router_v2
+
+
+class TestSchedulesRouter:
+    def post(self, path: str, body: Dict[str, Any]) -> Tuple[int, Any]:
+        """Posts the body to the router through the ASGI interface and returns the status code and the JSON response."""
+        app = FastAPI()
+        app.include_router(schedules_router_v2)
+        messages: List[Message] = []
+
+        async def receive() -> Message:
+            return {"type": "http.request", "body": json.dumps(body).encode(), "more_body": False}
+
+        async def send(message: Message) -> None:
+            messages.append(message)
+
+        scope: Scope = {
+            "type": "http", "http_version": "1.1", "method": "POST", "scheme": "http",
+            "path": path, "raw_path": path.encode(), "root_path": "", "query_string": b"",
+            "headers": [(b"content-type", b"application/json")],
+            "server": ("testserver", 80), "client": ("testclient", 50000),
+        }
+        asyncio.run(app(scope, receive, send))
+
+        status = next(message["status"] for message in messages if message["type"] == "http.response.start")
+        content = b"".join(message.get("body", b"") for message in messages if message["type"] == "http.response.body")
+        return (status, json.loads(content))
+
+    def invalid_fields(self, content: Any) -> List[str]:
+        return [error["loc"][-1] for error in content["detail"]]
+
+    def test_non_positive_search_budget_is_rejected(self):
+        # Act
+        (time_limit_status, time_limit_content) = self.post("/api/v2/schedules", {"tasks": [], "time_limit": 0})
+        (candidates_status, candidates_content) = self.post("/api/v2/schedules", {"tasks": [], "maximum_candidates": -1})
+
+        # Assert
+        assert time_limit_status == 422
+        assert self.invalid_fields(time_limit_content) == ["time_limit"]
+        assert candidates_status == 422
+        assert self.invalid_fields(candidates_content) == ["maximum_candidates"]
+
+    def test_non_positive_beam_width_is_rejected(self):
+        # Act
+        (status, content) = self.post("/api/v2/schedules", {"tasks": [], "solver": "beam_search", "beam_width": 0})
+
+        # Assert
+        assert status == 422
+        assert self.invalid_fields(content) == ["beam_width"]
+
+    def test_non_positive_resolution_is_rejected(self):
+        # Act
+        (status, content) = self.post("/api/v2/schedules", {"tasks": [], "resolution": 0})
+
+        # Assert
+        assert status == 422
+        assert self.invalid_fields(content) == ["resolution"]
+
+    def test_unknown_solver_is_rejected(self):
+        # Act
+        (status, content) = self.post("/api/v2/schedules", {"tasks": [], "solver": "simulated_annealing"})
+
+        # Assert
+        assert status == 422
+        assert self.invalid_fields(content) == ["solver"]